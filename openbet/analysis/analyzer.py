@@ -1,6 +1,7 @@
 """Main analysis orchestrator."""
 
 import asyncio
+import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
@@ -9,7 +10,10 @@ from openbet.analysis.context_builder import ContextBuilder
 from openbet.analysis.models import AnalysisResult
 from openbet.database.repositories import AnalysisRepository, MarketRepository
 from openbet.kalshi.client import KalshiClient
-from openbet.llm.manager import LLMManager
+from openbet.llm import http as llm_http
+from openbet.llm.manager import get_llm_manager
+
+logger = logging.getLogger(__name__)
 
 
 class Analyzer:
@@ -31,7 +35,7 @@ class Analyzer:
             use_gemini: Enable Gemini provider
         """
         self.context_builder = ContextBuilder()
-        self.llm_manager = LLMManager(
+        self.llm_manager = get_llm_manager(
             use_claude=use_claude,
             use_openai=use_openai,
             use_grok=use_grok,
@@ -109,11 +113,79 @@ class Analyzer:
                 latest_analysis["from_cache"] = True
                 return latest_analysis
 
-        # Use asyncio.run to execute the async method
-        result = asyncio.run(self._analyze_market_async(market_id, option))
+        # Run the async method in its own event loop, closing the loop's
+        # provider connections when it is done
+        result = llm_http.run(self._analyze_market_async(market_id, option))
         result["from_cache"] = False
         return result
 
+    def analyze_markets(
+        self,
+        market_ids: List[str],
+        option: Optional[str] = None,
+        force: bool = False,
+        cache_hours: int = 24,
+    ) -> Dict[str, Dict]:
+        """Analyze several markets concurrently and store results.
+
+        Markets without a fresh cached analysis are analyzed together in
+        one event loop, so their provider calls overlap instead of each
+        market waiting for the previous one.
+
+        Args:
+            market_ids: Market tickers to analyze
+            option: Specific option to analyze (optional)
+            force: If True, bypass cache and run fresh analyses
+            cache_hours: Number of hours to cache results (default: 24)
+
+        Returns:
+            Dictionary mapping market ID to its analysis results, or to
+            {"error": message} if its analysis failed
+        """
+        results: Dict[str, Dict] = {}
+        stale = []
+        for market_id in dict.fromkeys(market_ids):
+            if not force:
+                latest_analysis = self.analysis_repo.get_latest_by_market(
+                    market_id, option
+                )
+                if self._is_analysis_fresh(latest_analysis, cache_hours):
+                    latest_analysis["from_cache"] = True
+                    results[market_id] = latest_analysis
+                    continue
+            stale.append(market_id)
+
+        if stale:
+            analyses = llm_http.run(self._analyze_markets_async(stale, option))
+            for market_id, result in zip(stale, analyses):
+                if isinstance(result, Exception):
+                    logger.error(
+                        "Error analyzing market %s: %s", market_id, result, exc_info=result
+                    )
+                    results[market_id] = {"error": str(result)}
+                else:
+                    result["from_cache"] = False
+                    results[market_id] = result
+
+        return results
+
+    async def _analyze_markets_async(
+        self, market_ids: List[str], option: Optional[str] = None
+    ) -> List:
+        """Run the analyses of several markets concurrently.
+
+        Args:
+            market_ids: Market tickers to analyze
+            option: Specific option to analyze
+
+        Returns:
+            Analysis result or raised exception for each market, in order
+        """
+        return await asyncio.gather(
+            *(self._analyze_market_async(market_id, option) for market_id in market_ids),
+            return_exceptions=True,
+        )
+
     async def _analyze_market_async(
         self, market_id: str, option: Optional[str] = None
     ) -> Dict:
@@ -156,7 +228,7 @@ class Analyzer:
         context = self.context_builder.build_context(market_id, option)
 
         # Get current prices and market data
-        orderbook = self.kalshi_client.get_orderbook(market_id)
+        yes_price, no_price = self.kalshi_client.get_top_of_book(market_id)
         kalshi_market = self.kalshi_client.get_market(market_id)
 
         # Get previous analysis ID for historical chain
@@ -192,53 +264,56 @@ class Analyzer:
                 }
             }
 
-        analysis_id = self.analysis_repo.create(
-            market_id=market_id,
-            option=option_key,
-            claude_response=(
-                consensus.provider_responses.get("claude")
-                if "claude" in consensus.provider_responses
-                else None
-            ),
-            openai_response=(
-                consensus.provider_responses.get("openai")
-                if "openai" in consensus.provider_responses
-                else None
-            ),
-            grok_response=(
-                consensus.provider_responses.get("grok")
-                if "grok" in consensus.provider_responses
-                else None
-            ),
-            gemini_response=(
-                consensus.provider_responses.get("gemini")
-                if "gemini" in consensus.provider_responses
-                else None
-            ),
-            yes_price=orderbook.yes_mid_price,
-            no_price=orderbook.no_mid_price,
-            volume_24h=float(kalshi_market.volume_24h or 0),
-            liquidity_depth=(
-                float(kalshi_market.liquidity) if kalshi_market.liquidity else None
-            ),
-            consensus_yes_confidence=consensus.yes_confidence,
-            consensus_no_confidence=consensus.no_confidence,
-            consensus_method=consensus.method,
-            previous_analysis_id=previous_analysis_id,
-            metadata=metadata,
+        created = self.analysis_repo.insert(
+            {
+                "market_id": market_id,
+                "option": option_key,
+                "claude_response": (
+                    consensus.provider_responses.get("claude")
+                    if "claude" in consensus.provider_responses
+                    else None
+                ),
+                "openai_response": (
+                    consensus.provider_responses.get("openai")
+                    if "openai" in consensus.provider_responses
+                    else None
+                ),
+                "grok_response": (
+                    consensus.provider_responses.get("grok")
+                    if "grok" in consensus.provider_responses
+                    else None
+                ),
+                "gemini_response": (
+                    consensus.provider_responses.get("gemini")
+                    if "gemini" in consensus.provider_responses
+                    else None
+                ),
+                "yes_price": yes_price,
+                "no_price": no_price,
+                "volume_24h": float(kalshi_market.volume_24h or 0),
+                "liquidity_depth": (
+                    float(kalshi_market.liquidity) if kalshi_market.liquidity else None
+                ),
+                "consensus_yes_confidence": consensus.yes_confidence,
+                "consensus_no_confidence": consensus.no_confidence,
+                "consensus_method": consensus.method,
+                "previous_analysis_id": previous_analysis_id,
+                "metadata": metadata,
+            }
         )
 
         # Return analysis result
         result = {
-            "analysis_id": analysis_id,
+            "analysis_id": created["id"],
+            "analysis_timestamp": created["analysis_timestamp"],
             "market_id": market_id,
             "option": option_key,
             "claude_response": consensus.provider_responses.get("claude"),
             "openai_response": consensus.provider_responses.get("openai"),
             "grok_response": consensus.provider_responses.get("grok"),
             "gemini_response": consensus.provider_responses.get("gemini"),
-            "yes_price": orderbook.yes_mid_price,
-            "no_price": orderbook.no_mid_price,
+            "yes_price": yes_price,
+            "no_price": no_price,
             "volume_24h": kalshi_market.volume_24h,
             "liquidity_depth": kalshi_market.liquidity,
             "consensus_yes_confidence": consensus.yes_confidence,
@@ -268,8 +343,8 @@ class Analyzer:
             try:
                 result = self.analyze_market(market["id"])
                 results.append(result)
-            except Exception as e:
-                print(f"Error analyzing market {market['id']}: {e}")
+            except Exception:
+                logger.exception("Error analyzing market %s", market["id"])
                 continue
 
         return results
@@ -43,11 +43,11 @@ class ContextBuilder:
 
         # Get current market data from Kalshi
         kalshi_market = self.kalshi_client.get_market(market_id)
-        orderbook = self.kalshi_client.get_orderbook(market_id)
+        yes_price, no_price = self.kalshi_client.get_top_of_book(market_id)
 
         # Get position information
         option_key = option or market_id
-        positions = self.position_repo.get_by_market(market_id)
+        positions = self.position_repo.get_by_market_rows(market_id)
 
         has_position = len(positions) > 0
         position_data = {}
@@ -59,7 +59,7 @@ class ContextBuilder:
                 "position_side": pos["side"],
                 "position_quantity": pos["quantity"],
                 "position_avg_price": pos["avg_price"],
-                "position_pnl": pos.get("unrealized_pnl"),
+                "position_pnl": pos["unrealized_pnl"],
             }
 
         # Get historical analysis
@@ -73,8 +73,8 @@ class ContextBuilder:
             title=market["title"],
             close_time=market.get("close_time"),
             status=market.get("status"),
-            yes_price=orderbook.yes_mid_price,
-            no_price=orderbook.no_mid_price,
+            yes_price=yes_price,
+            no_price=no_price,
             volume_24h=kalshi_market.volume_24h,
             liquidity_depth=float(kalshi_market.liquidity or 0) if kalshi_market.liquidity else None,
             open_interest=kalshi_market.open_interest,
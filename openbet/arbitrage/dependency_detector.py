@@ -12,7 +12,7 @@ from openbet.arbitrage.models import (
     MinimalDependencyContext,
     ScreeningResult,
 )
-from openbet.llm.manager import LLMManager
+from openbet.llm.manager import LLMManager, get_llm_manager
 
 
 class DependencyDetector:
@@ -20,7 +20,7 @@ class DependencyDetector:
 
     def __init__(self, llm_manager: Optional[LLMManager] = None):
         """Initialize detector with LLM manager."""
-        self.llm_manager = llm_manager or LLMManager()
+        self.llm_manager = llm_manager or get_llm_manager()
 
     def _build_dependency_prompt(self, context: DependencyContext) -> str:
         """Build Round 1 prompt for dependency detection."""
@@ -126,7 +126,8 @@ IMPORTANT: Respond in this EXACT JSON format:
                 return None
 
             # Call provider's custom prompt analysis
-            response_text = await provider.analyze_custom_prompt(prompt)
+            async with self.llm_manager.concurrency_limit(provider_name):
+                response_text = await provider.analyze_custom_prompt(prompt)
 
             # Parse JSON response
             data = json.loads(response_text)
@@ -363,7 +364,8 @@ Be concise. Focus on obvious dependencies."""
             if not provider:
                 raise ValueError("Grok provider not available")
 
-            response_text = await provider.analyze_custom_prompt(prompt)
+            async with self.llm_manager.concurrency_limit("grok"):
+                response_text = await provider.analyze_custom_prompt(prompt)
 
             # Parse JSON response
             data = json.loads(response_text)
@@ -404,33 +404,42 @@ def find_markets(event_ticker: str, add_all: bool):
             added_count = 0
             skipped_count = 0
 
+            new_rows = []
+
+            existing_ids = market_repo.existing_ids(m['ticker'] for m in markets)
+
             for market in markets:
-                if market_repo.exists(market['ticker']):
+                if market['ticker'] in existing_ids:
                     skipped_count += 1
                     continue
 
                 try:
                     market_obj = Market(**market)
-                    market_repo.create(
-                        market_id=market_obj.ticker,
-                        title=market_obj.title,
-                        close_time=str(market_obj.close_time) if market_obj.close_time else None,
-                        status=market_obj.status,
-                        category=market_obj.category,
-                        min_tick_size=0.01,
-                        max_tick_size=0.99,
-                        metadata={
+                    new_rows.append({
+                        "market_id": market_obj.ticker,
+                        "title": market_obj.title,
+                        "close_time": str(market_obj.close_time) if market_obj.close_time else None,
+                        "status": market_obj.status,
+                        "category": market_obj.category,
+                        "min_tick_size": 0.01,
+                        "max_tick_size": 0.99,
+                        "metadata": {
                             "subtitle": market_obj.subtitle,
                             "yes_sub_title": market_obj.yes_sub_title,
                             "no_sub_title": market_obj.no_sub_title,
                             "volume": market_obj.volume,
                             "open_interest": market_obj.open_interest,
                         },
-                    )
-                    added_count += 1
+                    })
                 except Exception as e:
                     console.print(f"[yellow]⚠ Failed to add {market['ticker']}: {str(e)}[/yellow]")
 
+            try:
+                added_count = market_repo.create_many(new_rows)
+                skipped_count += len(new_rows) - added_count
+            except Exception as e:
+                console.print(f"[yellow]⚠ Failed to add markets: {str(e)}[/yellow]")
+
             console.print(f"\n[green]✓[/green] Added {added_count} markets, skipped {skipped_count} (already in database)")
 
         console.print(f"\n[green]✓[/green] Search complete")
@@ -797,33 +806,42 @@ def analyze_series(
             added_count = 0
             skipped_count = 0
 
+            new_rows = []
+
+            existing_ids = market_repo.existing_ids(m['ticker'] for m in markets)
+
             for market in markets:
-                if market_repo.exists(market['ticker']):
+                if market['ticker'] in existing_ids:
                     skipped_count += 1
                     continue
 
                 try:
                     market_obj = Market(**market)
-                    market_repo.create(
-                        market_id=market_obj.ticker,
-                        title=market_obj.title,
-                        close_time=str(market_obj.close_time) if market_obj.close_time else None,
-                        status=market_obj.status,
-                        category=market_obj.category,
-                        min_tick_size=0.01,
-                        max_tick_size=0.99,
-                        metadata={
+                    new_rows.append({
+                        "market_id": market_obj.ticker,
+                        "title": market_obj.title,
+                        "close_time": str(market_obj.close_time) if market_obj.close_time else None,
+                        "status": market_obj.status,
+                        "category": market_obj.category,
+                        "min_tick_size": 0.01,
+                        "max_tick_size": 0.99,
+                        "metadata": {
                             "subtitle": market_obj.subtitle,
                             "yes_sub_title": market_obj.yes_sub_title,
                             "no_sub_title": market_obj.no_sub_title,
                             "volume": market_obj.volume,
                             "open_interest": market_obj.open_interest,
                         },
-                    )
-                    added_count += 1
+                    })
                 except Exception as e:
                     console.print(f"[yellow]⚠ Failed to add {market['ticker']}: {str(e)}[/yellow]")
 
+            try:
+                added_count = market_repo.create_many(new_rows)
+                skipped_count += len(new_rows) - added_count
+            except Exception as e:
+                console.print(f"[yellow]⚠ Failed to add markets: {str(e)}[/yellow]")
+
             console.print(f"[green]✓[/green] Added {added_count} markets, skipped {skipped_count} (already in database)")
 
         # Analyze each market one by one
@@ -1054,7 +1072,7 @@ def place_bet(
         # Show latest analysis if requested
         if use_analysis:
             analysis_repo = AnalysisRepository()
-            latest_analysis = analysis_repo.get_latest_by_market(market_id, option)
+            latest_analysis = analysis_repo.get_latest_columns(market_id, option)
 
             if latest_analysis:
                 console.print("\n[bold cyan]Latest Analysis[/bold cyan]")
@@ -1072,12 +1090,8 @@ def place_bet(
 
         # Get current market price
         client = KalshiClient()
-        orderbook = client.get_orderbook(market_id)
-
-        if side.lower() == "yes":
-            market_price = orderbook.best_yes_ask or orderbook.yes_mid_price
-        else:
-            market_price = orderbook.best_no_ask or orderbook.no_mid_price
+        yes_price, no_price = client.get_top_of_book(market_id)
+        market_price = yes_price if side.lower() == "yes" else no_price
 
         bet_price = price if price else market_price
 
@@ -1538,7 +1552,7 @@ def trading_history(limit: int, signal_type: str, decision: str):
 def get_events(save: bool, status: Optional[str], category: Optional[str], series: Optional[str]):
     """Fetch events from Kalshi API and optionally save to database.
 
-    Conservative rate limiting: 0.5s delay between API calls.
+    Conservative rate limiting: 2 API calls/s sustained.
     """
     from openbet.database.repositories import EventRepository
 
@@ -1548,35 +1562,24 @@ def get_events(save: bool, status: Optional[str], category: Optional[str], serie
 
         console.print("[bold]Fetching events from Kalshi...[/bold]")
 
-        all_events = []
-        cursor = None
-        page = 1
-
-        # Paginate through all results using API cursor
-        while True:
-            console.print(f"[dim]Fetching page {page}...[/dim]")
-
-            try:
-                response = client.get_events_with_cursor(
-                    limit=200,
-                    cursor=cursor,
-                    status=status,
-                    series_ticker=series
-                )
-            except ValueError as e:
-                # Handle invalid status parameter
-                console.print(f"[red]Error:[/red] {e}")
-                console.print("[yellow]Valid status values:[/yellow] unopened, open, closed, settled")
-                sys.exit(1)
-
-            all_events.extend(response.events)
-
-            # Check if there are more pages
-            if not response.has_more_pages:
-                break
+        try:
+            pages = client.iter_event_pages(
+                limit=200,
+                status=status,
+                series_ticker=series
+            )
+        except ValueError as e:
+            # Handle invalid status parameter
+            console.print(f"[red]Error:[/red] {e}")
+            console.print("[yellow]Valid status values:[/yellow] unopened, open, closed, settled")
+            sys.exit(1)
 
-            cursor = response.cursor
-            page += 1
+        # Paginate through all results; the next page is fetched while this
+        # one is processed
+        all_events = []
+        for page, events in enumerate(pages, 1):
+            console.print(f"[dim]Fetched page {page}...[/dim]")
+            all_events.extend(events)
 
         # Filter by category if specified (client-side filtering)
         if category:
@@ -1607,23 +1610,9 @@ def get_events(save: bool, status: Optional[str], category: Optional[str], serie
         # Save to database if requested
         if save:
             console.print("\n[bold]Saving to database...[/bold]")
-            saved_count = 0
-
-            for event in all_events:
-                event_repo.create_or_update(
-                    event_ticker=event.event_ticker,
-                    title=event.title,
-                    category=event.category,
-                    series_ticker=event.series_ticker,
-                    sub_title=event.sub_title,
-                    mutually_exclusive=event.mutually_exclusive,
-                    status=event.status,
-                    strike_date=event.strike_date,
-                    metadata=json.dumps(event.model_dump(mode='json'))
-                )
-                saved_count += 1
+            event_repo.create_or_update_events(all_events)
 
-            console.print(f"[green]✓[/green] Saved {saved_count} events to database")
+            console.print(f"[green]✓[/green] Saved {len(all_events)} events to database")
 
     except KalshiError as e:
         console.print(f"[red]Error:[/red] {e}")
@@ -1640,10 +1629,10 @@ def detect_dependencies(all_pairs: bool, category: Optional[str], limit: int):
     Conservative mode: Analyzes pairs within same category by default.
     Use --all-pairs to analyze across categories (much slower).
     """
-    import asyncio
     from collections import defaultdict
 
     from openbet.arbitrage.dependency_detector import DependencyDetector
+    from openbet.llm import http as llm_http
     from openbet.database.repositories import EventDependencyRepository, EventRepository
 
     try:
@@ -1706,7 +1695,7 @@ def detect_dependencies(all_pairs: bool, category: Optional[str], limit: int):
 
                 # Analyze with AI consensus
                 try:
-                    result = asyncio.run(detector.analyze_dependency(event_a, event_b))
+                    result = llm_http.run(detector.analyze_dependency(event_a, event_b))
 
                     # Save to database
                     dep_repo.create(
@@ -1775,6 +1764,7 @@ def screen_dependencies(
 
     from openbet.arbitrage.dependency_detector import DependencyDetector
     from openbet.database.repositories import EventDependencyRepository, EventRepository
+    from openbet.llm import http as llm_http
 
     try:
         detector = DependencyDetector()
@@ -1849,39 +1839,40 @@ def screen_dependencies(
             # Process in batches
             for i in range(0, len(pairs), parallel):
                 batch = pairs[i : i + parallel]
-                batch_results = asyncio.run(screen_batch(batch))
+                batch_results = llm_http.run(screen_batch(batch))
 
                 # Save results above threshold
-                for (event_a, event_b), result in zip(batch, batch_results):
-                    if isinstance(result, Exception):
-                        error_count += 1
-                        continue
-
-                    results.append(
-                        {
-                            "event_a": event_a["event_ticker"],
-                            "event_b": event_b["event_ticker"],
-                            "score": result.dependency_score,
-                            "dependent": result.is_dependent,
-                        }
-                    )
-
-                    # Save to database if above threshold
-                    if result.dependency_score >= threshold:
-                        dep_repo.create(
-                            event_a_ticker=event_a["event_ticker"],
-                            event_b_ticker=event_b["event_ticker"],
-                            dependency_type=result.dependency_type,
-                            dependency_score=result.dependency_score,
-                            constraints={},
-                            llm_responses={"grok": result.model_dump()},
-                            consensus_method="fast_screening",
-                            round_1_responses={"grok": result.model_dump()},
-                            round_2_responses={},
-                            convergence_metrics={},
-                            analysis_mode="fast_screening",
+                with dep_repo.transaction():
+                    for (event_a, event_b), result in zip(batch, batch_results):
+                        if isinstance(result, Exception):
+                            error_count += 1
+                            continue
+
+                        results.append(
+                            {
+                                "event_a": event_a["event_ticker"],
+                                "event_b": event_b["event_ticker"],
+                                "score": result.dependency_score,
+                                "dependent": result.is_dependent,
+                            }
                         )
-                        saved_count += 1
+
+                        # Save to database if above threshold
+                        if result.dependency_score >= threshold:
+                            dep_repo.create(
+                                event_a_ticker=event_a["event_ticker"],
+                                event_b_ticker=event_b["event_ticker"],
+                                dependency_type=result.dependency_type,
+                                dependency_score=result.dependency_score,
+                                constraints={},
+                                llm_responses={"grok": result.model_dump()},
+                                consensus_method="fast_screening",
+                                round_1_responses={"grok": result.model_dump()},
+                                round_2_responses={},
+                                convergence_metrics={},
+                                analysis_mode="fast_screening",
+                            )
+                            saved_count += 1
 
                 progress.advance(task, len(batch))
 
@@ -2003,14 +1994,14 @@ def verify_dependency(dependency_id: int, approve: bool, reject: bool, notes: Op
         console.print(f"[yellow]Type:[/yellow] {dep['dependency_type']}")
 
         # Show constraints
-        constraints_data = json.loads(dep["constraints_json"])
+        constraints_data = dep["constraints_json"]
         console.print(f"\n[bold]Detected Constraints:[/bold]")
         for i, c in enumerate(constraints_data.get("constraints", []), 1):
             console.print(f"  {i}. [{c['constraint_type']}] {c['description']} (confidence: {c['confidence']:.2f})")
 
         # Show LLM responses
         console.print(f"\n[bold]Provider Consensus:[/bold]")
-        llm_responses = json.loads(dep["llm_responses_json"])
+        llm_responses = dep["llm_responses_json"]
         for provider, response in llm_responses.items():
             console.print(f"  • {provider}: {response['dependency_type']} (score: {response['dependency_score']:.2f})")
 
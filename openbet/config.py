@@ -13,6 +13,8 @@ class Settings(BaseSettings):
     kalshi_api_key: str
     kalshi_api_secret: str
     kalshi_base_url: str = "https://api.kalshi.com/v2"
+    # Seconds get_market/get_event results are reused (0 disables)
+    kalshi_cache_ttl: float = 1.0
 
     # LLM Provider API Keys
     anthropic_api_key: str
@@ -27,6 +29,13 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
     log_file: str = "openbet.log"
 
+    # Connection pool size shared by the LLM provider clients; the default
+    # suits high rate tiers, lower it to match smaller provider quotas
+    llm_http_max_connections: int = 2000
+    # Seconds a provider's analysis is reused for an identical prompt
+    # (0 disables)
+    llm_response_cache_ttl: float = 300.0
+
     # LLM Model Configuration
     default_llm_model_claude: str = "claude-3-5-sonnet-20241022"
     default_llm_model_openai: str = "gpt-4-turbo-preview"
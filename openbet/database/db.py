@@ -1,11 +1,61 @@
 """Database connection and initialization for Openbet."""
 
+import logging
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Optional, Sequence
 
 from openbet.config import get_settings
-from openbet.database.models import ALL_TABLES
+from openbet.database.models import ALL_TABLES, OBSOLETE_INDEXES
+from openbet.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Repositories keep every statement as a module constant, so a cache larger
+# than the number of distinct statements keeps them all prepared.
+STATEMENT_CACHE_SIZE = 256
+
+# Short-lived cache for read-mostly lookups repeated within one signal
+# generation cycle. Repositories invalidate entries they write (see
+# Database.invalidate).
+QUERY_CACHE_SIZE = 512
+QUERY_CACHE_TTL = 5.0
+
+# Rows pulled from SQLite per round trip when streaming results.
+FETCH_BATCH_SIZE = 256
+
+# Seconds a connection waits on a locked database (SQLite's busy_timeout)
+# before raising "database is locked", so concurrent batch writers queue up.
+BUSY_TIMEOUT = 5.0
+
+# Applied to the writer after switching it to WAL (see _apply_pragmas). WAL
+# lets readers run alongside the writer, and synchronous=NORMAL is durable
+# across crashes in WAL mode while skipping the fsync on every commit.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-65536",  # 64 MiB page cache
+    "PRAGMA mmap_size=268435456",  # 256 MiB memory-mapped I/O
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA wal_autocheckpoint=1000",
+)
+
+# Reader connections are opened read-only and only need the cache settings.
+READER_PRAGMAS = (
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Maximum number of read-only connections kept for SELECT statements.
+READER_POOL_SIZE = 4
+
+
+def _column_names(cursor: sqlite3.Cursor) -> tuple:
+    """Return the result column names of an executed statement."""
+    return tuple(column[0] for column in cursor.description)
 
 
 class Database:
@@ -24,38 +74,371 @@ class Database:
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
 
         self._conn: Optional[sqlite3.Connection] = None
+        # Serializes use of the single writer connection across threads.
+        # Reentrant so that repository writes can nest inside transaction().
+        self._write_lock = threading.RLock()
+        self._txn_owner: Optional[int] = None
+        self.query_cache = TTLCache(maxsize=QUERY_CACHE_SIZE, ttl=QUERY_CACHE_TTL)
+        # Cache invalidations of the open transaction, replayed once it ends
+        self._pending_invalidations: List[Callable[[Hashable], bool]] = []
+
+        self._readers: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._reader_count = 0
+        self._reader_lock = threading.Lock()
 
     @property
     def conn(self) -> sqlite3.Connection:
-        """Get database connection, creating it if needed."""
+        """Get the writer connection, creating it if needed.
+
+        The connection may be used from any thread, but only while holding
+        writer() or transaction().
+        """
         if self._conn is None:
-            self._conn = sqlite3.connect(self.db_path)
-            self._conn.row_factory = sqlite3.Row  # Enable column access by name
+            with self._write_lock:
+                if self._conn is None:
+                    # Autocommit mode: writes outside transaction() commit on
+                    # their own, and transaction() owns BEGIN/COMMIT for
+                    # grouped writes.
+                    conn = sqlite3.connect(
+                        self.db_path,
+                        cached_statements=STATEMENT_CACHE_SIZE,
+                        isolation_level=None,
+                        check_same_thread=False,
+                        timeout=BUSY_TIMEOUT,
+                    )
+                    conn.row_factory = sqlite3.Row  # Enable column access by name
+                    self._apply_pragmas(conn)
+                    self._conn = conn
         return self._conn
 
+    def _in_own_transaction(self) -> bool:
+        """Whether the calling thread is inside its transaction()."""
+        return self._txn_owner == threading.get_ident()
+
+    def cache_get(self, key: Hashable, default: Any = None) -> Any:
+        """Look key up in the query cache.
+
+        Inside a transaction() the calling thread reads its own uncommitted
+        writes, which the cache does not reflect, so it always misses.
+        """
+        if self._in_own_transaction():
+            return default
+        return self.query_cache.get(key, default)
+
+    def cache_set(self, key: Hashable, value: Any) -> None:
+        """Store a query result in the query cache.
+
+        Results read inside a transaction() may include writes that are
+        later rolled back, so they are not cached.
+        """
+        if not self._in_own_transaction():
+            self.query_cache.set(key, value)
+
+    def invalidate(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop the query cache entries whose key matches predicate.
+
+        Repositories call this after a write. Inside a transaction() the
+        entries are dropped again once it commits or rolls back, since
+        other threads may cache the old rows until the commit.
+
+        Args:
+            predicate: Called with each cache key; True drops the entry
+        """
+        self.query_cache.pop_matching(predicate)
+        if self._in_own_transaction():
+            self._pending_invalidations.append(predicate)
+
+    def _apply_pragmas(self, conn: sqlite3.Connection) -> None:
+        """Apply performance PRAGMAs to a freshly opened connection.
+
+        journal_mode=WAL does not fail when the mode can't be changed (an
+        in-memory database, or a file system without shared memory); it
+        returns the mode in effect, which is checked here.
+        """
+        mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        if mode.lower() != "wal" and self.db_path != ":memory:":
+            logger.warning(
+                "Could not enable WAL for %s (journal_mode=%s)", self.db_path, mode
+            )
+
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+
+    def _open_reader(self) -> sqlite3.Connection:
+        """Open a read-only connection to the database file."""
+        uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(
+            uri,
+            uri=True,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            check_same_thread=False,
+            timeout=BUSY_TIMEOUT,
+        )
+        conn.row_factory = sqlite3.Row
+        for pragma in READER_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _acquire_reader(self) -> sqlite3.Connection:
+        """Take an idle reader, opening a new one while under the pool size."""
+        try:
+            return self._readers.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._reader_lock:
+            if self._reader_count < READER_POOL_SIZE:
+                self._reader_count += 1
+                open_new = True
+            else:
+                open_new = False
+
+        if not open_new:
+            return self._readers.get()
+
+        try:
+            return self._open_reader()
+        except sqlite3.Error:
+            with self._reader_lock:
+                self._reader_count -= 1
+            raise
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection for SELECT statements.
+
+        Under WAL, readers run concurrently with each other and with the
+        writer. Inside a transaction() on the calling thread the writer
+        connection is yielded instead, so reads observe the uncommitted
+        writes. In-memory databases cannot be shared and always use the
+        writer.
+
+        Yields:
+            A connection suitable for read-only queries
+        """
+        conn = self.conn  # Opens (and creates) the database file if needed
+        if self._txn_owner == threading.get_ident():
+            yield conn
+            return
+        if self.db_path == ":memory:":
+            with self._write_lock:
+                yield conn
+            return
+
+        reader = self._acquire_reader()
+        try:
+            yield reader
+        finally:
+            self._readers.put(reader)
+
+    def fetchone(self, sql: str, params: Sequence[Any] = ()) -> Optional[sqlite3.Row]:
+        """Run a SELECT on a pooled reader and return the first row."""
+        with self.reader() as conn:
+            return conn.execute(sql, params).fetchone()
+
+    def fetchall(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        """Run a SELECT on a pooled reader and return all rows."""
+        with self.reader() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def iterate(
+        self,
+        sql: str,
+        params: Sequence[Any] = (),
+        batch_size: int = FETCH_BATCH_SIZE,
+    ) -> Iterator[sqlite3.Row]:
+        """Run a SELECT on a pooled reader and yield rows in batches.
+
+        Only batch_size rows are held in memory at a time. The reader stays
+        borrowed until the generator is exhausted or closed.
+
+        Args:
+            sql: SELECT statement
+            params: Statement parameters
+            batch_size: Rows fetched per call to fetchmany
+
+        Yields:
+            Result rows in query order
+        """
+        with self.reader() as conn:
+            cursor = conn.execute(sql, params)
+            try:
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    yield from rows
+                    if len(rows) < batch_size:
+                        break
+            finally:
+                cursor.close()
+
+    def fetchone_dict(
+        self,
+        sql: str,
+        params: Sequence[Any] = (),
+        row_type: Callable[[Any], Dict[str, Any]] = dict,
+    ) -> Optional[Dict[str, Any]]:
+        """Run a SELECT on a pooled reader and return the first row as a dict.
+
+        See fetchall_dicts.
+        """
+        with self.reader() as conn:
+            cursor = conn.execute(sql, params)
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            return row_type(zip(_column_names(cursor), row))
+
+    def fetchall_dicts(
+        self,
+        sql: str,
+        params: Sequence[Any] = (),
+        row_type: Callable[[Any], Dict[str, Any]] = dict,
+    ) -> List[Dict[str, Any]]:
+        """Run a SELECT on a pooled reader and return all rows as dicts.
+
+        Column names are read once from the cursor description and zipped
+        with each row, which is about twice as fast as dict(row) on a
+        sqlite3.Row (that looks every column up by name).
+
+        Args:
+            sql: SELECT statement
+            params: Statement parameters
+            row_type: dict or a dict subclass built from (name, value) pairs
+
+        Returns:
+            One row_type instance per result row
+        """
+        with self.reader() as conn:
+            cursor = conn.execute(sql, params)
+            columns = _column_names(cursor)
+            return [row_type(zip(columns, row)) for row in cursor]
+
+    def iterate_dicts(
+        self,
+        sql: str,
+        params: Sequence[Any] = (),
+        row_type: Callable[[Any], Dict[str, Any]] = dict,
+        batch_size: int = FETCH_BATCH_SIZE,
+    ) -> Iterator[Dict[str, Any]]:
+        """Like iterate, but yield rows as dicts (see fetchall_dicts)."""
+        with self.reader() as conn:
+            cursor = conn.execute(sql, params)
+            try:
+                columns = _column_names(cursor)
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    for row in rows:
+                        yield row_type(zip(columns, row))
+                    if len(rows) < batch_size:
+                        break
+            finally:
+                cursor.close()
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Hold the writer connection for one or more statements.
+
+        There is a single read-write connection; this serializes its use
+        across threads. Statements run in autocommit mode unless the caller
+        is inside transaction().
+
+        Yields:
+            The writer connection
+        """
+        with self._write_lock:
+            yield self.conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """Group several writes into a single transaction and commit.
+
+        The writer is held for the whole block, so other threads wait
+        rather than interleave, and SQLite's write lock is taken up front
+        (BEGIN IMMEDIATE). The transaction is rolled back if the block
+        raises. Nested calls join the enclosing transaction, so repository
+        methods can use this internally and still be composed by callers.
+
+        Yields:
+            The underlying connection
+        """
+        with self._write_lock:
+            conn = self.conn
+            if conn.in_transaction:
+                yield conn
+                return
+
+            conn.execute("BEGIN IMMEDIATE")
+            self._txn_owner = threading.get_ident()
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            else:
+                conn.commit()
+            finally:
+                self._txn_owner = None
+                pending, self._pending_invalidations = self._pending_invalidations, []
+                for predicate in pending:
+                    self.query_cache.pop_matching(predicate)
+
     def initialize_schema(self) -> None:
         """Create all tables and indexes if they don't exist."""
-        cursor = self.conn.cursor()
-        for sql in ALL_TABLES:
-            cursor.execute(sql)
-        self.conn.commit()
-
-        # Migration: Add analysis_mode column if it doesn't exist
-        cursor.execute(
-            "SELECT COUNT(*) FROM pragma_table_info('event_dependencies') "
-            "WHERE name='analysis_mode'"
-        )
-        if cursor.fetchone()[0] == 0:
-            cursor.execute(
-                "ALTER TABLE event_dependencies ADD COLUMN analysis_mode TEXT DEFAULT 'full_analysis'"
+        with self.transaction() as conn:
+            for sql in ALL_TABLES:
+                conn.execute(sql)
+            for index in OBSOLETE_INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {index}")
+
+            # Migration: Add analysis_mode column if it doesn't exist
+            cursor = conn.execute(
+                "SELECT COUNT(*) FROM pragma_table_info('event_dependencies') "
+                "WHERE name='analysis_mode'"
+            )
+            if cursor.fetchone()[0] == 0:
+                conn.execute(
+                    "ALTER TABLE event_dependencies ADD COLUMN analysis_mode TEXT DEFAULT 'full_analysis'"
+                )
+
+            # Migration: Replace analysis_results.consensus_method text with
+            # an id into consensus_methods
+            cursor = conn.execute(
+                "SELECT COUNT(*) FROM pragma_table_info('analysis_results') "
+                "WHERE name='consensus_method_id'"
             )
-            self.conn.commit()
+            if cursor.fetchone()[0] == 0:
+                conn.execute(
+                    "ALTER TABLE analysis_results ADD COLUMN consensus_method_id INTEGER "
+                    "REFERENCES consensus_methods(id)"
+                )
+                conn.execute(
+                    "INSERT OR IGNORE INTO consensus_methods (name) "
+                    "SELECT DISTINCT consensus_method FROM analysis_results "
+                    "WHERE consensus_method IS NOT NULL"
+                )
+                conn.execute(
+                    "UPDATE analysis_results SET consensus_method_id = "
+                    "(SELECT id FROM consensus_methods WHERE name = consensus_method)"
+                )
+                # DROP COLUMN needs SQLite 3.35+; older versions keep the
+                # stale column, which the view's alias shadows.
+                if sqlite3.sqlite_version_info >= (3, 35, 0):
+                    conn.execute("ALTER TABLE analysis_results DROP COLUMN consensus_method")
 
     def close(self) -> None:
         """Close database connection."""
-        if self._conn is not None:
-            self._conn.close()
-            self._conn = None
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._reader_lock:
+            self._reader_count = 0
+
+        with self._write_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
     def __enter__(self):
         """Context manager entry."""
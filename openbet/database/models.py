@@ -35,6 +35,17 @@ CREATE TABLE IF NOT EXISTS positions (
 );
 """
 
+CREATE_CONSENSUS_METHODS_TABLE = """
+CREATE TABLE IF NOT EXISTS consensus_methods (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+"""
+
+CREATE_MARKETS_CREATED_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_markets_created ON markets(created_at DESC);
+"""
+
 CREATE_ANALYSIS_RESULTS_TABLE = """
 CREATE TABLE IF NOT EXISTS analysis_results (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -54,19 +65,24 @@ CREATE TABLE IF NOT EXISTS analysis_results (
 
     consensus_yes_confidence REAL,
     consensus_no_confidence REAL,
-    consensus_method TEXT,
+    consensus_method_id INTEGER,
 
     previous_analysis_id INTEGER,
     metadata TEXT,
 
     FOREIGN KEY (market_id) REFERENCES markets(id),
+    FOREIGN KEY (consensus_method_id) REFERENCES consensus_methods(id),
     FOREIGN KEY (previous_analysis_id) REFERENCES analysis_results(id)
 );
 """
 
-CREATE_ANALYSIS_MARKET_INDEX = """
-CREATE INDEX IF NOT EXISTS idx_analysis_market
-ON analysis_results(market_id);
+# analysis_results stores the consensus method as a small integer id. Reads
+# go through this view, which adds the method name back as consensus_method.
+CREATE_ANALYSIS_RESULTS_VIEW = """
+CREATE VIEW IF NOT EXISTS analysis_results_view AS
+SELECT a.*, m.name AS consensus_method
+FROM analysis_results a
+LEFT JOIN consensus_methods m ON m.id = a.consensus_method_id;
 """
 
 CREATE_ANALYSIS_TIMESTAMP_INDEX = """
@@ -74,6 +90,11 @@ CREATE INDEX IF NOT EXISTS idx_analysis_timestamp
 ON analysis_results(analysis_timestamp);
 """
 
+CREATE_ANALYSIS_MARKET_TIMESTAMP_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_analysis_market_timestamp
+ON analysis_results(market_id, analysis_timestamp DESC);
+"""
+
 CREATE_TRADING_SIGNALS_TABLE = """
 CREATE TABLE IF NOT EXISTS trading_signals (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -137,24 +158,32 @@ CREATE TABLE IF NOT EXISTS trade_decisions (
 );
 """
 
-CREATE_SIGNALS_MARKET_INDEX = """
-CREATE INDEX IF NOT EXISTS idx_signals_market
-ON trading_signals(market_id);
+CREATE_SIGNALS_TIMESTAMP_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_signals_timestamp
+ON trading_signals(signal_timestamp);
 """
 
-CREATE_SIGNALS_TYPE_INDEX = """
-CREATE INDEX IF NOT EXISTS idx_signals_type
-ON trading_signals(signal_type);
+CREATE_SIGNALS_MARKET_TIMESTAMP_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_signals_market_timestamp
+ON trading_signals(market_id, signal_timestamp DESC);
 """
 
-CREATE_SIGNALS_TIMESTAMP_INDEX = """
-CREATE INDEX IF NOT EXISTS idx_signals_timestamp
-ON trading_signals(signal_timestamp);
+# Partial indexes per signal type and decision value. The planner only
+# uses these for queries that spell the same value as a literal, so the
+# repositories keep one fixed statement per value.
+CREATE_SIGNALS_ENTRY_TIMESTAMP_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_signals_entry_timestamp
+ON trading_signals(signal_timestamp DESC) WHERE signal_type = 'entry';
+"""
+
+CREATE_SIGNALS_EXIT_TIMESTAMP_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_signals_exit_timestamp
+ON trading_signals(signal_timestamp DESC) WHERE signal_type = 'exit';
 """
 
 CREATE_DECISIONS_SIGNAL_INDEX = """
-CREATE INDEX IF NOT EXISTS idx_decisions_signal
-ON trade_decisions(signal_id);
+CREATE INDEX IF NOT EXISTS idx_decisions_signal_timestamp
+ON trade_decisions(signal_id, decision_timestamp DESC);
 """
 
 CREATE_DECISIONS_TIMESTAMP_INDEX = """
@@ -162,6 +191,21 @@ CREATE INDEX IF NOT EXISTS idx_decisions_timestamp
 ON trade_decisions(decision_timestamp);
 """
 
+CREATE_DECISIONS_APPROVED_TIMESTAMP_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_decisions_approved_timestamp
+ON trade_decisions(decision_timestamp DESC) WHERE decision = 'approved';
+"""
+
+CREATE_DECISIONS_REJECTED_TIMESTAMP_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_decisions_rejected_timestamp
+ON trade_decisions(decision_timestamp DESC) WHERE decision = 'rejected';
+"""
+
+CREATE_DECISIONS_IGNORED_TIMESTAMP_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_decisions_ignored_timestamp
+ON trade_decisions(decision_timestamp DESC) WHERE decision = 'ignored';
+"""
+
 CREATE_EVENTS_TABLE = """
 CREATE TABLE IF NOT EXISTS events (
     event_ticker TEXT PRIMARY KEY,
@@ -178,12 +222,18 @@ CREATE TABLE IF NOT EXISTS events (
 );
 """
 
+CREATE_EVENTS_CREATED_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_events_created ON events(created_at DESC);
+"""
+
 CREATE_EVENTS_CATEGORY_INDEX = """
-CREATE INDEX IF NOT EXISTS idx_events_category ON events(category);
+CREATE INDEX IF NOT EXISTS idx_events_category_created
+ON events(category, created_at DESC);
 """
 
 CREATE_EVENTS_STATUS_INDEX = """
-CREATE INDEX IF NOT EXISTS idx_events_status ON events(status);
+CREATE INDEX IF NOT EXISTS idx_events_status_created
+ON events(status, created_at DESC);
 """
 
 CREATE_EVENT_DEPENDENCIES_TABLE = """
@@ -219,8 +269,15 @@ CREATE_EVENT_DEPS_B_INDEX = """
 CREATE INDEX IF NOT EXISTS idx_event_deps_b ON event_dependencies(event_b_ticker);
 """
 
+CREATE_EVENT_DEPS_DETECTED_INDEX = """
+CREATE INDEX IF NOT EXISTS idx_event_deps_detected
+ON event_dependencies(detected_at DESC);
+"""
+
 CREATE_EVENT_DEPS_VERIFIED_INDEX = """
-CREATE INDEX IF NOT EXISTS idx_event_deps_verified ON event_dependencies(human_verified);
+CREATE INDEX IF NOT EXISTS idx_event_deps_unverified_score
+ON event_dependencies(dependency_score DESC, detected_at DESC)
+WHERE human_verified = FALSE;
 """
 
 CREATE_ARBITRAGE_OPPORTUNITIES_TABLE = """
@@ -251,34 +308,60 @@ CREATE TABLE IF NOT EXISTS arbitrage_opportunities (
 """
 
 CREATE_ARBITRAGE_STATUS_INDEX = """
-CREATE INDEX IF NOT EXISTS idx_arbitrage_status ON arbitrage_opportunities(status);
+CREATE INDEX IF NOT EXISTS idx_arbitrage_status_profit
+ON arbitrage_opportunities(status, expected_profit DESC, detected_at DESC);
 """
 
 CREATE_ARBITRAGE_PROFIT_INDEX = """
-CREATE INDEX IF NOT EXISTS idx_arbitrage_profit ON arbitrage_opportunities(expected_profit DESC);
+CREATE INDEX IF NOT EXISTS idx_arbitrage_profit_detected
+ON arbitrage_opportunities(expected_profit DESC, detected_at DESC);
 """
 
 ALL_TABLES = [
     CREATE_MARKETS_TABLE,
+    CREATE_MARKETS_CREATED_INDEX,
     CREATE_POSITIONS_TABLE,
+    CREATE_CONSENSUS_METHODS_TABLE,
     CREATE_ANALYSIS_RESULTS_TABLE,
-    CREATE_ANALYSIS_MARKET_INDEX,
+    CREATE_ANALYSIS_RESULTS_VIEW,
     CREATE_ANALYSIS_TIMESTAMP_INDEX,
+    CREATE_ANALYSIS_MARKET_TIMESTAMP_INDEX,
     CREATE_TRADING_SIGNALS_TABLE,
     CREATE_TRADE_DECISIONS_TABLE,
-    CREATE_SIGNALS_MARKET_INDEX,
-    CREATE_SIGNALS_TYPE_INDEX,
     CREATE_SIGNALS_TIMESTAMP_INDEX,
+    CREATE_SIGNALS_MARKET_TIMESTAMP_INDEX,
+    CREATE_SIGNALS_ENTRY_TIMESTAMP_INDEX,
+    CREATE_SIGNALS_EXIT_TIMESTAMP_INDEX,
     CREATE_DECISIONS_SIGNAL_INDEX,
     CREATE_DECISIONS_TIMESTAMP_INDEX,
+    CREATE_DECISIONS_APPROVED_TIMESTAMP_INDEX,
+    CREATE_DECISIONS_REJECTED_TIMESTAMP_INDEX,
+    CREATE_DECISIONS_IGNORED_TIMESTAMP_INDEX,
     CREATE_EVENTS_TABLE,
+    CREATE_EVENTS_CREATED_INDEX,
     CREATE_EVENTS_CATEGORY_INDEX,
     CREATE_EVENTS_STATUS_INDEX,
     CREATE_EVENT_DEPENDENCIES_TABLE,
     CREATE_EVENT_DEPS_A_INDEX,
     CREATE_EVENT_DEPS_B_INDEX,
+    CREATE_EVENT_DEPS_DETECTED_INDEX,
     CREATE_EVENT_DEPS_VERIFIED_INDEX,
     CREATE_ARBITRAGE_OPPORTUNITIES_TABLE,
     CREATE_ARBITRAGE_STATUS_INDEX,
     CREATE_ARBITRAGE_PROFIT_INDEX,
 ]
+
+# Indexes superseded by the ones above, dropped from existing databases.
+OBSOLETE_INDEXES = [
+    "idx_analysis_market",
+    "idx_signals_market",
+    "idx_decisions_signal",
+    "idx_events_category",
+    "idx_events_status",
+    "idx_event_deps_verified",
+    "idx_arbitrage_status",
+    "idx_arbitrage_profit",
+    "idx_signals_type",
+    "idx_signals_type_timestamp",
+    "idx_decisions_decision_timestamp",
+]
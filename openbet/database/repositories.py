@@ -2,18 +2,274 @@
 
 import json
 import sqlite3
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time
+from functools import lru_cache
+from operator import attrgetter
+from typing import (
+    Any,
+    ContextManager,
+    Dict,
+    Final,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from openbet.database.db import get_db
+from openbet.database.rows import LazyAnalysisRow, LazyArbitrageRow, LazyDependencyRow
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
 
-class MarketRepository:
-    """Repository for market operations."""
+# Marks a query cache miss, since None is a valid cached result.
+_MISSING = object()
+
+# LLM response payloads at least this large are stored zlib-compressed.
+JSON_COMPRESS_MIN_BYTES: Final[int] = 1024
+JSON_COMPRESS_LEVEL: Final[int] = 3
+
+# Threads used to compress several large payloads of one row at once.
+JSON_COMPRESS_WORKERS: Final[int] = 4
+
+
+if orjson is not None:
+
+    def _json_dumps_bytes(value: Any) -> bytes:
+        """Serialize value to UTF-8 encoded JSON."""
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
+    def _json_dumps(value: Any) -> str:
+        """Serialize value to JSON text."""
+        return _json_dumps_bytes(value).decode()
+
+else:
+
+    def _json_default(value: Any) -> str:
+        """Encode datetimes as ISO 8601 strings, matching orjson's output."""
+        if isinstance(value, (date, time)):
+            return value.isoformat()
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+    def _json_dumps(value: Any) -> str:
+        """Serialize value to JSON text."""
+        return json.dumps(value, default=_json_default)
+
+    def _json_dumps_bytes(value: Any) -> bytes:
+        """Serialize value to UTF-8 encoded JSON."""
+        return _json_dumps(value).encode()
+
+
+def _to_json_text(value: Any) -> Optional[str]:
+    """Return JSON text for an optional JSON column.
+
+    Values that are already serialized (str, or UTF-8 bytes) are stored
+    as-is rather than being parsed and re-encoded. Empty values map to NULL.
+    """
+    if not value:
+        return None
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bytes):
+        return value.decode()
+    return _json_dumps(value)
+
+
+def _to_json_bytes(value: Any) -> Optional[bytes]:
+    """Return UTF-8 JSON for an optional JSON column, like _to_json_text.
+
+    Payloads headed for compression are needed as bytes; producing them
+    directly avoids a decode/encode round trip through str.
+    """
+    if not value:
+        return None
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode()
+    return _json_dumps_bytes(value)
+
+
+def _compress(data: bytes) -> sqlite3.Binary:
+    """zlib-compress a JSON payload for BLOB storage."""
+    return sqlite3.Binary(zlib.compress(data, JSON_COMPRESS_LEVEL))
+
+
+@lru_cache(maxsize=None)
+def _compress_executor() -> ThreadPoolExecutor:
+    """Shared pool for compressing large JSON payloads."""
+    return ThreadPoolExecutor(
+        max_workers=JSON_COMPRESS_WORKERS, thread_name_prefix="openbet-zlib"
+    )
+
+
+def _to_json_blobs(values: Sequence[Any]) -> List[Optional[Any]]:
+    """Return storage values for the large JSON columns of one row.
+
+    Payloads of at least JSON_COMPRESS_MIN_BYTES are zlib-compressed and
+    stored as a BLOB; smaller ones are stored as JSON text. Readers tell
+    the two apart by type (see LazyJSONRow).
+
+    Serialization holds the GIL and stays on the calling thread, but zlib
+    releases it while compressing, so when several payloads need
+    compressing they are compressed in parallel and the cost is roughly
+    that of the largest one rather than their sum.
+    """
+    result: List[Optional[Any]] = []
+    large = []
+    for i, value in enumerate(values):
+        data = _to_json_bytes(value)
+        if data is None:
+            result.append(None)
+        elif len(data) < JSON_COMPRESS_MIN_BYTES:
+            result.append(data.decode())
+        else:
+            result.append(None)
+            large.append((i, data))
+
+    if len(large) == 1:
+        i, data = large[0]
+        result[i] = _compress(data)
+    elif large:
+        compressed = _compress_executor().map(_compress, [data for _, data in large])
+        for (i, _), blob in zip(large, compressed):
+            result[i] = blob
+    return result
+
+
+def _column_list(columns: Optional[Sequence[str]], allowed: FrozenSet[str]) -> str:
+    """Render a SELECT column list, checking names against a whitelist.
+
+    Args:
+        columns: Column names to select, or None for every column
+        allowed: Column names the table exposes
+
+    Returns:
+        SQL column list ("*" when columns is None)
+
+    Raises:
+        ValueError: If columns is empty or names an unknown column
+    """
+    if columns is None:
+        return "*"
+    unknown = [name for name in columns if name not in allowed]
+    if unknown or not columns:
+        raise ValueError(f"Invalid columns: {unknown or 'none given'}")
+    return ", ".join(columns)
+
+
+class _BaseRepository:
+    """Connection plumbing shared by all repositories."""
+
+    __slots__ = ("db", "_write_cursor")
 
     def __init__(self, db=None):
         """Initialize repository with database connection."""
         self.db = db or get_db()
+        self._write_cursor: Optional[sqlite3.Cursor] = None
+
+    @property
+    def _cursor(self) -> sqlite3.Cursor:
+        """Long-lived cursor on the writer connection.
+
+        Reusing one cursor for single-statement writes avoids allocating a
+        cursor per call; statements themselves are prepared once and kept in
+        the connection's statement cache. The cursor is replaced if the
+        database connection has been reopened. Only use it while holding
+        the writer (see _execute).
+        """
+        conn = self.db.conn
+        cursor = self._write_cursor
+        if cursor is None or cursor.connection is not conn:
+            cursor = self._write_cursor = conn.cursor()
+        return cursor
+
+    def _execute(self, sql: str, params: Sequence[Any] = ()) -> int:
+        """Run a single write statement on the writer.
+
+        Returns:
+            The rowid of the last inserted row
+        """
+        with self.db.writer():
+            return self._cursor.execute(sql, params).lastrowid
+
+    def _execute_returning_one(
+        self, sql: str, params: Sequence[Any] = ()
+    ) -> Optional[sqlite3.Row]:
+        """Run a write statement with a RETURNING clause and fetch its row."""
+        with self.db.writer():
+            return self._cursor.execute(sql, params).fetchone()
+
+    def _execute_returning_all(
+        self, sql: str, params: Sequence[Any] = ()
+    ) -> List[sqlite3.Row]:
+        """Run a write statement with a RETURNING clause and fetch all rows."""
+        with self.db.writer():
+            return self._cursor.execute(sql, params).fetchall()
+
+    def transaction(self) -> ContextManager[sqlite3.Connection]:
+        """Group several repository writes into one transaction.
+
+        Repository methods called inside the block join it instead of
+        committing individually, so a loop of K writes costs one commit:
+
+            with repo.transaction():
+                for row in rows:
+                    repo.create(**row)
+
+        See Database.transaction.
+        """
+        return self.db.transaction()
+
+
+_SQL_INSERT_MARKET: Final[str] = """
+    INSERT INTO markets (
+        id, title, close_time, status, category,
+        min_tick_size, max_tick_size, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Skips markets that are already stored instead of failing the batch.
+_SQL_INSERT_NEW_MARKET: Final[str] = """
+    INSERT OR IGNORE INTO markets (
+        id, title, close_time, status, category,
+        min_tick_size, max_tick_size, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_GET_MARKET: Final[str] = "SELECT * FROM markets WHERE id = ?"
+
+_SQL_GET_ALL_MARKETS: Final[str] = "SELECT * FROM markets ORDER BY created_at DESC"
+
+_SQL_GET_ALL_MARKET_IDS: Final[str] = "SELECT id FROM markets ORDER BY created_at DESC"
+
+_SQL_MARKET_EXISTS: Final[str] = "SELECT 1 FROM markets WHERE id = ? LIMIT 1"
+
+_SQL_EXISTING_MARKET_IDS: Final[str] = """
+    SELECT m.id
+    FROM json_each(?) AS t
+    JOIN markets m ON m.id = t.value
+"""
+
+_SQL_UPDATE_MARKET_STATUS: Final[str] = """
+    UPDATE markets
+    SET status = ?, updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+
+
+class MarketRepository(_BaseRepository):
+    """Repository for market operations."""
+
+    __slots__ = ()
 
     def create(
         self,
@@ -26,35 +282,75 @@ class MarketRepository:
         max_tick_size: Optional[float] = None,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
-        """Create a new market record."""
-        metadata_json = json.dumps(metadata) if metadata else None
-
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO markets (
-                id, title, close_time, status, category,
-                min_tick_size, max_tick_size, metadata
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                market_id,
-                title,
-                close_time,
-                status,
-                category,
-                min_tick_size,
-                max_tick_size,
-                metadata_json,
+        """Create a new market record.
+
+        Raises:
+            sqlite3.IntegrityError: If the market already exists
+        """
+        self._execute(
+            _SQL_INSERT_MARKET,
+            self._to_params(
+                {
+                    "market_id": market_id,
+                    "title": title,
+                    "close_time": close_time,
+                    "status": status,
+                    "category": category,
+                    "min_tick_size": min_tick_size,
+                    "max_tick_size": max_tick_size,
+                    "metadata": metadata,
+                }
             ),
         )
-        self.db.conn.commit()
+        self._invalidate({market_id})
+
+    def create_many(self, rows: List[Dict[str, Any]]) -> int:
+        """Create several market records in one transaction.
+
+        Markets that are already stored (or repeated within rows) are
+        skipped rather than failing the whole batch, since listings can
+        repeat a ticker or gain rows between an existence check and the
+        insert.
+
+        Args:
+            rows: Dicts keyed like the ``create`` arguments
+
+        Returns:
+            Number of markets actually inserted
+        """
+        if not rows:
+            return 0
+
+        params = [self._to_params(row) for row in rows]
+
+        with self.db.transaction():
+            # executemany sums the changes of every row; ignored rows add 0
+            inserted = self._cursor.executemany(_SQL_INSERT_NEW_MARKET, params).rowcount
+
+        self._invalidate({row["market_id"] for row in rows})
+        return inserted
+
+    @staticmethod
+    def _to_params(row: Dict[str, Any]) -> tuple:
+        """Convert a market dict into INSERT parameters."""
+        return (
+            row["market_id"],
+            row["title"],
+            row.get("close_time"),
+            row.get("status"),
+            row.get("category"),
+            row.get("min_tick_size"),
+            row.get("max_tick_size"),
+            _to_json_text(row.get("metadata")),
+        )
 
     def get(self, market_id: str) -> Optional[Dict[str, Any]]:
-        """Get market by ID."""
-        cursor = self.db.conn.cursor()
-        cursor.execute("SELECT * FROM markets WHERE id = ?", (market_id,))
-        row = cursor.fetchone()
+        """Get market by ID, served from the query cache when possible."""
+        key = ("market", market_id)
+        row = self.db.cache_get(key, _MISSING)
+        if row is _MISSING:
+            row = self.db.fetchone(_SQL_GET_MARKET, (market_id,))
+            self.db.cache_set(key, row)
 
         if row is None:
             return None
@@ -63,34 +359,87 @@ class MarketRepository:
 
     def get_all(self) -> List[Dict[str, Any]]:
         """Get all markets."""
-        cursor = self.db.conn.cursor()
-        cursor.execute("SELECT * FROM markets ORDER BY created_at DESC")
-        return [dict(row) for row in cursor.fetchall()]
+        return self.db.fetchall_dicts(_SQL_GET_ALL_MARKETS)
+
+    def get_all_rows(self) -> List[sqlite3.Row]:
+        """Get all markets as sqlite3.Row objects, without copying into dicts."""
+        return self.db.fetchall(_SQL_GET_ALL_MARKETS)
+
+    def iter_all(self) -> Iterator[Dict[str, Any]]:
+        """Stream all markets without materializing the full result."""
+        yield from self.db.iterate_dicts(_SQL_GET_ALL_MARKETS)
+
+    def get_all_ids(self) -> List[str]:
+        """Get the tickers of all markets, newest first, without their rows."""
+        return [row[0] for row in self.db.fetchall(_SQL_GET_ALL_MARKET_IDS)]
 
     def exists(self, market_id: str) -> bool:
         """Check if market exists."""
-        return self.get(market_id) is not None
+        row = self.db.fetchone(_SQL_MARKET_EXISTS, (market_id,))
+        return row is not None
 
-    def update_status(self, market_id: str, status: str) -> None:
-        """Update market status."""
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            UPDATE markets
-            SET status = ?, updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-            """,
-            (status, market_id),
-        )
-        self.db.conn.commit()
+    def existing_ids(self, market_ids: Iterable[str]) -> Set[str]:
+        """Return the subset of market_ids already stored.
 
+        The ids are passed as one JSON array parameter and joined against
+        the primary key, so the statement is the same for any number of ids.
 
-class PositionRepository:
+        Args:
+            market_ids: Market tickers to look up
+
+        Returns:
+            Set of tickers that exist in the markets table
+        """
+        ids = list(market_ids)
+        if not ids:
+            return set()
+
+        rows = self.db.fetchall(_SQL_EXISTING_MARKET_IDS, (_json_dumps(ids),))
+        return {row[0] for row in rows}
+
+    def update_status(self, market_id: str, status: str) -> None:
+        """Update market status."""
+        self._execute(_SQL_UPDATE_MARKET_STATUS, (status, market_id))
+        self._invalidate({market_id})
+
+    def _invalidate(self, market_ids: Set[str]) -> None:
+        """Drop cached lookups of the given markets after a write."""
+        self.db.invalidate(lambda key: key[0] == "market" and key[1] in market_ids)
+
+
+_SQL_UPSERT_POSITION: Final[str] = """
+    INSERT INTO positions (
+        market_id, option, side, quantity, avg_price,
+        current_value, unrealized_pnl, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(market_id, option, side) DO UPDATE SET
+        quantity = excluded.quantity,
+        avg_price = excluded.avg_price,
+        current_value = excluded.current_value,
+        unrealized_pnl = excluded.unrealized_pnl,
+        metadata = excluded.metadata,
+        updated_at = CURRENT_TIMESTAMP
+    RETURNING id, quantity, avg_price, current_value, unrealized_pnl
+"""
+
+_SQL_GET_POSITIONS_BY_MARKET: Final[str] = "SELECT * FROM positions WHERE market_id = ?"
+
+_SQL_GET_OPEN_POSITIONS: Final[str] = """
+    SELECT * FROM positions
+    WHERE quantity != 0
+    ORDER BY market_id
+"""
+
+_SQL_GET_POSITION: Final[str] = """
+    SELECT * FROM positions
+    WHERE market_id = ? AND option = ? AND side = ?
+"""
+
+
+class PositionRepository(_BaseRepository):
     """Repository for position operations."""
 
-    def __init__(self, db=None):
-        """Initialize repository with database connection."""
-        self.db = db or get_db()
+    __slots__ = ()
 
     def create_or_update(
         self,
@@ -102,25 +451,17 @@ class PositionRepository:
         current_value: Optional[float] = None,
         unrealized_pnl: Optional[float] = None,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        """Create or update a position."""
-        metadata_json = json.dumps(metadata) if metadata else None
-
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO positions (
-                market_id, option, side, quantity, avg_price,
-                current_value, unrealized_pnl, metadata
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(market_id, option, side) DO UPDATE SET
-                quantity = excluded.quantity,
-                avg_price = excluded.avg_price,
-                current_value = excluded.current_value,
-                unrealized_pnl = excluded.unrealized_pnl,
-                metadata = excluded.metadata,
-                updated_at = CURRENT_TIMESTAMP
-            """,
+    ) -> Dict[str, Any]:
+        """Create or update a position.
+
+        Returns:
+            Dict with the stored id, quantity, avg_price, current_value and
+            unrealized_pnl, read back from the upsert itself
+        """
+        metadata_json = _to_json_text(metadata)
+
+        row = self._execute_returning_one(
+            _SQL_UPSERT_POSITION,
             (
                 market_id,
                 option,
@@ -132,38 +473,151 @@ class PositionRepository:
                 metadata_json,
             ),
         )
-        self.db.conn.commit()
+        return dict(row)
 
     def get_by_market(self, market_id: str) -> List[Dict[str, Any]]:
         """Get all positions for a market."""
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM positions WHERE market_id = ?", (market_id,)
-        )
-        return [dict(row) for row in cursor.fetchall()]
+        return self.db.fetchall_dicts(_SQL_GET_POSITIONS_BY_MARKET, (market_id,))
+
+    def get_by_market_rows(self, market_id: str) -> List[sqlite3.Row]:
+        """Get all positions for a market as sqlite3.Row objects."""
+        return self.db.fetchall(_SQL_GET_POSITIONS_BY_MARKET, (market_id,))
+
+    def get_open_positions(self) -> List[Dict[str, Any]]:
+        """Get the positions with a non-zero quantity across all markets.
+
+        One query replaces a get_by_market call per market.
+        """
+        return self.db.fetchall_dicts(_SQL_GET_OPEN_POSITIONS)
 
     def get_by_market_and_option(
         self, market_id: str, option: str, side: str
     ) -> Optional[Dict[str, Any]]:
         """Get specific position."""
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM positions
-            WHERE market_id = ? AND option = ? AND side = ?
-            """,
-            (market_id, option, side),
-        )
-        row = cursor.fetchone()
-        return dict(row) if row else None
-
-
-class AnalysisRepository:
+        return self.db.fetchone_dict(_SQL_GET_POSITION, (market_id, option, side))
+
+
+_SQL_INSERT_ANALYSIS: Final[str] = """
+    INSERT INTO analysis_results (
+        market_id, option,
+        claude_response, openai_response, grok_response, gemini_response,
+        yes_price, no_price, volume_24h, liquidity_depth,
+        consensus_yes_confidence, consensus_no_confidence,
+        consensus_method_id, previous_analysis_id, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_ANALYSIS_RETURNING: Final[str] = (
+    _SQL_INSERT_ANALYSIS + "RETURNING id, analysis_timestamp\n"
+)
+
+_SQL_GET_LATEST_ANALYSIS: Final[str] = """
+    SELECT * FROM analysis_results_view
+    WHERE market_id = ? AND (? IS NULL OR option = ?)
+    ORDER BY analysis_timestamp DESC
+    LIMIT 1
+"""
+
+_SQL_GET_LATEST_ANALYSIS_COLUMNS: Final[str] = """
+    SELECT {columns} FROM analysis_results_view
+    WHERE market_id = ? AND (? IS NULL OR option = ?)
+    ORDER BY analysis_timestamp DESC
+    LIMIT 1
+"""
+
+_SQL_GET_ANALYSIS_HISTORY: Final[str] = """
+    SELECT {columns} FROM analysis_results_view
+    WHERE market_id = ?
+    ORDER BY analysis_timestamp DESC
+    LIMIT ?
+"""
+
+# SQLite returns the bare id column from the row holding MAX(), so this
+# picks each market's latest analysis in one pass over the covering
+# (market_id, analysis_timestamp) index, without a window function sort.
+_SQL_GET_ALL_LATEST_ANALYSES: Final[str] = """
+    SELECT v.*
+    FROM (
+        SELECT id, MAX(analysis_timestamp)
+        FROM analysis_results
+        GROUP BY market_id
+    ) AS latest
+    JOIN analysis_results_view v ON v.id = latest.id
+    ORDER BY v.analysis_timestamp DESC
+"""
+
+_SQL_GET_ANALYSES_BY_METHOD: Final[str] = """
+    SELECT * FROM analysis_results_view
+    WHERE consensus_method_id = ?
+    ORDER BY analysis_timestamp DESC
+    LIMIT ?
+"""
+
+_SQL_GET_CONSENSUS_METHODS: Final[str] = "SELECT name, id FROM consensus_methods"
+
+_SQL_INSERT_CONSENSUS_METHOD: Final[str] = """
+    INSERT INTO consensus_methods (name) VALUES (?)
+    ON CONFLICT(name) DO UPDATE SET name = excluded.name
+    RETURNING id
+"""
+
+
+class AnalysisRepository(_BaseRepository):
     """Repository for analysis results operations."""
 
+    __slots__ = ("_consensus_method_ids",)
+
+    ALLOWED_COLUMNS: Final[FrozenSet[str]] = frozenset(
+        {
+            "id", "market_id", "option", "analysis_timestamp",
+            "claude_response", "openai_response", "grok_response", "gemini_response",
+            "yes_price", "no_price", "volume_24h", "liquidity_depth",
+            "consensus_yes_confidence", "consensus_no_confidence",
+            "consensus_method", "consensus_method_id",
+            "previous_analysis_id", "metadata",
+        }
+    )
+
+    # Columns needed to summarize past analyses, without the large JSON blobs.
+    SUMMARY_COLUMNS: Final[tuple] = (
+        "id", "market_id", "option", "analysis_timestamp",
+        "yes_price", "no_price",
+        "consensus_yes_confidence", "consensus_no_confidence",
+    )
+
     def __init__(self, db=None):
         """Initialize repository with database connection."""
-        self.db = db or get_db()
+        super().__init__(db)
+        self._consensus_method_ids: Optional[Dict[str, int]] = None
+
+    def _consensus_method_id(self, name: Optional[str]) -> Optional[int]:
+        """Map a consensus method name to its id, registering new names.
+
+        Ids are loaded from consensus_methods on first use and then served
+        from memory; only a name never seen before costs a write.
+        """
+        if name is None:
+            return None
+        if self._consensus_method_ids is None:
+            self._load_consensus_methods()
+
+        method_id = self._consensus_method_ids.get(name)
+        if method_id is None:
+            with self.db.writer() as conn:
+                in_transaction = conn.in_transaction
+                method_id = self._cursor.execute(
+                    _SQL_INSERT_CONSENSUS_METHOD, (name,)
+                ).fetchone()[0]
+            # Registered inside a caller's transaction, the name may still be
+            # rolled back, so only an already committed id is remembered
+            if not in_transaction:
+                self._consensus_method_ids[name] = method_id
+        return method_id
+
+    def _load_consensus_methods(self) -> Dict[str, int]:
+        """(Re)load the consensus method name to id mapping."""
+        self._consensus_method_ids = dict(self.db.fetchall(_SQL_GET_CONSENSUS_METHODS))
+        return self._consensus_method_ids
 
     def create(
         self,
@@ -184,116 +638,336 @@ class AnalysisRepository:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> int:
         """Create a new analysis result and return its ID."""
-        claude_json = json.dumps(claude_response) if claude_response else None
-        openai_json = json.dumps(openai_response) if openai_response else None
-        grok_json = json.dumps(grok_response) if grok_response else None
-        gemini_json = json.dumps(gemini_response) if gemini_response else None
-        metadata_json = json.dumps(metadata) if metadata else None
-
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO analysis_results (
-                market_id, option,
-                claude_response, openai_response, grok_response, gemini_response,
-                yes_price, no_price, volume_24h, liquidity_depth,
-                consensus_yes_confidence, consensus_no_confidence,
-                consensus_method, previous_analysis_id, metadata
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+        return self.insert(
+            {
+                "market_id": market_id,
+                "option": option,
+                "claude_response": claude_response,
+                "openai_response": openai_response,
+                "grok_response": grok_response,
+                "gemini_response": gemini_response,
+                "yes_price": yes_price,
+                "no_price": no_price,
+                "volume_24h": volume_24h,
+                "liquidity_depth": liquidity_depth,
+                "consensus_yes_confidence": consensus_yes_confidence,
+                "consensus_no_confidence": consensus_no_confidence,
+                "consensus_method": consensus_method,
+                "previous_analysis_id": previous_analysis_id,
+                "metadata": metadata,
+            }
+        )["id"]
+
+    def insert(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Create an analysis result and return its database-assigned fields.
+
+        The generated id and default analysis_timestamp come back from the
+        INSERT itself (RETURNING), so callers that need them don't have to
+        read the row back with a second query.
+
+        Args:
+            row: Dict keyed like the ``create`` arguments
+
+        Returns:
+            Dict with the new row's id and analysis_timestamp
+        """
+        created = self._execute_returning_one(
+            _SQL_INSERT_ANALYSIS_RETURNING, self._to_params(row)
+        )
+        self._invalidate_latest({row["market_id"]})
+        return dict(created)
+
+    def create_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Create several analysis results in one transaction.
+
+        Same as bulk_create, without returning the new IDs.
+
+        Args:
+            rows: Dicts keyed like the ``create`` arguments
+        """
+        self.bulk_create(rows)
+
+    def bulk_create(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """Insert many analysis results at once and return their IDs.
+
+        Intended for backfills: all rows are serialized up front and written
+        with a single executemany under BEGIN IMMEDIATE, which is roughly
+        20x faster than calling ``create`` per row. Holding the write lock
+        for the whole batch keeps the AUTOINCREMENT ids contiguous, so they
+        are derived from last_insert_rowid().
+
+        Args:
+            rows: Dicts keyed like the ``create`` arguments
+
+        Returns:
+            IDs of the inserted rows, in input order
+        """
+        if not rows:
+            return []
+
+        params = [self._to_params(row) for row in rows]
+
+        with self.db.transaction():
+            cursor = self._cursor
+            cursor.executemany(_SQL_INSERT_ANALYSIS, params)
+            last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+
+        self._invalidate_latest({row["market_id"] for row in rows})
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+
+    def _invalidate_latest(self, market_ids: set) -> None:
+        """Drop cached latest-analysis lookups for the given markets."""
+        self.db.invalidate(
+            lambda key: key[0] == "all_latest_analyses"
+            or (key[0] == "latest_analysis" and key[1] in market_ids)
+        )
+
+    def _to_params(self, row: Dict[str, Any]) -> tuple:
+        """Convert an analysis dict into INSERT parameters."""
+        claude_json, openai_json, grok_json, gemini_json = _to_json_blobs(
             (
-                market_id,
-                option,
-                claude_json,
-                openai_json,
-                grok_json,
-                gemini_json,
-                yes_price,
-                no_price,
-                volume_24h,
-                liquidity_depth,
-                consensus_yes_confidence,
-                consensus_no_confidence,
-                consensus_method,
-                previous_analysis_id,
-                metadata_json,
-            ),
+                row.get("claude_response"),
+                row.get("openai_response"),
+                row.get("grok_response"),
+                row.get("gemini_response"),
+            )
+        )
+        metadata = row.get("metadata")
+
+        return (
+            row["market_id"],
+            row["option"],
+            claude_json,
+            openai_json,
+            grok_json,
+            gemini_json,
+            row.get("yes_price"),
+            row.get("no_price"),
+            row.get("volume_24h"),
+            row.get("liquidity_depth"),
+            row.get("consensus_yes_confidence"),
+            row.get("consensus_no_confidence"),
+            self._consensus_method_id(row.get("consensus_method", "iterative_reasoning")),
+            row.get("previous_analysis_id"),
+            _to_json_text(metadata),
         )
-        self.db.conn.commit()
-        return cursor.lastrowid
 
     def get_latest_by_market(
         self, market_id: str, option: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
-        """Get latest analysis for a market/option."""
-        cursor = self.db.conn.cursor()
-
-        if option:
-            cursor.execute(
-                """
-                SELECT * FROM analysis_results
-                WHERE market_id = ? AND option = ?
-                ORDER BY analysis_timestamp DESC
-                LIMIT 1
-                """,
-                (market_id, option),
-            )
-        else:
-            cursor.execute(
-                """
-                SELECT * FROM analysis_results
-                WHERE market_id = ?
-                ORDER BY analysis_timestamp DESC
-                LIMIT 1
-                """,
-                (market_id,),
-            )
+        """Get latest analysis for a market/option.
+
+        Results are served from the query cache for a few seconds and
+        invalidated whenever an analysis for the market is written.
+        """
+        option = option or None
+        key = ("latest_analysis", market_id, option)
+        row = self.db.cache_get(key, _MISSING)
+        if row is not _MISSING:
+            return LazyAnalysisRow(row) if row else None
 
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        row = self.db.fetchone(_SQL_GET_LATEST_ANALYSIS, (market_id, option, option))
+
+        self.db.cache_set(key, row)
+        return LazyAnalysisRow(row) if row else None
+
+    def get_latest_columns(
+        self,
+        market_id: str,
+        option: Optional[str] = None,
+        columns: Sequence[str] = SUMMARY_COLUMNS,
+    ) -> Optional[Dict[str, Any]]:
+        """Get selected columns of the latest analysis for a market/option.
+
+        Args:
+            market_id: Market ticker
+            option: Specific option (optional)
+            columns: Columns to select (default: SUMMARY_COLUMNS)
+
+        Returns:
+            Dict of the requested columns, or None if never analyzed
+        """
+        option = option or None
+        sql = _SQL_GET_LATEST_ANALYSIS_COLUMNS.format(
+            columns=_column_list(columns, self.ALLOWED_COLUMNS)
+        )
+        return self.db.fetchone_dict(sql, (market_id, option, option), LazyAnalysisRow)
+
+    def get_latest_price(
+        self, market_id: str, option: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get the market prices recorded with the latest analysis."""
+        return self.get_latest_columns(
+            market_id, option, ("yes_price", "no_price", "analysis_timestamp")
+        )
 
     def get_history_by_market(
+        self,
+        market_id: str,
+        limit: int = 10,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get analysis history for a market.
+
+        Only SUMMARY_COLUMNS are fetched unless columns says otherwise; use
+        get_history_by_market_full for the LLM responses and metadata.
+
+        Args:
+            market_id: Market ticker
+            limit: Maximum number of analyses to return
+            columns: Columns to select (default: SUMMARY_COLUMNS)
+
+        Returns:
+            Analyses, newest first
+        """
+        sql = self._history_sql(columns or self.SUMMARY_COLUMNS)
+        return self.db.fetchall_dicts(sql, (market_id, limit), LazyAnalysisRow)
+
+    def get_history_by_market_full(
         self, market_id: str, limit: int = 10
     ) -> List[Dict[str, Any]]:
-        """Get analysis history for a market."""
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM analysis_results
-            WHERE market_id = ?
-            ORDER BY analysis_timestamp DESC
-            LIMIT ?
-            """,
-            (market_id, limit),
+        """Get analysis history for a market with every column."""
+        sql = self._history_sql(None)
+        return self.db.fetchall_dicts(sql, (market_id, limit), LazyAnalysisRow)
+
+    def get_history_by_market_rows(
+        self,
+        market_id: str,
+        limit: int = 10,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[sqlite3.Row]:
+        """Get analysis history for a market as sqlite3.Row objects.
+
+        LLM response columns are returned raw: JSON text, or a zlib-compressed
+        BLOB (bytes) for payloads of at least JSON_COMPRESS_MIN_BYTES. Unlike
+        the dict-returning methods, these rows are not decompressed; wrap
+        them in LazyAnalysisRow to get JSON text or decoded values.
+        """
+        return self.db.fetchall(self._history_sql(columns), (market_id, limit))
+
+    def _history_sql(self, columns: Optional[Sequence[str]]) -> str:
+        """Render the analysis-history statement for a column selection."""
+        return _SQL_GET_ANALYSIS_HISTORY.format(
+            columns=_column_list(columns, self.ALLOWED_COLUMNS)
         )
-        return [dict(row) for row in cursor.fetchall()]
+
+    def get_by_method(
+        self, consensus_method: str, limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """Get the most recent analyses produced by a consensus method."""
+        if self._consensus_method_ids is None:
+            self._load_consensus_methods()
+
+        method_id = self._consensus_method_ids.get(consensus_method)
+        if method_id is None:
+            # Another process may have registered it since the last load
+            method_id = self._load_consensus_methods().get(consensus_method)
+            if method_id is None:
+                return []
+
+        return self.db.fetchall_dicts(
+            _SQL_GET_ANALYSES_BY_METHOD, (method_id, limit), LazyAnalysisRow
+        )
+
+    def iter_history_by_market(
+        self,
+        market_id: str,
+        limit: int = -1,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream analysis history for a market, newest first.
+
+        Unlike get_history_by_market, every column is selected unless
+        columns says otherwise, and there is no limit by default.
+        """
+        sql = self._history_sql(columns)
+        yield from self.db.iterate_dicts(sql, (market_id, limit), LazyAnalysisRow)
 
     def get_all_latest_analyses(self) -> List[Dict[str, Any]]:
         """Get latest analysis for each market."""
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            SELECT a1.*
-            FROM analysis_results a1
-            INNER JOIN (
-                SELECT market_id, MAX(analysis_timestamp) as max_timestamp
-                FROM analysis_results
-                GROUP BY market_id
-            ) a2
-            ON a1.market_id = a2.market_id
-            AND a1.analysis_timestamp = a2.max_timestamp
-            ORDER BY a1.analysis_timestamp DESC
-            """
+        return [LazyAnalysisRow(row) for row in self.get_all_latest_analyses_rows()]
+
+    def get_all_latest_analyses_rows(self) -> List[sqlite3.Row]:
+        """Get latest analysis for each market as sqlite3.Row objects.
+
+        JSON columns are returned raw, so large LLM responses come back as
+        compressed bytes (see get_history_by_market_rows). Served from the
+        query cache until an analysis is written.
+        """
+        key = ("all_latest_analyses",)
+        rows = self.db.cache_get(key, _MISSING)
+        if rows is _MISSING:
+            rows = self.db.fetchall(_SQL_GET_ALL_LATEST_ANALYSES)
+            self.db.cache_set(key, rows)
+        return list(rows)
+
+    def iter_all_latest_analyses(self) -> Iterator[Dict[str, Any]]:
+        """Stream the latest analysis for each market."""
+        yield from self.db.iterate_dicts(
+            _SQL_GET_ALL_LATEST_ANALYSES, (), LazyAnalysisRow
         )
-        return [dict(row) for row in cursor.fetchall()]
 
 
-class TradingSignalRepository:
+_SQL_INSERT_SIGNAL: Final[str] = """
+    INSERT INTO trading_signals (
+        market_id, option, signal_type,
+        consensus_yes_prob, consensus_no_prob,
+        market_yes_prob, market_no_prob,
+        divergence_yes, divergence_no, selected_side,
+        divergence_magnitude,
+        recommended_action, recommended_quantity,
+        recommended_price, expected_profit,
+        volume_24h, liquidity_depth, open_interest,
+        analysis_id, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_SIGNAL_RETURNING_ID: Final[str] = _SQL_INSERT_SIGNAL + "RETURNING id\n"
+
+_SQL_GET_SIGNALS_BY_MARKET: Final[str] = """
+    SELECT {columns} FROM trading_signals
+    WHERE market_id = ?
+    ORDER BY signal_timestamp DESC
+    LIMIT ?
+"""
+
+_SQL_GET_RECENT_SIGNALS: Final[str] = """
+    SELECT {columns} FROM trading_signals
+    ORDER BY signal_timestamp DESC
+    LIMIT ?
+"""
+
+SIGNAL_TYPES: Final[tuple] = ("entry", "exit")
+
+# One statement per type with the value inlined, so the planner can use the
+# matching partial index (a bound parameter would not match it).
+_SQL_GET_SIGNALS_BY_TYPE: Final[Dict[str, str]] = {
+    signal_type: f"""
+    SELECT {{columns}} FROM trading_signals
+    WHERE signal_type = '{signal_type}'
+    ORDER BY signal_timestamp DESC
+    LIMIT ?
+"""
+    for signal_type in SIGNAL_TYPES
+}
+
+
+class TradingSignalRepository(_BaseRepository):
     """Repository for trading signal operations."""
 
-    def __init__(self, db=None):
-        """Initialize repository with database connection."""
-        self.db = db or get_db()
+    __slots__ = ()
+
+    ALLOWED_COLUMNS: Final[FrozenSet[str]] = frozenset(
+        {
+            "id", "signal_timestamp", "market_id", "option", "signal_type",
+            "consensus_yes_prob", "consensus_no_prob",
+            "market_yes_prob", "market_no_prob",
+            "divergence_yes", "divergence_no", "selected_side", "divergence_magnitude",
+            "recommended_action", "recommended_quantity", "recommended_price",
+            "expected_profit", "volume_24h", "liquidity_depth", "open_interest",
+            "analysis_id", "metadata",
+        }
+    )
 
     def create(
         self,
@@ -319,101 +993,306 @@ class TradingSignalRepository:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> int:
         """Create a new trading signal and return its ID."""
-        metadata_json = json.dumps(metadata) if metadata else None
-
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO trading_signals (
-                market_id, option, signal_type,
-                consensus_yes_prob, consensus_no_prob,
-                market_yes_prob, market_no_prob,
-                divergence_yes, divergence_no, selected_side,
-                divergence_magnitude,
-                recommended_action, recommended_quantity,
-                recommended_price, expected_profit,
-                volume_24h, liquidity_depth, open_interest,
-                analysis_id, metadata
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                market_id,
-                option,
-                signal_type,
-                consensus_yes_prob,
-                consensus_no_prob,
-                market_yes_prob,
-                market_no_prob,
-                divergence_yes,
-                divergence_no,
-                selected_side,
-                divergence_magnitude,
-                recommended_action,
-                recommended_quantity,
-                recommended_price,
-                expected_profit,
-                volume_24h,
-                liquidity_depth,
-                open_interest,
-                analysis_id,
-                metadata_json,
-            ),
+        return self.insert(
+            {
+                "market_id": market_id,
+                "option": option,
+                "signal_type": signal_type,
+                "consensus_yes_prob": consensus_yes_prob,
+                "consensus_no_prob": consensus_no_prob,
+                "market_yes_prob": market_yes_prob,
+                "market_no_prob": market_no_prob,
+                "divergence_yes": divergence_yes,
+                "divergence_no": divergence_no,
+                "selected_side": selected_side,
+                "divergence_magnitude": divergence_magnitude,
+                "recommended_action": recommended_action,
+                "recommended_quantity": recommended_quantity,
+                "recommended_price": recommended_price,
+                "expected_profit": expected_profit,
+                "volume_24h": volume_24h,
+                "liquidity_depth": liquidity_depth,
+                "open_interest": open_interest,
+                "analysis_id": analysis_id,
+                "metadata": metadata,
+            }
+        )
+
+    def insert(self, row: Dict[str, Any]) -> int:
+        """Create a trading signal from a row dict and return its ID.
+
+        Args:
+            row: Dict keyed like the ``create`` arguments
+
+        Returns:
+            ID of the new signal
+        """
+        created = self._execute_returning_one(
+            _SQL_INSERT_SIGNAL_RETURNING_ID, self._to_params(row)
+        )
+        self._invalidate_recent()
+        return created[0]
+
+    def create_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Create several trading signals in one transaction.
+
+        Same as bulk_create, without returning the new IDs.
+
+        Args:
+            rows: Dicts keyed like the ``create`` arguments
+        """
+        self.bulk_create(rows)
+
+    def bulk_create(self, rows: List[Dict[str, Any]]) -> List[int]:
+        """Insert many trading signals at once and return their IDs.
+
+        All rows are written with a single executemany under one
+        transaction; as in AnalysisRepository.bulk_create, holding the
+        write lock keeps the ids contiguous, so they are derived from
+        last_insert_rowid().
+
+        Args:
+            rows: Dicts keyed like the ``create`` arguments
+
+        Returns:
+            IDs of the inserted rows, in input order
+        """
+        if not rows:
+            return []
+
+        params = [self._to_params(row) for row in rows]
+
+        with self.db.transaction():
+            cursor = self._cursor
+            cursor.executemany(_SQL_INSERT_SIGNAL, params)
+            last_id = cursor.execute("SELECT last_insert_rowid()").fetchone()[0]
+
+        self._invalidate_recent()
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+
+    def _invalidate_recent(self) -> None:
+        """Drop cached recent-signal lookups after a write."""
+        self.db.invalidate(lambda key: key[0] == "recent_signals")
+
+    @staticmethod
+    def _to_params(row: Dict[str, Any]) -> tuple:
+        """Convert a signal dict into INSERT parameters."""
+        metadata = row.get("metadata")
+
+        return (
+            row["market_id"],
+            row["option"],
+            row["signal_type"],
+            row["consensus_yes_prob"],
+            row["consensus_no_prob"],
+            row["market_yes_prob"],
+            row["market_no_prob"],
+            row["divergence_yes"],
+            row["divergence_no"],
+            row.get("selected_side"),
+            row["divergence_magnitude"],
+            row["recommended_action"],
+            row["recommended_quantity"],
+            row["recommended_price"],
+            row["expected_profit"],
+            row.get("volume_24h"),
+            row.get("liquidity_depth"),
+            row.get("open_interest"),
+            row.get("analysis_id"),
+            _to_json_text(metadata),
         )
-        self.db.conn.commit()
-        return cursor.lastrowid
 
     def get_by_market(
-        self, market_id: str, limit: int = 10
+        self,
+        market_id: str,
+        limit: int = 10,
+        columns: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
-        """Get trading signals for a market."""
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM trading_signals
-            WHERE market_id = ?
-            ORDER BY signal_timestamp DESC
-            LIMIT ?
-            """,
-            (market_id, limit),
-        )
-        return [dict(row) for row in cursor.fetchall()]
-
-    def get_recent(self, limit: int = 20) -> List[Dict[str, Any]]:
-        """Get recent trading signals."""
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM trading_signals
-            ORDER BY signal_timestamp DESC
-            LIMIT ?
-            """,
-            (limit,),
+        """Get trading signals for a market, optionally only some columns."""
+        return self.db.fetchall_dicts(self._by_market_sql(columns), (market_id, limit))
+
+    def get_by_market_rows(
+        self,
+        market_id: str,
+        limit: int = 10,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[sqlite3.Row]:
+        """Get trading signals for a market as sqlite3.Row objects."""
+        return self.db.fetchall(self._by_market_sql(columns), (market_id, limit))
+
+    def iter_by_market(
+        self,
+        market_id: str,
+        limit: int = -1,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream trading signals for a market, newest first.
+
+        Args:
+            market_id: Market ticker
+            limit: Maximum number of signals (negative for no limit)
+            columns: Columns to select (default: all)
+
+        Yields:
+            Signal dicts
+        """
+        sql = self._by_market_sql(columns)
+        yield from self.db.iterate_dicts(sql, (market_id, limit))
+
+    def _by_market_sql(self, columns: Optional[Sequence[str]]) -> str:
+        """Render the signals-by-market statement for a column selection."""
+        return _SQL_GET_SIGNALS_BY_MARKET.format(
+            columns=_column_list(columns, self.ALLOWED_COLUMNS)
         )
-        return [dict(row) for row in cursor.fetchall()]
+
+    def get_recent(
+        self, limit: int = 20, columns: Optional[Sequence[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get recent trading signals, served from the query cache when possible."""
+        return [dict(row) for row in self.get_recent_rows(limit, columns)]
+
+    def get_recent_rows(
+        self, limit: int = 20, columns: Optional[Sequence[str]] = None
+    ) -> List[sqlite3.Row]:
+        """Get recent trading signals as sqlite3.Row objects."""
+        column_list = _column_list(columns, self.ALLOWED_COLUMNS)
+        key = ("recent_signals", limit, column_list)
+        rows = self.db.cache_get(key, _MISSING)
+        if rows is _MISSING:
+            sql = _SQL_GET_RECENT_SIGNALS.format(columns=column_list)
+            rows = self.db.fetchall(sql, (limit,))
+            self.db.cache_set(key, rows)
+        return list(rows)
 
     def get_by_type(
-        self, signal_type: str, limit: int = 20
+        self,
+        signal_type: str,
+        limit: int = 20,
+        columns: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
-        """Get signals by type (entry or exit)."""
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM trading_signals
-            WHERE signal_type = ?
-            ORDER BY signal_timestamp DESC
-            LIMIT ?
-            """,
-            (signal_type, limit),
-        )
-        return [dict(row) for row in cursor.fetchall()]
+        """Get signals by type (entry or exit), optionally only some columns.
 
+        Served from the query cache when possible.
 
-class TradeDecisionRepository:
+        Raises:
+            ValueError: If signal_type is not one of SIGNAL_TYPES
+        """
+        signal_type = signal_type.strip().lower()
+        sql = _SQL_GET_SIGNALS_BY_TYPE.get(signal_type)
+        if sql is None:
+            raise ValueError(f"Unknown signal type: {signal_type}")
+
+        column_list = _column_list(columns, self.ALLOWED_COLUMNS)
+        # Shares the "recent_signals" prefix so writes invalidate it too
+        key = ("recent_signals", signal_type, limit, column_list)
+        rows = self.db.cache_get(key, _MISSING)
+        if rows is _MISSING:
+            rows = self.db.fetchall(sql.format(columns=column_list), (limit,))
+            self.db.cache_set(key, rows)
+        return [dict(row) for row in rows]
+
+
+_SQL_INSERT_DECISION: Final[str] = """
+    INSERT INTO trade_decisions (
+        signal_id, decision, user_notes,
+        executed, execution_timestamp, order_id,
+        actual_quantity, actual_price, execution_cost,
+        position_id, realized_pnl, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_GET_DECISION_BY_SIGNAL: Final[str] = """
+    SELECT * FROM trade_decisions
+    WHERE signal_id = ?
+    ORDER BY decision_timestamp DESC
+    LIMIT 1
+"""
+
+DECISIONS: Final[tuple] = ("approved", "rejected", "ignored")
+
+_SQL_GET_DECISIONS: Final[str] = """
+    SELECT {columns} FROM trade_decisions
+    ORDER BY decision_timestamp DESC
+    LIMIT ?
+"""
+
+# As with signal types, the decision value is inlined to match its partial index.
+_SQL_GET_DECISIONS_BY_DECISION: Final[Dict[str, str]] = {
+    decision: f"""
+    SELECT {{columns}} FROM trade_decisions
+    WHERE decision = '{decision}'
+    ORDER BY decision_timestamp DESC
+    LIMIT ?
+"""
+    for decision in DECISIONS
+}
+
+# Counts and P&L over the most recent decisions, aggregated in SQLite so
+# only one row comes back. A trade is an executed decision with a P&L.
+_SQL_GET_DECISION_AGGREGATES: Final[str] = """
+    SELECT
+        COUNT(*) AS total_decisions,
+        COUNT(CASE WHEN decision = 'approved' THEN 1 END) AS approved,
+        COUNT(CASE WHEN executed THEN 1 END) AS executed,
+        COUNT(CASE WHEN executed AND realized_pnl IS NOT NULL THEN 1 END) AS total_trades,
+        COUNT(CASE WHEN executed AND realized_pnl > 0 THEN 1 END) AS wins,
+        COUNT(CASE WHEN executed AND realized_pnl < 0 THEN 1 END) AS losses,
+        COALESCE(SUM(CASE WHEN executed THEN realized_pnl END), 0) AS total_pnl
+    FROM (
+        SELECT decision, executed, realized_pnl FROM trade_decisions
+        ORDER BY decision_timestamp DESC
+        LIMIT ?
+    )
+"""
+
+# Both tables have id and metadata columns, so those are aliased; the
+# signal's id is the decision's signal_id and is not repeated.
+_DECISION_WITH_SIGNAL_COLUMNS: Final[str] = """
+    d.id AS decision_id, d.decision_timestamp, d.signal_id, d.decision,
+    d.user_notes, d.executed, d.execution_timestamp, d.order_id,
+    d.actual_quantity, d.actual_price, d.execution_cost, d.position_id,
+    d.realized_pnl, d.metadata AS decision_metadata,
+    s.signal_timestamp, s.market_id, s.option, s.signal_type,
+    s.consensus_yes_prob, s.consensus_no_prob, s.market_yes_prob, s.market_no_prob,
+    s.divergence_yes, s.divergence_no, s.selected_side, s.divergence_magnitude,
+    s.recommended_action, s.recommended_quantity, s.recommended_price,
+    s.expected_profit, s.volume_24h, s.liquidity_depth, s.open_interest,
+    s.analysis_id, s.metadata AS signal_metadata
+"""
+
+# Keyed by whether a signal type filter is given.
+_SQL_GET_DECISIONS_WITH_SIGNALS: Final[Dict[bool, str]] = {
+    True: f"""
+    SELECT {_DECISION_WITH_SIGNAL_COLUMNS}
+    FROM trade_decisions d
+    JOIN trading_signals s ON d.signal_id = s.id
+    WHERE s.signal_type = ?
+    ORDER BY d.decision_timestamp DESC
+    LIMIT ?
+""",
+    False: f"""
+    SELECT {_DECISION_WITH_SIGNAL_COLUMNS}
+    FROM trade_decisions d
+    JOIN trading_signals s ON d.signal_id = s.id
+    ORDER BY d.decision_timestamp DESC
+    LIMIT ?
+""",
+}
+
+
+class TradeDecisionRepository(_BaseRepository):
     """Repository for trade decision operations."""
 
-    def __init__(self, db=None):
-        """Initialize repository with database connection."""
-        self.db = db or get_db()
+    __slots__ = ()
+
+    ALLOWED_COLUMNS: Final[FrozenSet[str]] = frozenset(
+        {
+            "id", "decision_timestamp", "signal_id", "decision", "user_notes",
+            "executed", "execution_timestamp", "order_id",
+            "actual_quantity", "actual_price", "execution_cost",
+            "position_id", "realized_pnl", "metadata",
+        }
+    )
 
     def create(
         self,
@@ -431,118 +1310,230 @@ class TradeDecisionRepository:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> int:
         """Create a new trade decision and return its ID."""
-        metadata_json = json.dumps(metadata) if metadata else None
-
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO trade_decisions (
-                signal_id, decision, user_notes,
-                executed, execution_timestamp, order_id,
-                actual_quantity, actual_price, execution_cost,
-                position_id, realized_pnl, metadata
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                signal_id,
-                decision,
-                user_notes,
-                executed,
-                execution_timestamp,
-                order_id,
-                actual_quantity,
-                actual_price,
-                execution_cost,
-                position_id,
-                realized_pnl,
-                metadata_json,
+        decision_id = self._execute(
+            _SQL_INSERT_DECISION,
+            self._to_params(
+                {
+                    "signal_id": signal_id,
+                    "decision": decision,
+                    "user_notes": user_notes,
+                    "executed": executed,
+                    "execution_timestamp": execution_timestamp,
+                    "order_id": order_id,
+                    "actual_quantity": actual_quantity,
+                    "actual_price": actual_price,
+                    "execution_cost": execution_cost,
+                    "position_id": position_id,
+                    "realized_pnl": realized_pnl,
+                    "metadata": metadata,
+                }
             ),
         )
-        self.db.conn.commit()
-        return cursor.lastrowid
+        self._invalidate_history()
+        return decision_id
+
+    def create_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Create several trade decisions in one transaction.
+
+        Args:
+            rows: Dicts keyed like the ``create`` arguments
+        """
+        if not rows:
+            return
+
+        params = [self._to_params(row) for row in rows]
+
+        with self.db.transaction():
+            self._cursor.executemany(_SQL_INSERT_DECISION, params)
+
+        self._invalidate_history()
+
+    def _invalidate_history(self) -> None:
+        """Drop cached execution-history lookups after a write."""
+        self.db.invalidate(lambda key: key[0] == "decision_history")
+
+    @staticmethod
+    def _to_params(row: Dict[str, Any]) -> tuple:
+        """Convert a decision dict into INSERT parameters."""
+        metadata = row.get("metadata")
+
+        return (
+            row["signal_id"],
+            row["decision"],
+            row.get("user_notes"),
+            row.get("executed", False),
+            row.get("execution_timestamp"),
+            row.get("order_id"),
+            row.get("actual_quantity"),
+            row.get("actual_price"),
+            row.get("execution_cost"),
+            row.get("position_id"),
+            row.get("realized_pnl"),
+            _to_json_text(metadata),
+        )
 
     def get_by_signal(self, signal_id: int) -> Optional[Dict[str, Any]]:
         """Get decision for a specific signal."""
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM trade_decisions
-            WHERE signal_id = ?
-            ORDER BY decision_timestamp DESC
-            LIMIT 1
-            """,
-            (signal_id,),
-        )
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        return self.db.fetchone_dict(_SQL_GET_DECISION_BY_SIGNAL, (signal_id,))
 
     def get_execution_history(
-        self, limit: int = 20, decision_filter: Optional[str] = None
+        self,
+        limit: int = 20,
+        decision_filter: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
     ) -> List[Dict[str, Any]]:
-        """Get trade execution history."""
-        cursor = self.db.conn.cursor()
+        """Get trade execution history, optionally only some columns.
+
+        Served from the query cache when possible.
+
+        Raises:
+            ValueError: If decision_filter is not one of DECISIONS
+        """
+        return [
+            dict(row)
+            for row in self.get_execution_history_rows(limit, decision_filter, columns)
+        ]
+
+    def get_execution_history_rows(
+        self,
+        limit: int = 20,
+        decision_filter: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> List[sqlite3.Row]:
+        """Get trade execution history as sqlite3.Row objects.
+
+        Raises:
+            ValueError: If decision_filter is not one of DECISIONS
+        """
+        sql = self._execution_history_sql(decision_filter, columns)
+        key = ("decision_history", sql, limit)
+        rows = self.db.cache_get(key, _MISSING)
+        if rows is _MISSING:
+            rows = self.db.fetchall(sql, (limit,))
+            self.db.cache_set(key, rows)
+        return list(rows)
+
+    def get_performance_aggregates(self, limit: int = 1000) -> Dict[str, Any]:
+        """Aggregate the most recent decisions (negative limit for all).
+
+        Returns:
+            Dict with total_decisions, approved, executed, total_trades,
+            wins, losses and total_pnl
+        """
+        return self.db.fetchone_dict(_SQL_GET_DECISION_AGGREGATES, (limit,))
+
+    def iter_execution_history(
+        self,
+        limit: int = -1,
+        decision_filter: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream trade execution history (negative limit for no limit).
+
+        Raises:
+            ValueError: If decision_filter is not one of DECISIONS
+        """
+        sql = self._execution_history_sql(decision_filter, columns)
+        return self.db.iterate_dicts(sql, (limit,))
 
+    def _execution_history_sql(
+        self, decision_filter: Optional[str], columns: Optional[Sequence[str]]
+    ) -> str:
+        """Pick the execution-history statement for a decision filter."""
         if decision_filter:
-            cursor.execute(
-                """
-                SELECT * FROM trade_decisions
-                WHERE decision = ?
-                ORDER BY decision_timestamp DESC
-                LIMIT ?
-                """,
-                (decision_filter, limit),
-            )
+            sql = _SQL_GET_DECISIONS_BY_DECISION.get(decision_filter.strip().lower())
+            if sql is None:
+                raise ValueError(f"Unknown decision: {decision_filter}")
         else:
-            cursor.execute(
-                """
-                SELECT * FROM trade_decisions
-                ORDER BY decision_timestamp DESC
-                LIMIT ?
-                """,
-                (limit,),
-            )
+            sql = _SQL_GET_DECISIONS
 
-        return [dict(row) for row in cursor.fetchall()]
+        return sql.format(columns=_column_list(columns, self.ALLOWED_COLUMNS))
 
     def get_with_signals(
         self, limit: int = 20, signal_type: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Get decisions with their corresponding signals."""
-        cursor = self.db.conn.cursor()
-
-        if signal_type:
-            cursor.execute(
-                """
-                SELECT d.*, s.*
-                FROM trade_decisions d
-                JOIN trading_signals s ON d.signal_id = s.id
-                WHERE s.signal_type = ?
-                ORDER BY d.decision_timestamp DESC
-                LIMIT ?
-                """,
-                (signal_type, limit),
-            )
-        else:
-            cursor.execute(
-                """
-                SELECT d.*, s.*
-                FROM trade_decisions d
-                JOIN trading_signals s ON d.signal_id = s.id
-                ORDER BY d.decision_timestamp DESC
-                LIMIT ?
-                """,
-                (limit,),
-            )
-
-        return [dict(row) for row in cursor.fetchall()]
+        """Get decisions with their corresponding signals.
 
+        The decision's id and metadata come back as decision_id and
+        decision_metadata, the signal's metadata as signal_metadata.
+        """
+        return self.db.fetchall_dicts(*self._with_signals_query(limit, signal_type))
 
-class EventRepository:
+    def get_with_signals_rows(
+        self, limit: int = 20, signal_type: Optional[str] = None
+    ) -> List[sqlite3.Row]:
+        """Get decisions with their signals as sqlite3.Row objects."""
+        return self.db.fetchall(*self._with_signals_query(limit, signal_type))
+
+    def iter_with_signals(
+        self, limit: int = -1, signal_type: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream decisions with their signals (negative limit for no limit)."""
+        yield from self.db.iterate_dicts(*self._with_signals_query(limit, signal_type))
+
+    @staticmethod
+    def _with_signals_query(
+        limit: int, signal_type: Optional[str]
+    ) -> Tuple[str, tuple]:
+        """Pick the decisions-with-signals statement and its parameters."""
+        sql = _SQL_GET_DECISIONS_WITH_SIGNALS[bool(signal_type)]
+        params = (signal_type, limit) if signal_type else (limit,)
+        return sql, params
+
+
+_SQL_UPSERT_EVENT: Final[str] = """
+    INSERT INTO events (
+        event_ticker, title, category, series_ticker, sub_title,
+        mutually_exclusive, status, strike_date, metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(event_ticker) DO UPDATE SET
+        title = excluded.title,
+        category = excluded.category,
+        series_ticker = excluded.series_ticker,
+        sub_title = excluded.sub_title,
+        mutually_exclusive = excluded.mutually_exclusive,
+        status = excluded.status,
+        strike_date = excluded.strike_date,
+        metadata = excluded.metadata,
+        updated_at = CURRENT_TIMESTAMP
+"""
+
+_SQL_GET_EVENT: Final[str] = "SELECT * FROM events WHERE event_ticker = ?"
+
+_SQL_EVENT_EXISTS: Final[str] = "SELECT 1 FROM events WHERE event_ticker = ? LIMIT 1"
+
+# Keyed by (category given, status given).
+_SQL_GET_EVENTS: Final[Dict[Tuple[bool, bool], str]] = {
+    (True, True): """
+    SELECT * FROM events
+    WHERE category = ? AND status = ?
+    ORDER BY created_at DESC
+""",
+    (True, False): """
+    SELECT * FROM events
+    WHERE category = ?
+    ORDER BY created_at DESC
+""",
+    (False, True): """
+    SELECT * FROM events
+    WHERE status = ?
+    ORDER BY created_at DESC
+""",
+    (False, False): "SELECT * FROM events ORDER BY created_at DESC",
+}
+
+
+# Reads the upserted event columns off an event object in one C-level call.
+_EVENT_FIELDS: Final = attrgetter(
+    "event_ticker", "title", "category", "series_ticker", "sub_title",
+    "mutually_exclusive", "status", "strike_date",
+)
+
+
+class EventRepository(_BaseRepository):
     """Repository for event operations."""
 
-    def __init__(self, db=None):
-        """Initialize repository with database connection."""
-        self.db = db or get_db()
+    __slots__ = ()
 
     def create_or_update(
         self,
@@ -557,96 +1548,148 @@ class EventRepository:
         metadata: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Insert or update event using UPSERT pattern."""
-        metadata_json = json.dumps(metadata) if metadata else None
-
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO events (
-                event_ticker, title, category, series_ticker, sub_title,
-                mutually_exclusive, status, strike_date, metadata
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(event_ticker) DO UPDATE SET
-                title = excluded.title,
-                category = excluded.category,
-                series_ticker = excluded.series_ticker,
-                sub_title = excluded.sub_title,
-                mutually_exclusive = excluded.mutually_exclusive,
-                status = excluded.status,
-                strike_date = excluded.strike_date,
-                metadata = excluded.metadata,
-                updated_at = CURRENT_TIMESTAMP
-            """,
-            (
-                event_ticker,
-                title,
-                category,
-                series_ticker,
-                sub_title,
-                mutually_exclusive,
-                status,
-                strike_date,
-                metadata_json,
-            ),
+        self.create_or_update_many(
+            [
+                {
+                    "event_ticker": event_ticker,
+                    "title": title,
+                    "category": category,
+                    "series_ticker": series_ticker,
+                    "sub_title": sub_title,
+                    "mutually_exclusive": mutually_exclusive,
+                    "status": status,
+                    "strike_date": strike_date,
+                    "metadata": metadata,
+                }
+            ]
         )
-        self.db.conn.commit()
+
+    def create_or_update_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert or update several events in one transaction.
+
+        Args:
+            rows: Dicts keyed like the ``create_or_update`` arguments
+        """
+        if not rows:
+            return
+
+        params = [
+            (
+                row["event_ticker"],
+                row["title"],
+                row.get("category"),
+                row.get("series_ticker"),
+                row.get("sub_title"),
+                row.get("mutually_exclusive"),
+                row.get("status"),
+                row.get("strike_date"),
+                _to_json_text(row.get("metadata")),
+            )
+            for row in rows
+        ]
+
+        with self.db.transaction():
+            self._cursor.executemany(_SQL_UPSERT_EVENT, params)
+        self._invalidate_lists()
+
+    def create_or_update_events(self, events: Iterable[Any]) -> None:
+        """Insert or update Kalshi Event models in one transaction.
+
+        Columns are read straight off each model and its JSON dump is stored
+        as metadata, so no intermediate dict is built per event.
+
+        Args:
+            events: openbet.kalshi.models.Event instances
+        """
+        params = [(*_EVENT_FIELDS(event), event.model_dump_json()) for event in events]
+        if not params:
+            return
+
+        with self.db.transaction():
+            self._cursor.executemany(_SQL_UPSERT_EVENT, params)
+        self._invalidate_lists()
+
+    def _invalidate_lists(self) -> None:
+        """Drop cached event listings."""
+        self.db.invalidate(lambda key: key[0] == "events")
 
     def get(self, event_ticker: str) -> Optional[Dict[str, Any]]:
         """Get event by ticker."""
-        cursor = self.db.conn.cursor()
-        cursor.execute("SELECT * FROM events WHERE event_ticker = ?", (event_ticker,))
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        return self.db.fetchone_dict(_SQL_GET_EVENT, (event_ticker,))
 
     def get_all(
         self, category: Optional[str] = None, status: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Get all events with optional filters."""
-        cursor = self.db.conn.cursor()
-
-        if category and status:
-            cursor.execute(
-                """
-                SELECT * FROM events
-                WHERE category = ? AND status = ?
-                ORDER BY created_at DESC
-                """,
-                (category, status),
-            )
-        elif category:
-            cursor.execute(
-                """
-                SELECT * FROM events
-                WHERE category = ?
-                ORDER BY created_at DESC
-                """,
-                (category,),
-            )
-        elif status:
-            cursor.execute(
-                """
-                SELECT * FROM events
-                WHERE status = ?
-                ORDER BY created_at DESC
-                """,
-                (status,),
-            )
-        else:
-            cursor.execute("SELECT * FROM events ORDER BY created_at DESC")
+        return [dict(row) for row in self.get_all_rows(category, status)]
+
+    def get_all_rows(
+        self, category: Optional[str] = None, status: Optional[str] = None
+    ) -> List[sqlite3.Row]:
+        """Get all events with optional filters as sqlite3.Row objects.
 
-        return [dict(row) for row in cursor.fetchall()]
+        Served from the query cache until an event is written.
+        """
+        key = ("events", category or None, status or None)
+        rows = self.db.cache_get(key, _MISSING)
+        if rows is _MISSING:
+            sql = _SQL_GET_EVENTS[(bool(category), bool(status))]
+            params = tuple(value for value in (category, status) if value)
+            rows = self.db.fetchall(sql, params)
+            self.db.cache_set(key, rows)
+        return list(rows)
 
     def exists(self, event_ticker: str) -> bool:
         """Check if event exists."""
-        return self.get(event_ticker) is not None
+        row = self.db.fetchone(_SQL_EVENT_EXISTS, (event_ticker,))
+        return row is not None
+
+
+_SQL_INSERT_DEPENDENCY: Final[str] = """
+    INSERT INTO event_dependencies (
+        event_a_ticker, event_b_ticker, dependency_type, dependency_score,
+        constraints_json, llm_responses_json, consensus_method,
+        round_1_responses, round_2_responses, convergence_metrics, analysis_mode
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_GET_DEPENDENCY: Final[str] = "SELECT * FROM event_dependencies WHERE id = ?"
 
+_SQL_GET_DEPENDENCY_BY_PAIR: Final[str] = """
+    SELECT * FROM event_dependencies
+    WHERE event_a_ticker = ? AND event_b_ticker = ?
+"""
 
-class EventDependencyRepository:
+_SQL_GET_ALL_DEPENDENCIES: Final[str] = "SELECT * FROM event_dependencies ORDER BY detected_at DESC"
+
+_SQL_GET_UNVERIFIED_DEPENDENCIES: Final[str] = """
+    SELECT * FROM event_dependencies
+    WHERE human_verified = FALSE
+    ORDER BY dependency_score DESC, detected_at DESC
+"""
+
+_SQL_MARK_DEPENDENCY_VERIFIED: Final[str] = """
+    UPDATE event_dependencies
+    SET human_verified = ?,
+        verification_notes = ?,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+
+
+_SQL_EXISTING_DEPENDENCY_PAIRS: Final[str] = """
+    SELECT d.event_a_ticker, d.event_b_ticker
+    FROM json_each(?) AS p
+    JOIN event_dependencies d
+        ON d.event_a_ticker = json_extract(p.value, '$[0]')
+        AND d.event_b_ticker = json_extract(p.value, '$[1]')
+"""
+
+
+class EventDependencyRepository(_BaseRepository):
     """Repository for event dependency operations."""
 
-    def __init__(self, db=None):
-        """Initialize repository with database connection."""
-        self.db = db or get_db()
+    __slots__ = ()
 
     def create(
         self,
@@ -663,98 +1706,91 @@ class EventDependencyRepository:
         analysis_mode: str = "full_analysis",
     ) -> int:
         """Create dependency record, returns new ID."""
-        constraints_json = json.dumps(constraints)
-        llm_responses_json = json.dumps(llm_responses)
-        round_1_json = json.dumps(round_1_responses) if round_1_responses else None
-        round_2_json = json.dumps(round_2_responses) if round_2_responses else None
-        convergence_json = json.dumps(convergence_metrics) if convergence_metrics else None
-
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO event_dependencies (
-                event_a_ticker, event_b_ticker, dependency_type, dependency_score,
-                constraints_json, llm_responses_json, consensus_method,
-                round_1_responses, round_2_responses, convergence_metrics, analysis_mode
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                event_a_ticker,
-                event_b_ticker,
-                dependency_type,
-                dependency_score,
-                constraints_json,
-                llm_responses_json,
-                consensus_method,
-                round_1_json,
-                round_2_json,
-                convergence_json,
-                analysis_mode,
+        return self._execute(
+            _SQL_INSERT_DEPENDENCY,
+            self._to_params(
+                {
+                    "event_a_ticker": event_a_ticker,
+                    "event_b_ticker": event_b_ticker,
+                    "dependency_type": dependency_type,
+                    "dependency_score": dependency_score,
+                    "constraints": constraints,
+                    "llm_responses": llm_responses,
+                    "consensus_method": consensus_method,
+                    "round_1_responses": round_1_responses,
+                    "round_2_responses": round_2_responses,
+                    "convergence_metrics": convergence_metrics,
+                    "analysis_mode": analysis_mode,
+                }
             ),
         )
-        self.db.conn.commit()
-        return cursor.lastrowid
+
+    def create_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Create several dependency records in one transaction.
+
+        Args:
+            rows: Dicts keyed like the ``create`` arguments
+        """
+        if not rows:
+            return
+
+        params = [self._to_params(row) for row in rows]
+
+        with self.db.transaction():
+            self._cursor.executemany(_SQL_INSERT_DEPENDENCY, params)
+
+    @staticmethod
+    def _to_params(row: Dict[str, Any]) -> tuple:
+        """Convert a dependency dict into INSERT parameters."""
+        round_1_responses = row.get("round_1_responses")
+        round_2_responses = row.get("round_2_responses")
+        convergence_metrics = row.get("convergence_metrics")
+
+        return (
+            row["event_a_ticker"],
+            row["event_b_ticker"],
+            row["dependency_type"],
+            row["dependency_score"],
+            _json_dumps(row["constraints"]),
+            _json_dumps(row["llm_responses"]),
+            row["consensus_method"],
+            _to_json_text(round_1_responses),
+            _to_json_text(round_2_responses),
+            _to_json_text(convergence_metrics),
+            row.get("analysis_mode", "full_analysis"),
+        )
 
     def get(self, dependency_id: int) -> Optional[Dict[str, Any]]:
         """Get dependency by ID."""
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM event_dependencies WHERE id = ?", (dependency_id,)
+        return self.db.fetchone_dict(
+            _SQL_GET_DEPENDENCY, (dependency_id,), LazyDependencyRow
         )
-        row = cursor.fetchone()
-        return dict(row) if row else None
 
     def get_by_event_pair(
         self, event_a_ticker: str, event_b_ticker: str
     ) -> Optional[Dict[str, Any]]:
         """Get dependency for specific event pair."""
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM event_dependencies
-            WHERE event_a_ticker = ? AND event_b_ticker = ?
-            """,
+        return self.db.fetchone_dict(
+            _SQL_GET_DEPENDENCY_BY_PAIR,
             (event_a_ticker, event_b_ticker),
+            LazyDependencyRow,
         )
-        row = cursor.fetchone()
-        return dict(row) if row else None
 
     def get_all(self) -> List[Dict[str, Any]]:
         """Get all dependencies."""
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM event_dependencies ORDER BY detected_at DESC"
-        )
-        return [dict(row) for row in cursor.fetchall()]
+        return self.db.fetchall_dicts(_SQL_GET_ALL_DEPENDENCIES, (), LazyDependencyRow)
 
     def get_all_unverified(self) -> List[Dict[str, Any]]:
         """Get all dependencies pending human verification."""
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM event_dependencies
-            WHERE human_verified = FALSE
-            ORDER BY dependency_score DESC, detected_at DESC
-            """
+        return self.db.fetchall_dicts(
+            _SQL_GET_UNVERIFIED_DEPENDENCIES, (), LazyDependencyRow
         )
-        return [dict(row) for row in cursor.fetchall()]
 
     def mark_verified(
         self, dependency_id: int, verified: bool, notes: Optional[str] = None
     ) -> None:
         """Mark dependency as verified by human."""
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            UPDATE event_dependencies
-            SET human_verified = ?,
-                verification_notes = ?,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-            """,
-            (verified, notes, dependency_id),
-        )
-        self.db.conn.commit()
+        self._execute(_SQL_MARK_DEPENDENCY_VERIFIED, (verified, notes, dependency_id))
 
     def check_pairs_exist(
         self, event_pairs: List[tuple[str, str]]
@@ -770,43 +1806,62 @@ class EventDependencyRepository:
         if not event_pairs:
             return {}
 
-        # Batch queries to avoid SQLite expression tree depth limit (1000)
-        # Process in chunks of 100 pairs to stay well under the limit
-        BATCH_SIZE = 100
-        existing = set()
-
-        for i in range(0, len(event_pairs), BATCH_SIZE):
-            batch = event_pairs[i:i + BATCH_SIZE]
-
-            # Build query with OR conditions for this batch
-            placeholders = " OR ".join(
-                ["(event_a_ticker = ? AND event_b_ticker = ?)"] * len(batch)
-            )
-            flat_values = [val for pair in batch for val in pair]
-
-            query = f"""
-                SELECT event_a_ticker, event_b_ticker
-                FROM event_dependencies
-                WHERE {placeholders}
-            """
-
-            cursor = self.db.conn.cursor()
-            cursor.execute(query, flat_values)
-            result = cursor.fetchall()
-
-            # Add results from this batch to existing set
-            existing.update((row[0], row[1]) for row in result)
+        # One indexed probe per pair: the pairs are passed as a single JSON
+        # array and joined against the UNIQUE(event_a_ticker, event_b_ticker)
+        # index, so the statement is the same whatever the number of pairs.
+        pairs_json = _json_dumps([list(pair) for pair in event_pairs])
+        rows = self.db.fetchall(_SQL_EXISTING_DEPENDENCY_PAIRS, (pairs_json,))
+        existing = {(row[0], row[1]) for row in rows}
 
         # Return dict with existence status for each input pair
         return {pair: pair in existing for pair in event_pairs}
 
 
-class ArbitrageOpportunityRepository:
+_SQL_INSERT_ARBITRAGE: Final[str] = """
+    INSERT INTO arbitrage_opportunities (
+        dependency_id, event_a_ticker, event_b_ticker,
+        min_cost, expected_profit, optimal_portfolio_json,
+        market_ids_json, current_prices_json, constraints_json,
+        ip_solver_metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_GET_ARBITRAGE: Final[str] = "SELECT * FROM arbitrage_opportunities WHERE id = ?"
+
+_SQL_GET_ALL_ARBITRAGE: Final[str] = """
+    SELECT * FROM arbitrage_opportunities
+    ORDER BY expected_profit DESC, detected_at DESC
+"""
+
+_SQL_GET_ARBITRAGE_BY_STATUS: Final[str] = """
+    SELECT * FROM arbitrage_opportunities
+    WHERE status = ?
+    ORDER BY expected_profit DESC, detected_at DESC
+"""
+
+# Notes (?2) are optional: NULL leaves the verification columns untouched.
+_SQL_UPDATE_ARBITRAGE_STATUS: Final[str] = """
+    UPDATE arbitrage_opportunities
+    SET status = ?1,
+        verification_notes = COALESCE(?2, verification_notes),
+        human_verified = CASE WHEN ?2 IS NULL THEN human_verified ELSE TRUE END,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?3
+"""
+
+_SQL_MARK_ARBITRAGE_EXECUTED: Final[str] = """
+    UPDATE arbitrage_opportunities
+    SET trade_executed = TRUE,
+        execution_details = ?,
+        updated_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+
+
+class ArbitrageOpportunityRepository(_BaseRepository):
     """Repository for arbitrage opportunity operations."""
 
-    def __init__(self, db=None):
-        """Initialize repository with database connection."""
-        self.db = db or get_db()
+    __slots__ = ()
 
     def create(
         self,
@@ -822,116 +1877,135 @@ class ArbitrageOpportunityRepository:
         ip_solver_metadata: Optional[Dict[str, Any]] = None,
     ) -> int:
         """Create arbitrage opportunity record."""
-        optimal_portfolio_json = json.dumps(optimal_portfolio)
-        market_ids_json = json.dumps(market_ids)
-        current_prices_json = json.dumps(current_prices)
-        constraints_json = json.dumps(constraints)
-        ip_solver_json = json.dumps(ip_solver_metadata) if ip_solver_metadata else None
-
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            INSERT INTO arbitrage_opportunities (
-                dependency_id, event_a_ticker, event_b_ticker,
-                min_cost, expected_profit, optimal_portfolio_json,
-                market_ids_json, current_prices_json, constraints_json,
-                ip_solver_metadata
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                dependency_id,
-                event_a_ticker,
-                event_b_ticker,
-                min_cost,
-                expected_profit,
-                optimal_portfolio_json,
-                market_ids_json,
-                current_prices_json,
-                constraints_json,
-                ip_solver_json,
+        arbitrage_id = self._execute(
+            _SQL_INSERT_ARBITRAGE,
+            self._to_params(
+                {
+                    "dependency_id": dependency_id,
+                    "event_a_ticker": event_a_ticker,
+                    "event_b_ticker": event_b_ticker,
+                    "min_cost": min_cost,
+                    "expected_profit": expected_profit,
+                    "optimal_portfolio": optimal_portfolio,
+                    "market_ids": market_ids,
+                    "current_prices": current_prices,
+                    "constraints": constraints,
+                    "ip_solver_metadata": ip_solver_metadata,
+                }
             ),
         )
-        self.db.conn.commit()
-        return cursor.lastrowid
+        self._invalidate_all()
+        return arbitrage_id
+
+    def create_many(self, rows: List[Dict[str, Any]]) -> None:
+        """Create several arbitrage opportunities in one transaction.
+
+        Args:
+            rows: Dicts keyed like the ``create`` arguments
+        """
+        if not rows:
+            return
+
+        params = [self._to_params(row) for row in rows]
+
+        with self.db.transaction():
+            self._cursor.executemany(_SQL_INSERT_ARBITRAGE, params)
+        self._invalidate_all()
+
+    def _invalidate_all(self) -> None:
+        """Drop the cached list of all opportunities."""
+        self.db.invalidate(lambda key: key[0] == "all_arbitrage")
+
+    @staticmethod
+    def _to_params(row: Dict[str, Any]) -> tuple:
+        """Convert an opportunity dict into INSERT parameters."""
+        ip_solver_metadata = row.get("ip_solver_metadata")
+
+        return (
+            row["dependency_id"],
+            row["event_a_ticker"],
+            row["event_b_ticker"],
+            row["min_cost"],
+            row["expected_profit"],
+            _json_dumps(row["optimal_portfolio"]),
+            _json_dumps(row["market_ids"]),
+            _json_dumps(row["current_prices"]),
+            _json_dumps(row["constraints"]),
+            _to_json_text(ip_solver_metadata),
+        )
 
     def get(self, arbitrage_id: int) -> Optional[Dict[str, Any]]:
         """Get arbitrage opportunity by ID."""
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            "SELECT * FROM arbitrage_opportunities WHERE id = ?", (arbitrage_id,)
+        return self.db.fetchone_dict(
+            _SQL_GET_ARBITRAGE, (arbitrage_id,), LazyArbitrageRow
         )
-        row = cursor.fetchone()
-        return dict(row) if row else None
 
     def get_all(self) -> List[Dict[str, Any]]:
-        """Get all opportunities."""
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM arbitrage_opportunities
-            ORDER BY expected_profit DESC, detected_at DESC
-            """
-        )
-        return [dict(row) for row in cursor.fetchall()]
+        """Get all opportunities.
+
+        The rows are served from the query cache until an opportunity is
+        written.
+        """
+        key = ("all_arbitrage",)
+        rows = self.db.cache_get(key, _MISSING)
+        if rows is _MISSING:
+            rows = self.db.fetchall(_SQL_GET_ALL_ARBITRAGE)
+            self.db.cache_set(key, rows)
+        return [LazyArbitrageRow(row) for row in rows]
 
     def get_by_status(self, status: str) -> List[Dict[str, Any]]:
         """Get opportunities by status (detected, verified, rejected, executed)."""
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            SELECT * FROM arbitrage_opportunities
-            WHERE status = ?
-            ORDER BY expected_profit DESC, detected_at DESC
-            """,
-            (status,),
+        return self.db.fetchall_dicts(
+            _SQL_GET_ARBITRAGE_BY_STATUS, (status,), LazyArbitrageRow
         )
-        return [dict(row) for row in cursor.fetchall()]
 
     def update_status(
         self, arbitrage_id: int, status: str, notes: Optional[str] = None
     ) -> None:
         """Update opportunity status."""
-        cursor = self.db.conn.cursor()
-
-        if notes:
-            cursor.execute(
-                """
-                UPDATE arbitrage_opportunities
-                SET status = ?,
-                    verification_notes = ?,
-                    human_verified = TRUE,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-                """,
-                (status, notes, arbitrage_id),
-            )
-        else:
-            cursor.execute(
-                """
-                UPDATE arbitrage_opportunities
-                SET status = ?,
-                    updated_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-                """,
-                (status, arbitrage_id),
-            )
-        self.db.conn.commit()
+        self.update_statuses([(arbitrage_id, status, notes)])
+
+    def update_statuses(
+        self, updates: Iterable[Tuple[int, str, Optional[str]]]
+    ) -> None:
+        """Update the status of several opportunities in one transaction.
+
+        Args:
+            updates: (arbitrage_id, status, notes) tuples; notes may be None,
+                in which case the verification notes are left untouched
+        """
+        params = [
+            (status, notes or None, arbitrage_id)
+            for arbitrage_id, status, notes in updates
+        ]
+        if not params:
+            return
+
+        with self.db.transaction():
+            self._cursor.executemany(_SQL_UPDATE_ARBITRAGE_STATUS, params)
+        self._invalidate_all()
 
     def mark_executed(
         self, arbitrage_id: int, execution_details: Dict[str, Any]
     ) -> None:
         """Mark opportunity as executed with trade details."""
-        execution_json = json.dumps(execution_details)
-
-        cursor = self.db.conn.cursor()
-        cursor.execute(
-            """
-            UPDATE arbitrage_opportunities
-            SET trade_executed = TRUE,
-                execution_details = ?,
-                updated_at = CURRENT_TIMESTAMP
-            WHERE id = ?
-            """,
-            (execution_json, arbitrage_id),
-        )
-        self.db.conn.commit()
+        self.mark_many_executed([(arbitrage_id, execution_details)])
+
+    def mark_many_executed(
+        self, executions: Iterable[Tuple[int, Dict[str, Any]]]
+    ) -> None:
+        """Mark several opportunities as executed in one transaction.
+
+        Args:
+            executions: (arbitrage_id, execution_details) tuples
+        """
+        params = [
+            (_json_dumps(execution_details), arbitrage_id)
+            for arbitrage_id, execution_details in executions
+        ]
+        if not params:
+            return
+
+        with self.db.transaction():
+            self._cursor.executemany(_SQL_MARK_ARBITRAGE_EXECUTED, params)
+        self._invalidate_all()
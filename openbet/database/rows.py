@@ -0,0 +1,106 @@
+"""Row wrappers returned by repositories."""
+
+import sqlite3
+import zlib
+from typing import Any, Iterable, Mapping, Tuple, Union
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is an optional speedup
+    from json import loads as json_loads
+
+
+class LazyJSONRow(dict):
+    """Row dict whose JSON columns are decoded on first access.
+
+    Subclasses list their JSON text columns in JSON_COLUMNS. Rows are built
+    without parsing them; indexing one of those columns (or get()) decodes
+    it once and keeps the decoded value in place. Columns that are never
+    read are never parsed. Bulk views such as items() and values() return
+    whatever is currently stored: JSON text, or the decoded value.
+
+    Large payloads stored as zlib-compressed BLOBs are decompressed to
+    JSON text when the row is built, so no view of the row exposes the
+    compressed bytes and dict(row) stays JSON-serializable.
+    """
+
+    __slots__ = ()
+
+    JSON_COLUMNS: frozenset = frozenset()
+
+    def __init__(
+        self,
+        row: Union[sqlite3.Row, Mapping[str, Any], Iterable[Tuple[str, Any]]],
+    ):
+        """Copy the raw column values from a database row or (name, value) pairs."""
+        super().__init__(zip(row.keys(), row) if isinstance(row, sqlite3.Row) else row)
+        for key in self.JSON_COLUMNS.intersection(self):
+            value = dict.__getitem__(self, key)
+            if isinstance(value, bytes):
+                dict.__setitem__(self, key, zlib.decompress(value).decode())
+
+    def __getitem__(self, key: str) -> Any:
+        value = dict.__getitem__(self, key)
+        if key in self.JSON_COLUMNS and isinstance(value, str):
+            value = json_loads(value)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the (decoded) value for key, or default if missing."""
+        if key in self:
+            return self[key]
+        return default
+
+
+class LazyAnalysisRow(LazyJSONRow):
+    """Analysis result with lazily decoded LLM responses and metadata.
+
+    Large responses are stored as zlib-compressed JSON BLOBs (see
+    LazyJSONRow).
+    """
+
+    __slots__ = ()
+
+    JSON_COLUMNS = frozenset(
+        {
+            "claude_response",
+            "openai_response",
+            "grok_response",
+            "gemini_response",
+            "metadata",
+        }
+    )
+
+
+class LazyDependencyRow(LazyJSONRow):
+    """Event dependency with lazily decoded constraint and response columns."""
+
+    __slots__ = ()
+
+    JSON_COLUMNS = frozenset(
+        {
+            "constraints_json",
+            "llm_responses_json",
+            "round_1_responses",
+            "round_2_responses",
+            "convergence_metrics",
+        }
+    )
+
+
+class LazyArbitrageRow(LazyJSONRow):
+    """Arbitrage opportunity with lazily decoded portfolio and price columns."""
+
+    __slots__ = ()
+
+    JSON_COLUMNS = frozenset(
+        {
+            "optimal_portfolio_json",
+            "market_ids_json",
+            "current_prices_json",
+            "constraints_json",
+            "ip_solver_metadata",
+            "execution_details",
+        }
+    )
@@ -1,14 +1,17 @@
 """Kalshi API client for market data and order execution."""
 
 import base64
+import queue
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, TypeVar
+from urllib.parse import urlsplit
 
 import requests
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import hashes, serialization
-from cryptography.hazmat.primitives.asymmetric import padding
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from requests.adapters import HTTPAdapter
+from requests.auth import AuthBase
 from urllib3.util.retry import Retry
 
 from openbet.config import get_settings
@@ -25,10 +28,184 @@ from openbet.kalshi.models import (
     GetMarketsResponse,
     Market,
     Order,
-    OrderRequest,
     Orderbook,
+    OrderbookEntry,
     Position,
 )
+from openbet.utils.cache import TTLCache
+from openbet.utils.rate_limit import TokenBucket
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is an optional speedup
+    from json import loads as json_loads
+
+_ModelT = TypeVar("_ModelT", bound=BaseModel)
+
+# Validate whole response lists in one pydantic-core call instead of
+# constructing models one by one.
+_EVENT_LIST = TypeAdapter(List[Event])
+_POSITION_LIST = TypeAdapter(List[Position])
+
+# Connections kept alive per host in the shared pool; enough that
+# concurrent callers (e.g. page prefetch) don't wait on each other.
+POOL_CONNECTIONS = 32
+
+# Authentication header names, set on every request.
+_HEADER_KEY = "KALSHI-ACCESS-KEY"
+_HEADER_SIGNATURE = "KALSHI-ACCESS-SIGNATURE"
+_HEADER_TIMESTAMP = "KALSHI-ACCESS-TIMESTAMP"
+
+# Maximum number of market/event lookups kept in the response cache.
+RESPONSE_CACHE_SIZE = 1024
+
+# Status filters accepted by the events and markets listing endpoints.
+_VALID_STATUSES = frozenset(("unopened", "open", "closed", "settled"))
+_VALID_STATUSES_MSG = ", ".join(sorted(_VALID_STATUSES))
+
+
+@lru_cache(maxsize=None)
+def _shared_adapter() -> HTTPAdapter:
+    """Return the HTTP adapter (with retry logic) shared by all clients.
+
+    Every KalshiClient mounts this adapter on its own session, so their
+    requests share one keep-alive connection pool (and TLS sessions)
+    while auth and cookies stay per client.
+    """
+    # Configure retry strategy
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "DELETE"],
+    )
+
+    return HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_CONNECTIONS,
+        max_retries=retry_strategy,
+    )
+
+
+@lru_cache(maxsize=None)
+def _signing_params() -> Tuple[Any, Any]:
+    """Return the (padding, hash) pair used for request signatures.
+
+    Both objects are immutable and shared. cryptography is imported here,
+    when the first client is created, rather than at module import, so
+    CLI commands that never talk to Kalshi don't pay for loading it.
+    """
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.asymmetric import padding
+
+    pss = padding.PSS(
+        mgf=padding.MGF1(hashes.SHA256()),
+        salt_length=padding.PSS.DIGEST_LENGTH,
+    )
+    return pss, hashes.SHA256()
+
+
+def _to_cents(price: float) -> int:
+    """Convert a dollar price to integer cents.
+
+    Rounds rather than truncates: 0.29 * 100 is 28.999999999999996 in
+    binary floating point, which int() would turn into 28.
+    """
+    return int(round(price * 100))
+
+
+def _orderbook_levels(levels: Any) -> List[OrderbookEntry]:
+    """Convert raw [price_cents, quantity] pairs into orderbook entries.
+
+    Entries are built with model_construct: prices are computed here and
+    quantities are API integers, so per-field validation adds nothing.
+    """
+    if not levels or not isinstance(levels, list):
+        return []
+    return [
+        OrderbookEntry.model_construct(price=item[0] / 100, quantity=item[1])
+        for item in levels
+        if isinstance(item, list) and len(item) >= 2
+    ]
+
+
+def _best_price(levels: Any) -> Optional[float]:
+    """Return the top level's price in dollars, as _orderbook_levels would."""
+    if levels and isinstance(levels, list):
+        for item in levels:
+            if isinstance(item, list) and len(item) >= 2:
+                return item[0] / 100
+    return None
+
+
+@lru_cache(maxsize=256)
+def _signed_path(method: str, path: str) -> bytes:
+    """Return the method + path part of a signed message.
+
+    path must already have its query string removed, so paginated
+    requests (which differ only by cursor) share one cache entry.
+    """
+    return (method + path).encode("utf-8")
+
+
+class KalshiAuth(AuthBase):
+    """Signs requests with Kalshi's RSA-PSS authentication headers.
+
+    Attached to the session, so every request is signed as it is prepared,
+    with a fresh timestamp, instead of each call site building headers.
+    """
+
+    def __init__(self, api_key: str, private_key: Any, base_path: str = ""):
+        """Initialize the signer.
+
+        Args:
+            api_key: Kalshi API key id
+            private_key: Loaded RSA private key
+            base_path: Path prefix of the API base URL; the signed path is
+                the endpoint path relative to it
+        """
+        self.api_key = api_key
+        self.private_key = private_key
+        self.base_path = base_path.rstrip("/")
+
+    def sign(self, timestamp: str, method: str, path: str) -> str:
+        """Create RSA-PSS signature for API request.
+
+        Args:
+            timestamp: Request timestamp in milliseconds
+            method: HTTP method (GET, POST, etc.)
+            path: API endpoint path; any query string is ignored
+
+        Returns:
+            Base64-encoded signature string
+        """
+        # Create message to sign: timestamp + method + path (without query)
+        message = timestamp.encode("utf-8") + _signed_path(
+            method, path.partition("?")[0]
+        )
+
+        # Sign using RSA-PSS with SHA256
+        signature = self.private_key.sign(message, *_signing_params())
+
+        # Return base64-encoded signature
+        return base64.b64encode(signature).decode("utf-8")
+
+    def __call__(self, request: requests.PreparedRequest) -> requests.PreparedRequest:
+        path = urlsplit(request.url).path
+        if self.base_path and path.startswith(self.base_path):
+            path = path[len(self.base_path):]
+
+        # Generate timestamp in milliseconds
+        timestamp = str(int(time.time() * 1000))
+
+        request.headers.update(
+            {
+                _HEADER_KEY: self.api_key,
+                _HEADER_SIGNATURE: self.sign(timestamp, request.method, path),
+                _HEADER_TIMESTAMP: timestamp,
+            }
+        )
+        return request
 
 
 class KalshiClient:
@@ -44,24 +221,33 @@ class KalshiClient:
         settings = get_settings()
         self.api_key = api_key or settings.kalshi_api_key
         self.api_secret = api_secret or settings.kalshi_api_secret
-        self.base_url = settings.kalshi_base_url
+        # Normalized once so request URLs are a single concatenation.
+        self.base_url = settings.kalshi_base_url.rstrip("/")
 
         self.session = self._create_session()
         self.private_key = self._load_private_key()
+        self.session.auth = KalshiAuth(
+            self.api_key, self.private_key, urlsplit(self.base_url).path
+        )
+
+        # Conservative client-side limits for the event endpoints: sustained
+        # 2 listing calls/s and ~3 single-event calls/s, with short bursts.
+        self._events_limiter = TokenBucket(rate=2.0, capacity=4)
+        self._event_limiter = TokenBucket(rate=1 / 0.3, capacity=4)
+
+        # Short-lived cache of get_market/get_event results, so repeated
+        # lookups of the same ticker within one scan cost a single request.
+        self.response_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=RESPONSE_CACHE_SIZE, ttl=settings.kalshi_cache_ttl)
+            if settings.kalshi_cache_ttl > 0
+            else None
+        )
 
     def _create_session(self) -> requests.Session:
-        """Create requests session with retry logic."""
+        """Create requests session backed by the shared connection pool."""
         session = requests.Session()
 
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS", "POST", "DELETE"],
-        )
-
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = _shared_adapter()
         session.mount("http://", adapter)
         session.mount("https://", adapter)
 
@@ -70,12 +256,20 @@ class KalshiClient:
     def _load_private_key(self):
         """Load RSA private key from PEM-formatted string.
 
+        Kalshi only accepts RSA-PSS signatures, so other key types are
+        rejected here rather than on the first signed request. OpenSSL signs
+        with the CRT parameters that every PEM RSA private key carries.
+
         Returns:
             RSA private key object
 
         Raises:
-            KalshiAuthenticationError: If key cannot be loaded
+            KalshiAuthenticationError: If key cannot be loaded or is not RSA
         """
+        from cryptography.hazmat.backends import default_backend
+        from cryptography.hazmat.primitives import serialization
+        from cryptography.hazmat.primitives.asymmetric import rsa
+
         try:
             # Handle case where key might have escaped newlines
             key_string = self.api_secret.replace("\\n", "\n")
@@ -84,50 +278,25 @@ class KalshiClient:
             private_key = serialization.load_pem_private_key(
                 key_bytes, password=None, backend=default_backend()
             )
-            return private_key
         except Exception as e:
             raise KalshiAuthenticationError(
                 f"Failed to load RSA private key: {str(e)}"
             )
 
-    def _create_signature(self, timestamp: str, method: str, path: str) -> str:
-        """Create RSA-PSS signature for API request.
-
-        Args:
-            timestamp: Request timestamp in milliseconds
-            method: HTTP method (GET, POST, etc.)
-            path: API endpoint path without query parameters
-
-        Returns:
-            Base64-encoded signature string
-        """
-        # Remove query parameters from path
-        path_without_query = path.split("?")[0]
-
-        # Create message to sign: timestamp + method + path
-        message = f"{timestamp}{method}{path_without_query}".encode("utf-8")
-
-        # Sign using RSA-PSS with SHA256
-        signature = self.private_key.sign(
-            message,
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.DIGEST_LENGTH,
-            ),
-            hashes.SHA256(),
-        )
-
-        # Return base64-encoded signature
-        return base64.b64encode(signature).decode("utf-8")
+        if not isinstance(private_key, rsa.RSAPrivateKey):
+            raise KalshiAuthenticationError(
+                f"Kalshi API keys must be RSA, got {type(private_key).__name__}"
+            )
+        return private_key
 
-    def _make_request(
+    def _request_content(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
-        """Make authenticated API request with RSA-PSS signature.
+    ) -> bytes:
+        """Make authenticated API request (signed by the session's KalshiAuth).
 
         Args:
             method: HTTP method (GET, POST, etc.)
@@ -136,32 +305,16 @@ class KalshiClient:
             json_data: JSON body data
 
         Returns:
-            Response data as dictionary
+            Raw response body
 
         Raises:
             KalshiAPIError: If request fails
             KalshiRateLimitError: If rate limited
         """
-        # Generate timestamp in milliseconds
-        timestamp = str(int(time.time() * 1000))
-
-        # Create signature
-        signature = self._create_signature(timestamp, method, endpoint)
-
-        # Set authentication headers
-        headers = {
-            "KALSHI-ACCESS-KEY": self.api_key,
-            "KALSHI-ACCESS-SIGNATURE": signature,
-            "KALSHI-ACCESS-TIMESTAMP": timestamp,
-        }
-
-        url = f"{self.base_url}{endpoint}"
-
         try:
             response = self.session.request(
                 method=method,
-                url=url,
-                headers=headers,
+                url=self.base_url + endpoint,
                 params=params,
                 json=json_data,
                 timeout=10,
@@ -171,7 +324,7 @@ class KalshiClient:
                 raise KalshiRateLimitError("Rate limit exceeded")
 
             response.raise_for_status()
-            return response.json()
+            return response.content
 
         except requests.exceptions.HTTPError as e:
             status_code = e.response.status_code if e.response else None
@@ -192,18 +345,90 @@ class KalshiClient:
         except requests.exceptions.RequestException as e:
             raise KalshiAPIError(f"Request failed: {str(e)}")
 
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make authenticated API request and decode the JSON response.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            params: Query parameters
+            json_data: JSON body data
+
+        Returns:
+            Response data as dictionary
+
+        Raises:
+            KalshiAPIError: If request fails or the body is not valid JSON
+            KalshiRateLimitError: If rate limited
+        """
+        content = self._request_content(method, endpoint, params, json_data)
+        try:
+            return json_loads(content)
+        except ValueError as e:  # body is not valid JSON
+            raise KalshiAPIError(f"Invalid JSON response: {str(e)}")
+
+    def _request_model(
+        self,
+        model: Type[_ModelT],
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> _ModelT:
+        """GET endpoint and validate the raw JSON body straight into model.
+
+        pydantic parses the bytes and builds the models in a single pass,
+        without materializing an intermediate dict of the response.
+
+        Args:
+            model: Response model class
+            endpoint: API endpoint path
+            params: Query parameters
+
+        Returns:
+            Validated model instance
+
+        Raises:
+            KalshiAPIError: If request fails or the body is not valid JSON
+            KalshiRateLimitError: If rate limited
+        """
+        content = self._request_content("GET", endpoint, params)
+        try:
+            return model.model_validate_json(content)
+        except ValidationError as e:
+            if any(error["type"] == "json_invalid" for error in e.errors()):
+                raise KalshiAPIError(f"Invalid JSON response: {str(e)}")
+            raise
+
     def get_market(self, market_id: str) -> Market:
         """Get market details by ticker.
 
+        Results are reused for settings.kalshi_cache_ttl seconds. Each call
+        returns its own copy, so callers may modify it.
+
         Args:
             market_id: Market ticker
 
         Returns:
             Market object with details
         """
+        cache_key = ("market", market_id)
+        if self.response_cache is not None:
+            market = self.response_cache.get(cache_key)
+            if market is not None:
+                return market.model_copy(deep=True)
+
         data = self._make_request("GET", f"/markets/{market_id}")
         market_data = data.get("market", data)
-        return Market(**market_data)
+        market = Market.model_validate(market_data)
+
+        if self.response_cache is not None:
+            self.response_cache.set(cache_key, market.model_copy(deep=True))
+        return market
 
     def get_markets(
         self,
@@ -231,9 +456,7 @@ class KalshiClient:
         if series_ticker:
             params["series_ticker"] = series_ticker
 
-        data = self._make_request("GET", "/markets", params=params)
-        markets_data = data.get("markets", [])
-        return [Market(**market) for market in markets_data]
+        return self._request_model(GetMarketsResponse, "/markets", params).markets
 
     def get_orderbook(self, market_id: str, depth: int = 5) -> Orderbook:
         """Get market orderbook.
@@ -250,35 +473,36 @@ class KalshiClient:
 
         orderbook_data = data.get("orderbook", {})
 
-        # Handle empty/null orderbook responses
-        yes_data = orderbook_data.get("yes")
-        no_data = orderbook_data.get("no")
-
-        # Parse orderbook entries (handle null/empty cases)
-        yes_bids = []
-        yes_asks = []
-        no_bids = []
-        no_asks = []
-
-        # The API returns a simple list of [price_cents, quantity] pairs
-        # These are asks (offers to sell) - prices at which you can buy
-        if yes_data and isinstance(yes_data, list):
-            yes_asks = [
-                {"price": item[0] / 100, "quantity": item[1]}
-                for item in yes_data if isinstance(item, list) and len(item) >= 2
-            ]
-
-        if no_data and isinstance(no_data, list):
-            no_asks = [
-                {"price": item[0] / 100, "quantity": item[1]}
-                for item in no_data if isinstance(item, list) and len(item) >= 2
-            ]
-
+        # The API returns a simple list of [price_cents, quantity] pairs per
+        # side (null/empty when there are none). These are asks (offers to
+        # sell) - prices at which you can buy
         return Orderbook(
-            yes_bids=yes_bids,
-            yes_asks=yes_asks,
-            no_bids=no_bids,
-            no_asks=no_asks,
+            yes_asks=_orderbook_levels(orderbook_data.get("yes")),
+            no_asks=_orderbook_levels(orderbook_data.get("no")),
+        )
+
+    def get_top_of_book(
+        self, market_id: str
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """Get the best yes and no ask prices of a market.
+
+        Cheaper than get_orderbook when only prices matter: a single level
+        per side is requested and no Orderbook is built. The API only
+        returns asks, so these equal Orderbook's best asks and mid prices.
+
+        Args:
+            market_id: Market ticker
+
+        Returns:
+            (yes price, no price) in dollars, None for an empty side
+        """
+        params = {"depth": 1}
+        data = self._make_request("GET", f"/markets/{market_id}/orderbook", params=params)
+
+        orderbook_data = data.get("orderbook") or {}
+        return (
+            _best_price(orderbook_data.get("yes")),
+            _best_price(orderbook_data.get("no")),
         )
 
     def get_position(self, market_id: str) -> Optional[Position]:
@@ -293,7 +517,7 @@ class KalshiClient:
         try:
             data = self._make_request("GET", f"/portfolio/positions/{market_id}")
             position_data = data.get("position", data)
-            return Position(**position_data)
+            return Position.model_validate(position_data)
         except KalshiMarketNotFoundError:
             return None
 
@@ -305,7 +529,7 @@ class KalshiClient:
         """
         data = self._make_request("GET", "/portfolio/positions")
         positions_data = data.get("positions", [])
-        return [Position(**pos) for pos in positions_data]
+        return _POSITION_LIST.validate_python(positions_data)
 
     def place_order(
         self,
@@ -316,17 +540,24 @@ class KalshiClient:
         yes_price: Optional[float] = None,
         no_price: Optional[float] = None,
         order_type: str = "limit",
+        yes_price_cents: Optional[int] = None,
+        no_price_cents: Optional[int] = None,
     ) -> Order:
         """Place an order on a market.
 
+        Prices may be given in dollars or, exactly, in cents; cents take
+        precedence when both are set.
+
         Args:
             ticker: Market ticker
             side: "yes" or "no"
             action: "buy" or "sell"
             count: Number of contracts
-            yes_price: Yes price in dollars (converted to cents)
-            no_price: No price in dollars (converted to cents)
+            yes_price: Yes price in dollars (rounded to cents)
+            no_price: No price in dollars (rounded to cents)
             order_type: "limit" or "market"
+            yes_price_cents: Yes price in cents
+            no_price_cents: No price in cents
 
         Returns:
             Order object with placement details
@@ -334,22 +565,31 @@ class KalshiClient:
         Raises:
             KalshiOrderError: If order placement fails
         """
-        order_request = OrderRequest(
-            ticker=ticker,
-            side=side.lower(),
-            action=action.lower(),
-            count=count,
-            type=order_type,
-            yes_price=int(yes_price * 100) if yes_price else None,
-            no_price=int(no_price * 100) if no_price else None,
-        )
+        # Same shape as OrderRequest.model_dump(exclude_none=True), built
+        # directly to keep pydantic off the order submission path.
+        payload: Dict[str, Any] = {
+            "ticker": ticker,
+            "side": side.lower(),
+            "action": action.lower(),
+            "count": int(count),
+            "type": order_type,
+        }
+        if yes_price_cents is None and yes_price:
+            yes_price_cents = _to_cents(yes_price)
+        if yes_price_cents is not None:
+            payload["yes_price"] = yes_price_cents
+        if no_price_cents is None and no_price:
+            no_price_cents = _to_cents(no_price)
+        if no_price_cents is not None:
+            payload["no_price"] = no_price_cents
 
         try:
-            data = self._make_request(
-                "POST", "/portfolio/orders", json_data=order_request.model_dump(exclude_none=True)
-            )
+            data = self._make_request("POST", "/portfolio/orders", json_data=payload)
+            if self.response_cache is not None:
+                # Our own order moves the market; don't serve it stale.
+                self.response_cache.pop(("market", ticker))
             order_data = data.get("order", data)
-            return Order(**order_data)
+            return Order.model_validate(order_data)
 
         except KalshiAPIError as e:
             raise KalshiOrderError(f"Order placement failed: {str(e)}")
@@ -415,7 +655,7 @@ class KalshiClient:
         Returns:
             List of Event objects
 
-        Rate limiting: Conservative approach with 0.5s delay
+        Rate limiting: Conservative token bucket, 2 calls/s sustained
         """
         params = {"limit": min(limit, 200)}  # API max is 200
         if cursor:
@@ -427,12 +667,10 @@ class KalshiClient:
         if with_nested_markets:
             params["with_nested_markets"] = "true"
 
-        # Conservative rate limiting: add 0.5s delay between calls
-        time.sleep(0.5)
+        # Conservative rate limiting: 2 calls/s sustained
+        self._events_limiter.acquire()
 
-        data = self._make_request("GET", "/events", params=params)
-        events_data = data.get("events", [])
-        return [Event(**event) for event in events_data]
+        return self._request_model(GetEventsResponse, "/events", params).events
 
     def get_events_with_cursor(
         self,
@@ -457,13 +695,114 @@ class KalshiClient:
         Raises:
             ValueError: If status parameter is invalid
         """
-        # Validate status parameter
-        valid_statuses = {"unopened", "open", "closed", "settled"}
-        if status and status not in valid_statuses:
+        self._check_events_status(status)
+
+        events_data, cursor_value = self._fetch_events_page(
+            limit, cursor, status, series_ticker, with_nested_markets
+        )
+        return GetEventsResponse.model_validate(
+            {"events": events_data, "cursor": cursor_value}
+        )
+
+    def iter_event_pages(
+        self,
+        limit: int = 200,
+        status: Optional[str] = None,
+        series_ticker: Optional[str] = None,
+        with_nested_markets: bool = False,
+        prefetch: int = 2,
+    ) -> Iterator[List[Event]]:
+        """Iterate over all pages of events, fetching ahead in the background.
+
+        A worker thread follows the cursor and queues raw pages (up to
+        prefetch of them), while the caller's thread validates and consumes
+        them, so model validation overlaps with the next page's request.
+        The worker stops once the iterator is exhausted or closed.
+
+        Args:
+            limit: Events per page (max 200)
+            status: Filter by status (valid: unopened, open, closed, settled)
+            series_ticker: Filter by series ticker
+            with_nested_markets: Include nested market data
+            prefetch: Maximum number of fetched pages waiting to be consumed
+
+        Returns:
+            Iterator over lists of Event objects, one list per page
+
+        Raises:
+            ValueError: If status parameter is invalid
+        """
+        self._check_events_status(status)
+
+        pages: "queue.Queue[Tuple[str, Any]]" = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+
+        def put(item: Tuple[str, Any]) -> bool:
+            # Give up if the consumer has gone away instead of blocking forever
+            while not stop.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def fetch() -> None:
+            cursor = None
+            try:
+                while True:
+                    events_data, cursor = self._fetch_events_page(
+                        limit, cursor, status, series_ticker, with_nested_markets
+                    )
+                    if not put(("page", events_data)) or cursor is None:
+                        break
+            except Exception as e:
+                put(("error", e))
+            put(("done", None))
+
+        def consume() -> Iterator[List[Event]]:
+            worker = threading.Thread(
+                target=fetch, name="kalshi-events-prefetch", daemon=True
+            )
+            worker.start()
+            try:
+                while True:
+                    kind, payload = pages.get()
+                    if kind == "done":
+                        return
+                    if kind == "error":
+                        raise payload
+                    yield _EVENT_LIST.validate_python(payload)
+            finally:
+                stop.set()
+
+        return consume()
+
+    @staticmethod
+    def _check_events_status(status: Optional[str]) -> None:
+        """Validate an events status filter.
+
+        Raises:
+            ValueError: If status parameter is invalid
+        """
+        if status and status not in _VALID_STATUSES:
             raise ValueError(
-                f"Invalid status '{status}'. Must be one of: {', '.join(sorted(valid_statuses))}"
+                f"Invalid status '{status}'. Must be one of: {_VALID_STATUSES_MSG}"
             )
 
+    def _fetch_events_page(
+        self,
+        limit: int,
+        cursor: Optional[str],
+        status: Optional[str],
+        series_ticker: Optional[str],
+        with_nested_markets: bool,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Fetch one page of events as raw dicts.
+
+        Returns:
+            Tuple of (event dicts, next cursor or None on the last page)
+        """
         params = {"limit": min(limit, 200)}
         if cursor:
             params["cursor"] = cursor
@@ -474,19 +813,12 @@ class KalshiClient:
         if with_nested_markets:
             params["with_nested_markets"] = "true"
 
-        time.sleep(0.5)  # Conservative rate limiting
+        self._events_limiter.acquire()  # Conservative rate limiting
 
         data = self._make_request("GET", "/events", params=params)
 
-        # Extract cursor from response
-        cursor_value = data.get("cursor")
-        if cursor_value == "":  # Empty string means no more pages
-            cursor_value = None
-
-        return GetEventsResponse(
-            events=[Event(**event) for event in data.get("events", [])],
-            cursor=cursor_value
-        )
+        # Empty string means no more pages
+        return data.get("events", []), data.get("cursor") or None
 
     def get_markets_with_cursor(
         self,
@@ -509,10 +841,9 @@ class KalshiClient:
         Raises:
             ValueError: If status parameter is invalid
         """
-        valid_statuses = {"unopened", "open", "closed", "settled"}
-        if status and status not in valid_statuses:
+        if status and status not in _VALID_STATUSES:
             raise ValueError(
-                f"Invalid status '{status}'. Must be one of: {', '.join(sorted(valid_statuses))}"
+                f"Invalid status '{status}'. Must be one of: {_VALID_STATUSES_MSG}"
             )
 
         params = {"limit": limit}
@@ -523,16 +854,10 @@ class KalshiClient:
         if series_ticker:
             params["series_ticker"] = series_ticker
 
-        data = self._make_request("GET", "/markets", params=params)
-
-        cursor_value = data.get("cursor")
-        if cursor_value == "":
-            cursor_value = None
-
-        return GetMarketsResponse(
-            markets=[Market(**market) for market in data.get("markets", [])],
-            cursor=cursor_value
-        )
+        response = self._request_model(GetMarketsResponse, "/markets", params)
+        if response.cursor == "":
+            response.cursor = None
+        return response
 
     def get_event(self, event_ticker: str) -> Event:
         """Get single event details.
@@ -543,9 +868,21 @@ class KalshiClient:
         Returns:
             Event object with details
 
-        Rate limiting: Conservative 0.3s delay
+        Rate limiting: Conservative token bucket, ~3 calls/s sustained;
+        results are reused for settings.kalshi_cache_ttl seconds (each call
+        returns its own copy, so callers may modify it)
         """
-        time.sleep(0.3)  # Conservative rate limiting
+        cache_key = ("event", event_ticker)
+        if self.response_cache is not None:
+            event = self.response_cache.get(cache_key)
+            if event is not None:
+                return event.model_copy(deep=True)
+
+        self._event_limiter.acquire()  # Conservative rate limiting
         data = self._make_request("GET", f"/events/{event_ticker}")
         event_data = data.get("event", data)
-        return Event(**event_data)
+        event = Event.model_validate(event_data)
+
+        if self.response_cache is not None:
+            self.response_cache.set(cache_key, event.model_copy(deep=True))
+        return event
@@ -164,7 +164,7 @@ class Event(BaseModel):
 class GetEventsResponse(BaseModel):
     """Response from GET /events endpoint with pagination."""
 
-    events: List[Event]
+    events: List[Event] = Field(default_factory=list)
     cursor: Optional[str] = None
 
     @property
@@ -176,7 +176,7 @@ class GetEventsResponse(BaseModel):
 class GetMarketsResponse(BaseModel):
     """Response from GET /markets endpoint with pagination."""
 
-    markets: List[Market]
+    markets: List[Market] = Field(default_factory=list)
     cursor: Optional[str] = None
 
     @property
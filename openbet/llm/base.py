@@ -1,10 +1,150 @@
 """Base interface for LLM providers."""
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
 
 from openbet.llm.models import LLMAnalysisResponse, MarketContext
 
+logger = logging.getLogger(__name__)
+
+_BatchT = TypeVar("_BatchT")
+
+# Polling interval bounds (seconds) while waiting for a provider batch job.
+BATCH_POLL_INITIAL = 5.0
+BATCH_POLL_MAX = 60.0
+
+# Output token cap for a market analysis. The JSON answer is a few
+# hundred tokens; the cap cuts off a model that keeps writing past it.
+ANALYSIS_MAX_TOKENS = 512
+
+# Prompt templates are module constants filled with str.format; "{:.1%}"
+# renders a 0-1 confidence exactly like "{x*100:.1f}%". The Round 1 prompt
+# is a fixed header and footer around the market text, so every provider
+# sends byte-identical boilerplate.
+_ANALYSIS_PROMPT_HEADER = """You are an expert betting analyst. Analyze the following prediction market and provide confidence scores for YES and NO outcomes.
+
+"""
+
+_ANALYSIS_PROMPT_FOOTER = """
+
+Based on the above information, provide:
+1. Your confidence score for YES (0.0 to 1.0)
+2. Your confidence score for NO (0.0 to 1.0)
+3. Your reasoning for these confidence scores
+
+Consider:
+- Current market prices and sentiment
+- Any historical analysis trends
+- Market metrics like volume and liquidity
+- Time remaining until market close
+- Current position (if any) and its implications
+
+Respond in JSON format:
+{
+    "yes_confidence": <float between 0 and 1>,
+    "no_confidence": <float between 0 and 1>,
+    "reasoning": "<your detailed reasoning>"
+}
+"""
+
+_PEER_TEMPLATE = """{analyst_id}: YES {yes_confidence:.1%}, NO {no_confidence:.1%}
+Reasoning: {reasoning}
+"""
+
+_ITERATIVE_PROMPT = """You are an expert betting analyst. You previously analyzed this market along with other AI analysts.
+Now you have the opportunity to revise your analysis after reviewing their reasoning.
+
+{context_text}
+
+PEER ANALYSES FROM ROUND 1:
+{peer_text}
+
+YOUR PREVIOUS ANALYSIS:
+YES {own_yes:.1%}, NO {own_no:.1%}
+Reasoning: {own_reasoning}
+
+After considering the other analysts' perspectives, provide your revised confidence scores.
+
+Consider:
+- What insights from other analyses are compelling?
+- Where do you disagree with the consensus and why?
+- Should you adjust your confidence based on new perspectives?
+- Current market prices and sentiment
+- Market metrics like volume and liquidity
+- Time remaining until market close
+
+Respond in JSON format:
+{{
+    "yes_confidence": <float between 0 and 1>,
+    "no_confidence": <float between 0 and 1>,
+    "reasoning": "<your revised reasoning, explaining any changes or why you maintained your position>"
+}}
+"""
+
+
+# Claude receives the same prompts split into static instructions (sent as
+# a cacheable system prompt) and the per-market details (the user turn).
+_ANALYSIS_SYSTEM_PROMPT = """You are an expert betting analyst. Analyze the prediction market described by the user and provide confidence scores for YES and NO outcomes.
+
+Based on the information provided, give:
+1. Your confidence score for YES (0.0 to 1.0)
+2. Your confidence score for NO (0.0 to 1.0)
+3. Your reasoning for these confidence scores
+
+Consider:
+- Current market prices and sentiment
+- Any historical analysis trends
+- Market metrics like volume and liquidity
+- Time remaining until market close
+- Current position (if any) and its implications
+
+Respond in JSON format:
+{
+    "yes_confidence": <float between 0 and 1>,
+    "no_confidence": <float between 0 and 1>,
+    "reasoning": "<your detailed reasoning>"
+}
+"""
+
+_ITERATIVE_SYSTEM_PROMPT = """You are an expert betting analyst. You previously analyzed a market along with other AI analysts.
+Now you have the opportunity to revise your analysis after reviewing their reasoning, which the user provides together with the market and your previous analysis.
+
+After considering the other analysts' perspectives, provide your revised confidence scores.
+
+Consider:
+- What insights from other analyses are compelling?
+- Where do you disagree with the consensus and why?
+- Should you adjust your confidence based on new perspectives?
+- Current market prices and sentiment
+- Market metrics like volume and liquidity
+- Time remaining until market close
+
+Respond in JSON format:
+{
+    "yes_confidence": <float between 0 and 1>,
+    "no_confidence": <float between 0 and 1>,
+    "reasoning": "<your revised reasoning, explaining any changes or why you maintained your position>"
+}
+"""
+
+_ITERATIVE_USER_PROMPT = """{context_text}
+
+PEER ANALYSES FROM ROUND 1:
+{peer_text}
+
+YOUR PREVIOUS ANALYSIS:
+YES {own_yes:.1%}, NO {own_no:.1%}
+Reasoning: {own_reasoning}
+"""
+
+
+
+def _format_peers(peer_analyses: List[Dict[str, Any]]) -> str:
+    """Format anonymized Round 1 peer analyses, one section per analyst."""
+    return "\n".join(map(_PEER_TEMPLATE.format_map, peer_analyses))
+
 
 class BaseLLMProvider(ABC):
     """Abstract base class for LLM providers."""
@@ -52,6 +192,54 @@ class BaseLLMProvider(ABC):
         """
         pass
 
+    async def analyze_batch(
+        self, contexts: List[MarketContext]
+    ) -> List[Optional[LLMAnalysisResponse]]:
+        """Analyze several markets.
+
+        Runs analyze_market for all contexts concurrently. Providers with a
+        batch API override this to submit a single batch job instead.
+
+        Args:
+            contexts: Market context information for each market
+
+        Returns:
+            Analysis responses in the order of contexts (None where the
+            analysis failed)
+        """
+        results = await asyncio.gather(
+            *(self.analyze_market(context) for context in contexts),
+            return_exceptions=True,
+        )
+        responses: List[Optional[LLMAnalysisResponse]] = []
+        for context, result in zip(contexts, results):
+            if isinstance(result, Exception):
+                logger.warning("Analysis of %s failed: %s", context.market_id, result)
+                result = None
+            responses.append(result)
+        return responses
+
+    @staticmethod
+    async def _wait_for_batch(
+        retrieve: Callable[[], Awaitable[_BatchT]], is_done: Callable[[_BatchT], bool]
+    ) -> _BatchT:
+        """Poll a batch job with exponential backoff until it finishes.
+
+        Args:
+            retrieve: Coroutine function fetching the current batch state
+            is_done: Predicate telling whether the batch has finished
+
+        Returns:
+            Final batch state
+        """
+        delay = BATCH_POLL_INITIAL
+        while True:
+            batch = await retrieve()
+            if is_done(batch):
+                return batch
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, BATCH_POLL_MAX)
+
     def _build_analysis_prompt(self, context: MarketContext) -> str:
         """Build prompt for market analysis.
 
@@ -62,7 +250,7 @@ class BaseLLMProvider(ABC):
             Formatted prompt string
         """
         # Check if this is an iterative analysis (Round 2)
-        if "peer_analyses" in context.metadata and "own_previous_response" in context.metadata:
+        if self._is_iterative(context):
             return self._build_iterative_analysis_prompt(
                 context,
                 context.metadata["peer_analyses"],
@@ -70,30 +258,50 @@ class BaseLLMProvider(ABC):
             )
 
         # Regular analysis prompt (Round 1)
-        prompt = f"""You are an expert betting analyst. Analyze the following prediction market and provide confidence scores for YES and NO outcomes.
+        return _ANALYSIS_PROMPT_HEADER + context.to_prompt_text() + _ANALYSIS_PROMPT_FOOTER
 
-{context.to_prompt_text()}
+    @staticmethod
+    def _is_iterative(context: MarketContext) -> bool:
+        """Check whether context carries Round 1 peer feedback."""
+        return (
+            "peer_analyses" in context.metadata
+            and "own_previous_response" in context.metadata
+        )
 
-Based on the above information, provide:
-1. Your confidence score for YES (0.0 to 1.0)
-2. Your confidence score for NO (0.0 to 1.0)
-3. Your reasoning for these confidence scores
+    def _static_system_prompt(self, context: MarketContext) -> str:
+        """Get the instructions of an analysis, identical across markets.
 
-Consider:
-- Current market prices and sentiment
-- Any historical analysis trends
-- Market metrics like volume and liquidity
-- Time remaining until market close
-- Current position (if any) and its implications
+        Args:
+            context: Market context information (selects the round)
 
-Respond in JSON format:
-{{
-    "yes_confidence": <float between 0 and 1>,
-    "no_confidence": <float between 0 and 1>,
-    "reasoning": "<your detailed reasoning>"
-}}
-"""
-        return prompt
+        Returns:
+            System prompt string
+        """
+        if self._is_iterative(context):
+            return _ITERATIVE_SYSTEM_PROMPT
+        return _ANALYSIS_SYSTEM_PROMPT
+
+    def _dynamic_user_prompt(self, context: MarketContext) -> str:
+        """Get the market-specific part of an analysis prompt.
+
+        Args:
+            context: Market context information
+
+        Returns:
+            User prompt string
+        """
+        context_text = context.to_prompt_text()
+        if not self._is_iterative(context):
+            return context_text
+
+        own_previous_response = context.metadata["own_previous_response"]
+        return _ITERATIVE_USER_PROMPT.format(
+            context_text=context_text,
+            peer_text=_format_peers(context.metadata["peer_analyses"]),
+            own_yes=own_previous_response["yes_confidence"],
+            own_no=own_previous_response["no_confidence"],
+            own_reasoning=own_previous_response["reasoning"],
+        )
 
     def _build_iterative_analysis_prompt(
         self,
@@ -112,43 +320,10 @@ Respond in JSON format:
         Returns:
             Formatted prompt string for Round 2 analysis
         """
-        # Format peer analyses
-        peer_sections = []
-        for peer in peer_analyses:
-            peer_section = f"""{peer['analyst_id']}: YES {peer['yes_confidence']*100:.1f}%, NO {peer['no_confidence']*100:.1f}%
-Reasoning: {peer['reasoning']}
-"""
-            peer_sections.append(peer_section)
-
-        peer_text = "\n".join(peer_sections)
-
-        prompt = f"""You are an expert betting analyst. You previously analyzed this market along with other AI analysts.
-Now you have the opportunity to revise your analysis after reviewing their reasoning.
-
-{context.to_prompt_text()}
-
-PEER ANALYSES FROM ROUND 1:
-{peer_text}
-
-YOUR PREVIOUS ANALYSIS:
-YES {own_previous_response['yes_confidence']*100:.1f}%, NO {own_previous_response['no_confidence']*100:.1f}%
-Reasoning: {own_previous_response['reasoning']}
-
-After considering the other analysts' perspectives, provide your revised confidence scores.
-
-Consider:
-- What insights from other analyses are compelling?
-- Where do you disagree with the consensus and why?
-- Should you adjust your confidence based on new perspectives?
-- Current market prices and sentiment
-- Market metrics like volume and liquidity
-- Time remaining until market close
-
-Respond in JSON format:
-{{
-    "yes_confidence": <float between 0 and 1>,
-    "no_confidence": <float between 0 and 1>,
-    "reasoning": "<your revised reasoning, explaining any changes or why you maintained your position>"
-}}
-"""
-        return prompt
+        return _ITERATIVE_PROMPT.format(
+            context_text=context.to_prompt_text(),
+            peer_text=_format_peers(peer_analyses),
+            own_yes=own_previous_response["yes_confidence"],
+            own_no=own_previous_response["no_confidence"],
+            own_reasoning=own_previous_response["reasoning"],
+        )
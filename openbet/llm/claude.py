@@ -1,13 +1,26 @@
 """Claude (Anthropic) LLM provider implementation."""
 
-import json
-from typing import Optional
+import logging
+from typing import Any, Dict, List, Optional
 
 from anthropic import AsyncAnthropic
+from pydantic import ValidationError
 
 from openbet.config import get_settings
-from openbet.llm.base import BaseLLMProvider
-from openbet.llm.models import LLMAnalysisResponse, MarketContext
+from openbet.llm.base import ANALYSIS_MAX_TOKENS, BaseLLMProvider
+from openbet.llm.http import get_http_client
+from openbet.llm.models import LLMAnalysisOutput, LLMAnalysisResponse, MarketContext
+from openbet.llm.parsing import parse_analysis, strip_code_fence
+
+logger = logging.getLogger(__name__)
+
+# Market analyses are returned as the arguments of a forced tool call, so
+# Claude's output is structured by the schema instead of parsed from text.
+_ANALYSIS_TOOL = {
+    "name": "submit_analysis",
+    "description": "Submit confidence scores and reasoning for the market.",
+    "input_schema": LLMAnalysisOutput.model_json_schema(),
+}
 
 
 class ClaudeProvider(BaseLLMProvider):
@@ -25,7 +38,60 @@ class ClaudeProvider(BaseLLMProvider):
         model = model or settings.default_llm_model_claude
 
         super().__init__(api_key, model)
-        self.client = AsyncAnthropic(api_key=self.api_key)
+        self.client = AsyncAnthropic(
+            api_key=self.api_key, http_client=get_http_client()
+        )
+
+    def _analysis_params(self, context: MarketContext) -> Dict[str, Any]:
+        """Build the messages.create parameters of a market analysis.
+
+        Args:
+            context: Market context information
+
+        Returns:
+            Request parameters
+        """
+        # Static instructions go in a cached system prompt; together with the
+        # tool definition they form a prefix shared by every analysis
+        system = [
+            {
+                "type": "text",
+                "text": self._static_system_prompt(context),
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        return {
+            "model": self.model,
+            "max_tokens": ANALYSIS_MAX_TOKENS,
+            "system": system,
+            "messages": [{"role": "user", "content": self._dynamic_user_prompt(context)}],
+            "tools": [_ANALYSIS_TOOL],
+            "tool_choice": {"type": "tool", "name": _ANALYSIS_TOOL["name"]},
+        }
+
+    @staticmethod
+    def _parse_analysis(message: Any) -> LLMAnalysisResponse:
+        """Build an analysis response from the forced tool call of a message.
+
+        Args:
+            message: Claude message returned for an analysis request
+
+        Returns:
+            Analysis response with confidence scores
+
+        Raises:
+            Exception: If the message has no analysis tool call
+            ValidationError: If the tool call arguments are invalid
+        """
+        # Extract the tool call arguments
+        tool_use = next(
+            (block for block in message.content if block.type == "tool_use"),
+            None,
+        )
+        if tool_use is None:
+            raise Exception("Claude returned no analysis tool call")
+
+        return parse_analysis(tool_use.input, "claude")
 
     async def analyze_market(self, context: MarketContext) -> LLMAnalysisResponse:
         """Analyze market using Claude.
@@ -39,45 +105,63 @@ class ClaudeProvider(BaseLLMProvider):
         Raises:
             Exception: If API call fails or response parsing fails
         """
-        prompt = self._build_analysis_prompt(context)
-
         try:
             response = await self.client.messages.create(
-                model=self.model,
-                max_tokens=1024,
-                messages=[{"role": "user", "content": prompt}],
-            )
-
-            # Extract response text
-            response_text = response.content[0].text
-
-            # Parse JSON response
-            # Try to extract JSON from markdown code blocks if present
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-
-            data = json.loads(response_text)
-
-            return LLMAnalysisResponse(
-                yes_confidence=float(data["yes_confidence"]),
-                no_confidence=float(data["no_confidence"]),
-                reasoning=data["reasoning"],
-                provider="claude",
+                **self._analysis_params(context)
             )
+            return self._parse_analysis(response)
 
-        except json.JSONDecodeError as e:
-            raise Exception(f"Failed to parse Claude response as JSON: {str(e)}")
-        except KeyError as e:
-            raise Exception(f"Missing required field in Claude response: {str(e)}")
+        except ValidationError as e:
+            raise Exception(f"Invalid analysis in Claude response: {str(e)}")
         except Exception as e:
             raise Exception(f"Claude API error: {str(e)}")
 
+    async def analyze_batch(
+        self, contexts: List[MarketContext]
+    ) -> List[Optional[LLMAnalysisResponse]]:
+        """Analyze several markets through the Message Batches API.
+
+        All analyses are submitted as one batch, billed at the batch
+        discount and outside the per-minute rate limits, then polled until
+        processing ends. Batches can take minutes to complete, so this is
+        meant for bulk jobs rather than interactive analysis.
+
+        Args:
+            contexts: Market context information for each market
+
+        Returns:
+            Analysis responses in the order of contexts (None where the
+            request failed or could not be parsed)
+        """
+        if not contexts:
+            return []
+
+        batch = await self.client.messages.batches.create(
+            requests=[
+                {"custom_id": str(i), "params": self._analysis_params(context)}
+                for i, context in enumerate(contexts)
+            ]
+        )
+        await self._wait_for_batch(
+            lambda: self.client.messages.batches.retrieve(batch.id),
+            lambda current: current.processing_status == "ended",
+        )
+
+        responses: List[Optional[LLMAnalysisResponse]] = [None] * len(contexts)
+        async for entry in await self.client.messages.batches.results(batch.id):
+            if entry.result.type != "succeeded":
+                logger.warning(
+                    "Claude batch request %s %s", entry.custom_id, entry.result.type
+                )
+                continue
+            try:
+                responses[int(entry.custom_id)] = self._parse_analysis(
+                    entry.result.message
+                )
+            except Exception as e:
+                logger.warning("Claude batch request %s failed: %s", entry.custom_id, e)
+        return responses
+
     async def analyze_custom_prompt(self, prompt: str) -> str:
         """Analyze with custom prompt, return raw text response.
 
@@ -100,17 +184,8 @@ class ClaudeProvider(BaseLLMProvider):
             # Extract and return raw response text
             response_text = response.content[0].text
 
-            # Try to extract JSON from markdown code blocks if present
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                return response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                return response_text[json_start:json_end].strip()
-
-            return response_text
+            # Unwrap JSON from a markdown code block if present
+            return strip_code_fence(response_text)
 
         except Exception as e:
             raise Exception(f"Claude API error: {str(e)}")
@@ -1,13 +1,65 @@
 """Gemini (Google) LLM provider implementation."""
 
-import json
+from functools import lru_cache
 from typing import Optional
 
 from google import genai
+from google.genai import types
+from pydantic import ValidationError
 
 from openbet.config import get_settings
 from openbet.llm.base import BaseLLMProvider
-from openbet.llm.models import LLMAnalysisResponse, MarketContext
+from openbet.llm.models import LLMAnalysisOutput, LLMAnalysisResponse, MarketContext
+from openbet.llm.parsing import parse_analysis, strip_code_fence
+
+
+@lru_cache(maxsize=None)
+def _analysis_config(system_instruction: str) -> types.GenerateContentConfig:
+    """Get the request config for an analysis with the given instructions.
+
+    Output is constrained to JSON matching the analysis schema. The static
+    instructions go first, as the system instruction, so every request of
+    a round shares a prefix that Gemini's implicit context cache can reuse.
+    """
+    return types.GenerateContentConfig(
+        system_instruction=system_instruction,
+        response_mime_type="application/json",
+        response_schema=LLMAnalysisOutput,
+    )
+
+
+def _response_text(response: types.GenerateContentResponse) -> str:
+    """Return the text of a Gemini response, rejecting blocked or empty ones.
+
+    Args:
+        response: Response returned by generate_content
+
+    Returns:
+        Response text
+
+    Raises:
+        Exception: If the prompt or candidate was blocked, or the response
+            has no candidates or no text
+    """
+    # Check if the prompt was blocked by safety filters
+    feedback = response.prompt_feedback
+    if feedback is not None and feedback.block_reason:
+        raise Exception(f"Gemini blocked response due to safety filters: {feedback.block_reason}")
+
+    candidates = response.candidates
+    if not candidates:
+        raise Exception(f"Gemini returned no candidates. Response: {response}")
+
+    # Check if first candidate was blocked
+    finish_reason = candidates[0].finish_reason
+    if finish_reason == types.FinishReason.SAFETY:
+        raise Exception(f"Gemini candidate blocked by safety: {finish_reason}")
+
+    response_text = response.text
+    if not response_text or not response_text.strip():
+        raise Exception(f"Gemini returned empty response. Full response object: {response}")
+
+    return response_text
 
 
 class GeminiProvider(BaseLLMProvider):
@@ -41,67 +93,25 @@ class GeminiProvider(BaseLLMProvider):
         Raises:
             Exception: If API call fails or response parsing fails
         """
-        prompt = self._build_analysis_prompt(context)
+        config = _analysis_config(self._static_system_prompt(context))
+        prompt = self._dynamic_user_prompt(context)
 
         try:
-            # Gemini API is synchronous, but we're in an async context
-            # We'll call it directly since it's fast enough
-            response = self.client.models.generate_content(
+            # Use the SDK's async client so the call doesn't block the event
+            # loop while the other providers are awaited concurrently
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
-                contents=prompt
+                contents=prompt,
+                config=config,
             )
 
-            # Check if response was blocked by safety filters
-            if hasattr(response, 'prompt_feedback') and response.prompt_feedback:
-                if hasattr(response.prompt_feedback, 'block_reason'):
-                    raise Exception(f"Gemini blocked response due to safety filters: {response.prompt_feedback.block_reason}")
-
-            # Check if we have candidates
-            if not hasattr(response, 'candidates') or not response.candidates:
-                raise Exception(f"Gemini returned no candidates. Response: {response}")
-
-            # Check if first candidate was blocked
-            candidate = response.candidates[0]
-            if hasattr(candidate, 'finish_reason') and candidate.finish_reason:
-                # Check for safety or other blocks
-                if 'SAFETY' in str(candidate.finish_reason):
-                    raise Exception(f"Gemini candidate blocked by safety: {candidate.finish_reason}")
-
-            # Extract response text
-            response_text = response.text
-
-            # Debug: Check if response is empty
-            if not response_text or not response_text.strip():
-                raise Exception(f"Gemini returned empty response. Full response object: {response}")
-
-            # Parse JSON response
-            # Try to extract JSON from markdown code blocks if present
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-
-            # Debug: Log what we're trying to parse
-            if not response_text.strip():
-                raise Exception(f"Response text became empty after markdown extraction. Original: {response.text[:200]}")
-
-            data = json.loads(response_text)
-
-            return LLMAnalysisResponse(
-                yes_confidence=float(data["yes_confidence"]),
-                no_confidence=float(data["no_confidence"]),
-                reasoning=data["reasoning"],
-                provider="gemini",
-            )
+            response_text = _response_text(response)
 
-        except json.JSONDecodeError as e:
-            raise Exception(f"Failed to parse Gemini response as JSON: {str(e)}")
-        except KeyError as e:
-            raise Exception(f"Missing required field in Gemini response: {str(e)}")
+            # JSON mode returns bare JSON, validated without a json.loads pass
+            return parse_analysis(response_text, "gemini")
+
+        except ValidationError as e:
+            raise Exception(f"Invalid analysis in Gemini response: {str(e)}")
         except Exception as e:
             raise Exception(f"Gemini API error: {str(e)}")
 
@@ -118,42 +128,15 @@ class GeminiProvider(BaseLLMProvider):
             Exception: If API call fails
         """
         try:
-            response = self.client.models.generate_content(
+            response = await self.client.aio.models.generate_content(
                 model=self.model,
                 contents=prompt
             )
 
-            # Check if response was blocked by safety filters
-            if hasattr(response, 'prompt_feedback') and response.prompt_feedback:
-                if hasattr(response.prompt_feedback, 'block_reason'):
-                    raise Exception(f"Gemini blocked response: {response.prompt_feedback.block_reason}")
-
-            # Check if we have candidates
-            if not hasattr(response, 'candidates') or not response.candidates:
-                raise Exception(f"Gemini returned no candidates")
-
-            # Check if first candidate was blocked
-            candidate = response.candidates[0]
-            if hasattr(candidate, 'finish_reason') and 'SAFETY' in str(candidate.finish_reason):
-                raise Exception(f"Gemini candidate blocked: {candidate.finish_reason}")
-
-            # Extract and return raw response text
-            response_text = response.text
-
-            if not response_text or not response_text.strip():
-                raise Exception(f"Gemini returned empty response")
-
-            # Try to extract JSON from markdown code blocks if present
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                return response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                return response_text[json_start:json_end].strip()
-
-            return response_text
+            response_text = _response_text(response)
+
+            # Unwrap JSON from a markdown code block if present
+            return strip_code_fence(response_text)
 
         except Exception as e:
             raise Exception(f"Gemini API error: {str(e)}")
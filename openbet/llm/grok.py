@@ -1,13 +1,15 @@
 """Grok (xAI) LLM provider implementation."""
 
 import json
-from typing import Optional
+from typing import Any, Dict, Optional
 
-from openai import AsyncOpenAI
+from pydantic import ValidationError
 
 from openbet.config import get_settings
-from openbet.llm.base import BaseLLMProvider
+from openbet.llm.base import ANALYSIS_MAX_TOKENS, BaseLLMProvider
 from openbet.llm.models import LLMAnalysisResponse, MarketContext
+from openbet.llm.openai import get_openai_client
+from openbet.llm.parsing import extract_json, parse_analysis, strip_code_fence
 
 
 class GrokProvider(BaseLLMProvider):
@@ -27,10 +29,7 @@ class GrokProvider(BaseLLMProvider):
         super().__init__(api_key, model)
 
         # xAI uses OpenAI-compatible API
-        self.client = AsyncOpenAI(
-            api_key=self.api_key,
-            base_url="https://api.x.ai/v1",
-        )
+        self.client = get_openai_client(self.api_key, "https://api.x.ai/v1")
 
     async def analyze_market(self, context: MarketContext) -> LLMAnalysisResponse:
         """Analyze market using Grok.
@@ -47,42 +46,61 @@ class GrokProvider(BaseLLMProvider):
         prompt = self._build_analysis_prompt(context)
 
         try:
-            response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=1024,
-            )
-
-            # Extract response text
-            response_text = response.choices[0].message.content
-
-            # Parse JSON response
-            # Try to extract JSON from markdown code blocks if present
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-
-            data = json.loads(response_text)
-
-            return LLMAnalysisResponse(
-                yes_confidence=float(data["yes_confidence"]),
-                no_confidence=float(data["no_confidence"]),
-                reasoning=data["reasoning"],
-                provider="grok",
-            )
+            data = await self._stream_json(prompt)
+            return parse_analysis(data, "grok")
 
         except json.JSONDecodeError as e:
             raise Exception(f"Failed to parse Grok response as JSON: {str(e)}")
-        except KeyError as e:
-            raise Exception(f"Missing required field in Grok response: {str(e)}")
+        except ValidationError as e:
+            raise Exception(f"Invalid analysis in Grok response: {str(e)}")
         except Exception as e:
             raise Exception(f"Grok API error: {str(e)}")
 
+    async def _stream_json(self, prompt: str) -> Dict[str, Any]:
+        """Stream a JSON-mode completion and return its decoded object.
+
+        The stream is closed as soon as the received text parses, so a
+        model that keeps generating after its closing brace does not hold
+        the request open until the token cap.
+
+        Args:
+            prompt: Prompt string
+
+        Returns:
+            Decoded JSON object
+
+        Raises:
+            json.JSONDecodeError: If the completion is not valid JSON
+        """
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            response_format={"type": "json_object"},
+            max_tokens=ANALYSIS_MAX_TOKENS,
+            stream=True,
+        )
+
+        chunks = []
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                chunks.append(delta)
+
+                # The object can only be complete after a closing brace
+                if "}" in delta:
+                    try:
+                        return extract_json("".join(chunks))
+                    except json.JSONDecodeError:
+                        pass
+        finally:
+            await stream.close()
+
+        return extract_json("".join(chunks))
+
     async def analyze_custom_prompt(self, prompt: str) -> str:
         """Analyze with custom prompt, return raw text response.
 
@@ -105,17 +123,8 @@ class GrokProvider(BaseLLMProvider):
             # Extract and return raw response text
             response_text = response.choices[0].message.content
 
-            # Try to extract JSON from markdown code blocks if present
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                return response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                return response_text[json_start:json_end].strip()
-
-            return response_text
+            # Unwrap JSON from a markdown code block if present
+            return strip_code_fence(response_text)
 
         except Exception as e:
             raise Exception(f"Grok API error: {str(e)}")
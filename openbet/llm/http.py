@@ -0,0 +1,145 @@
+"""Shared HTTP client for LLM provider SDKs.
+
+The pool is sized for the provider fan-out: every market analysis sends
+one request per provider (two rounds with peer feedback), and bulk scans
+analyze many markets at once, so the default of 2000 connections sits
+well above httpx's 100-connection default and in line with the providers'
+higher rate tiers. Requests beyond max_connections queue inside httpx.
+Raising the limit past what the providers' rate limits admit only holds
+more idle sockets in memory; lower it with the llm_http_max_connections
+setting on accounts with smaller quotas.
+
+Pooled connections belong to the event loop that opened them, while the
+client is created once and captured by every provider SDK. The client
+therefore sends requests through a transport that keeps one connection
+pool per running event loop. Each top-level asyncio.run() should close
+its loop's pool before the loop ends; run() does this.
+"""
+
+import asyncio
+import weakref
+from typing import Awaitable, Optional, TypeVar
+
+import httpx
+
+# Default pool size; keep-alive connections are a fixed share of it.
+LLM_MAX_CONNECTIONS = 2000
+LLM_KEEPALIVE_RATIO = 0.75
+
+# Default request timeout in seconds (SDKs may override it per request).
+LLM_HTTP_TIMEOUT = 60.0
+
+_T = TypeVar("_T")
+
+
+def _limits(max_connections: int) -> httpx.Limits:
+    """Build pool limits for a pool size."""
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=int(max_connections * LLM_KEEPALIVE_RATIO),
+    )
+
+
+class _PerLoopTransport(httpx.AsyncBaseTransport):
+    """Transport keeping a separate connection pool per event loop.
+
+    A keep-alive connection opened in one asyncio.run() cannot be used
+    from the next one, so each running loop gets its own pool. Pools of
+    loops that ended without closing them are dropped when the next pool
+    is opened.
+    """
+
+    def __init__(self, limits: httpx.Limits):
+        """Initialize transport.
+
+        Args:
+            limits: Limits of each pool opened from now on
+        """
+        self.limits = limits
+        self._pools: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def _pool(self) -> httpx.AsyncHTTPTransport:
+        """Get the connection pool of the running event loop."""
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is None:
+            # A pool's connections reference their loop, so the weak keys
+            # alone would never let go of pools left behind by ended loops
+            for stale in [other for other in self._pools if other.is_closed()]:
+                del self._pools[stale]
+            pool = self._pools[loop] = httpx.AsyncHTTPTransport(limits=self.limits)
+        return pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool().handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Close the connection pool of the running event loop."""
+        pool = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            await pool.aclose()
+
+
+_client: Optional[httpx.AsyncClient] = None
+_transport: Optional[_PerLoopTransport] = None
+
+
+def get_http_client(max_connections: Optional[int] = None) -> httpx.AsyncClient:
+    """Get or create the process-wide async HTTP client.
+
+    Passed to every provider SDK that accepts an httpx client, so
+    concurrent calls reuse one keep-alive pool instead of each SDK client
+    opening (and handshaking) its own connections.
+
+    Args:
+        max_connections: Pool size. If None, keeps the current size (or
+            uses LLM_MAX_CONNECTIONS); a different size applies to the
+            connection pools opened from then on.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _client, _transport
+    if _client is None or _client.is_closed:
+        _transport = _PerLoopTransport(_limits(max_connections or LLM_MAX_CONNECTIONS))
+        _client = httpx.AsyncClient(transport=_transport, timeout=LLM_HTTP_TIMEOUT)
+    elif (
+        max_connections is not None
+        and max_connections != _transport.limits.max_connections
+    ):
+        # The client itself holds no connections, so it is kept (providers
+        # already captured it) and only future pools get the new size
+        _transport.limits = _limits(max_connections)
+    return _client
+
+
+async def aclose_http_client() -> None:
+    """Close the shared client's connection pool for the running event loop.
+
+    The client stays usable; a later event loop opens a fresh pool.
+    """
+    if _transport is not None:
+        await _transport.aclose()
+
+
+def run(main: Awaitable[_T]) -> _T:
+    """Run a coroutine with asyncio.run, closing its HTTP connections.
+
+    Use instead of asyncio.run() for any entry point that calls the LLM
+    providers, so the loop's pooled connections are closed before the
+    loop is.
+
+    Args:
+        main: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+
+    async def _main() -> _T:
+        try:
+            return await main
+        finally:
+            await aclose_http_client()
+
+    return asyncio.run(_main())
@@ -1,14 +1,82 @@
 """LLM provider manager for orchestrating multiple providers."""
 
 import asyncio
+import hashlib
+import logging
 import random
-from typing import Dict, List, Optional
+import statistics
+import weakref
+from collections.abc import Mapping
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 
+from openbet.config import get_settings
+from openbet.llm.base import BaseLLMProvider
 from openbet.llm.claude import ClaudeProvider
 from openbet.llm.gemini import GeminiProvider
 from openbet.llm.grok import GrokProvider
+from openbet.llm.http import aclose_http_client, get_http_client
 from openbet.llm.models import LLMAnalysisResponse, MarketContext
 from openbet.llm.openai import OpenAIProvider
+from openbet.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Default maximum of in-flight requests per provider.
+DEFAULT_PROVIDER_CONCURRENCY = 50
+
+# Maximum number of provider responses kept for repeated prompts.
+RESPONSE_CACHE_SIZE = 10_000
+
+
+class _LazyProviders(Mapping):
+    """Provider registry that constructs each provider on first access.
+
+    Runs that use a single provider only pay for that provider's SDK
+    client. Construction is synchronous, so no lock is needed inside the
+    event loop. A provider that fails to initialize is reported once and
+    dropped, after which it is simply absent from the mapping.
+    """
+
+    def __init__(self, factories: Dict[str, Callable[[], BaseLLMProvider]]):
+        """Initialize registry.
+
+        Args:
+            factories: Provider name to provider constructor
+        """
+        self._factories = dict(factories)
+        self._instances: Dict[str, BaseLLMProvider] = {}
+
+    def __getitem__(self, name: str) -> BaseLLMProvider:
+        provider = self._instances.get(name)
+        if provider is None:
+            factory = self._factories[name]
+            try:
+                provider = factory()
+            except Exception as e:
+                del self._factories[name]
+                logger.warning("Failed to initialize %s provider: %s", name, e)
+                raise KeyError(name) from e
+            self._instances[name] = provider
+        return provider
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._factories
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._factories))
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+    def items(self) -> List[Tuple[str, BaseLLMProvider]]:
+        """Construct all providers, returning those that initialized."""
+        loaded = []
+        for name in self:
+            try:
+                loaded.append((name, self[name]))
+            except KeyError:
+                continue
+        return loaded
 
 
 class LLMManager:
@@ -20,6 +88,9 @@ class LLMManager:
         use_openai: bool = True,
         use_grok: bool = True,
         use_gemini: bool = True,
+        http_max_connections: Optional[int] = None,
+        provider_concurrency: Optional[Dict[str, int]] = None,
+        enable_cache: bool = True,
     ):
         """Initialize LLM manager.
 
@@ -28,35 +99,78 @@ class LLMManager:
             use_openai: Enable OpenAI provider
             use_grok: Enable Grok provider
             use_gemini: Enable Gemini provider
+            http_max_connections: Size of the providers' shared connection
+                pool. If None, uses config value.
+            provider_concurrency: Maximum in-flight requests per provider
+                name; providers not listed get DEFAULT_PROVIDER_CONCURRENCY
+            enable_cache: Reuse a provider's analysis when it is asked the
+                same prompt again within the configured TTL
         """
-        self.providers = {}
+        settings = get_settings()
+        get_http_client(http_max_connections or settings.llm_http_max_connections)
+
+        factories = {
+            name: factory
+            for name, factory, enabled in (
+                ("claude", ClaudeProvider, use_claude),
+                ("openai", OpenAIProvider, use_openai),
+                ("grok", GrokProvider, use_grok),
+                ("gemini", GeminiProvider, use_gemini),
+            )
+            if enabled
+        }
+        self.providers = _LazyProviders(factories)
 
-        if use_claude:
-            try:
-                self.providers["claude"] = ClaudeProvider()
-            except Exception as e:
-                print(f"Warning: Failed to initialize Claude provider: {e}")
+        if not self.providers:
+            raise Exception("No LLM providers available")
 
-        if use_openai:
-            try:
-                self.providers["openai"] = OpenAIProvider()
-            except Exception as e:
-                print(f"Warning: Failed to initialize OpenAI provider: {e}")
+        self.provider_concurrency = {
+            name: (provider_concurrency or {}).get(name, DEFAULT_PROVIDER_CONCURRENCY)
+            for name in self.providers
+        }
+        # asyncio semaphores bind to the event loop they first block in, and
+        # callers may drive this manager from several asyncio.run() calls,
+        # so each loop gets its own set
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+        # Successful analyses keyed on (provider, model, prompt digest), so
+        # retries and replays of an unchanged market are not paid for twice
+        self.response_cache: Optional[TTLCache] = (
+            TTLCache(maxsize=RESPONSE_CACHE_SIZE, ttl=settings.llm_response_cache_ttl)
+            if enable_cache and settings.llm_response_cache_ttl > 0
+            else None
+        )
+
+    def concurrency_limit(self, name: str) -> asyncio.Semaphore:
+        """Get the semaphore bounding in-flight requests to a provider.
+
+        Use as ``async with manager.concurrency_limit(name):`` around any
+        direct provider call so that bulk callers queue locally instead of
+        running into the provider's rate limits.
 
-        if use_grok:
-            try:
-                self.providers["grok"] = GrokProvider()
-            except Exception as e:
-                print(f"Warning: Failed to initialize Grok provider: {e}")
+        Args:
+            name: Provider name
 
-        if use_gemini:
-            try:
-                self.providers["gemini"] = GeminiProvider()
-            except Exception as e:
-                print(f"Warning: Failed to initialize Gemini provider: {e}")
+        Returns:
+            Semaphore for the provider in the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.get(loop)
+        if semaphores is None:
+            semaphores = self._semaphores[loop] = {
+                provider: asyncio.Semaphore(limit)
+                for provider, limit in self.provider_concurrency.items()
+            }
+        return semaphores[name]
 
-        if not self.providers:
-            raise Exception("No LLM providers available")
+    async def aclose(self) -> None:
+        """Close the providers' HTTP connections of the running event loop.
+
+        Entry points that run analyses through openbet.llm.http.run() get
+        this on exit; call it at the end of any other event loop that used
+        the manager. The manager stays usable from later event loops.
+        """
+        await aclose_http_client()
 
     def get_available_providers(self) -> List[str]:
         """Get list of available provider names.
@@ -78,21 +192,96 @@ class LLMManager:
             Dictionary mapping provider names to their responses
             (None if provider failed)
         """
-        tasks = {}
-        for name, provider in self.providers.items():
-            tasks[name] = asyncio.create_task(self._safe_analyze(name, provider, context))
+        results: Dict[str, Optional[LLMAnalysisResponse]] = {
+            name: None for name, _ in self.providers.items()
+        }
+        async for name, response in self.analyze_stream(context):
+            results[name] = response
+        return results
 
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks.values())
+    async def analyze_until_consensus(
+        self,
+        context: MarketContext,
+        agree_threshold: int = 3,
+        tolerance: float = 0.1,
+    ) -> Dict[str, Optional[LLMAnalysisResponse]]:
+        """Analyze market with all providers, stopping once enough agree.
 
-        # Map results back to provider names
-        return dict(zip(tasks.keys(), results))
+        Responses are collected as they arrive; as soon as at least
+        agree_threshold of them have a YES confidence within tolerance of
+        the median so far, the remaining providers are cancelled, since
+        their answers can no longer change the outcome.
+
+        Args:
+            context: Market context information
+            agree_threshold: Number of agreeing providers that ends the round
+            tolerance: Maximum distance from the median YES confidence
+
+        Returns:
+            Dictionary mapping provider names to their responses
+            (None if the provider failed or was cancelled)
+        """
+        results: Dict[str, Optional[LLMAnalysisResponse]] = {
+            name: None for name, _ in self.providers.items()
+        }
+        stream = self.analyze_stream(context)
+        try:
+            async for name, response in stream:
+                results[name] = response
+
+                confidences = [r.yes_confidence for r in results.values() if r]
+                if len(confidences) < agree_threshold:
+                    continue
+                median = statistics.median(confidences)
+                agreeing = sum(abs(c - median) < tolerance for c in confidences)
+                if agreeing >= agree_threshold:
+                    break
+        finally:
+            # Cancels the providers still running
+            await stream.aclose()
+        return results
+
+    async def analyze_stream(
+        self, context: MarketContext
+    ) -> AsyncIterator[Tuple[str, Optional[LLMAnalysisResponse]]]:
+        """Analyze market with all providers, yielding responses as they arrive.
+
+        All providers run concurrently; each (name, response) pair is
+        yielded as soon as that provider finishes, so consumers can act on
+        the fastest responses without waiting for the slowest. Closing the
+        iterator early cancels the providers still running.
+
+        Args:
+            context: Market context information
+
+        Yields:
+            (provider name, response) tuples in completion order
+            (response is None if the provider failed)
+        """
+        names = {
+            asyncio.create_task(self._safe_analyze(name, provider, context)): name
+            for name, provider in self.providers.items()
+        }
+        pending = set(names)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield names[task], task.result()
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def _safe_analyze(
         self, name: str, provider, context: MarketContext
     ) -> Optional[LLMAnalysisResponse]:
         """Safely analyze market with a provider, catching exceptions.
 
+        A cached response for the same prompt is returned without calling
+        the provider; failures are never cached.
+
         Args:
             name: Provider name
             provider: Provider instance
@@ -101,12 +290,74 @@ class LLMManager:
         Returns:
             Analysis response or None if failed
         """
+        cache_key = None
+        if self.response_cache is not None:
+            prompt = provider._build_analysis_prompt(context)
+            cache_key = (
+                name,
+                provider.model,
+                hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest(),
+            )
+            response = self.response_cache.get(cache_key)
+            if response is not None:
+                return response
+
         try:
-            return await provider.analyze_market(context)
+            async with self.concurrency_limit(name):
+                response = await provider.analyze_market(context)
         except Exception as e:
-            print(f"Warning: {name} provider failed: {e}")
+            logger.warning("%s provider failed: %s", name, e)
             return None
 
+        if cache_key is not None:
+            self.response_cache.set(cache_key, response)
+        return response
+
+    async def analyze_markets_batch(
+        self, contexts: List[MarketContext]
+    ) -> Dict[str, List[Optional[LLMAnalysisResponse]]]:
+        """Analyze many markets with all providers, one batch per provider.
+
+        Providers with a batch API (Claude, OpenAI) submit a single batch
+        job; the others analyze the markets concurrently. Batch jobs trade
+        latency for cost, so use this for bulk scoring, not interactive
+        analysis.
+
+        Args:
+            contexts: Market context information for each market
+
+        Returns:
+            Dictionary mapping provider names to responses in the order of
+            contexts (None where a market's analysis failed)
+        """
+        providers = self.providers.items()
+        results = await asyncio.gather(
+            *(
+                self._safe_analyze_batch(name, provider, contexts)
+                for name, provider in providers
+            )
+        )
+        return dict(zip((name for name, _ in providers), results))
+
+    async def _safe_analyze_batch(
+        self, name: str, provider, contexts: List[MarketContext]
+    ) -> List[Optional[LLMAnalysisResponse]]:
+        """Safely run a provider's batch analysis, catching exceptions.
+
+        Args:
+            name: Provider name
+            provider: Provider instance
+            contexts: Market contexts
+
+        Returns:
+            Analysis responses, all None if the batch failed
+        """
+        try:
+            return await provider.analyze_batch(contexts)
+        except Exception as e:
+            logger.warning("%s batch failed: %s", name, e)
+            return [None] * len(contexts)
+
     async def analyze_with_provider(
         self, provider_name: str, context: MarketContext
     ) -> LLMAnalysisResponse:
@@ -123,11 +374,12 @@ class LLMManager:
             ValueError: If provider not found
             Exception: If analysis fails
         """
-        if provider_name not in self.providers:
+        try:
+            provider = self.providers[provider_name]
+        except KeyError:
             raise ValueError(f"Provider '{provider_name}' not available")
-
-        provider = self.providers[provider_name]
-        return await provider.analyze_market(context)
+        async with self.concurrency_limit(provider_name):
+            return await provider.analyze_market(context)
 
     async def analyze_with_peer_feedback(
         self,
@@ -154,6 +406,11 @@ class LLMManager:
             # No successful providers to do Round 2
             return {}
 
+        if len(successful_providers) == 1:
+            # A lone provider has no peers to learn from, so its Round 2
+            # prompt would carry nothing new; keep its Round 1 answer
+            return dict(successful_providers)
+
         tasks = {}
         for provider_name, own_response in successful_providers.items():
             # Get peer responses (all providers except this one)
@@ -179,14 +436,16 @@ class LLMManager:
                     "reasoning": peer_resp.reasoning
                 })
 
-            # Create modified context with peer feedback
-            modified_context = context.model_copy(deep=True)
-            modified_context.metadata["peer_analyses"] = anonymized_peers
-            modified_context.metadata["own_previous_response"] = {
-                "yes_confidence": own_response.yes_confidence,
-                "no_confidence": own_response.no_confidence,
-                "reasoning": own_response.reasoning
-            }
+            # Create modified context with peer feedback; the copy leaves
+            # the shared context intact and keeps its rendered prompt text
+            modified_context = context.with_metadata(
+                peer_analyses=anonymized_peers,
+                own_previous_response={
+                    "yes_confidence": own_response.yes_confidence,
+                    "no_confidence": own_response.no_confidence,
+                    "reasoning": own_response.reasoning
+                },
+            )
 
             # Create task for this provider
             if provider_name in self.providers:
@@ -203,3 +462,42 @@ class LLMManager:
 
         # Map results back to provider names
         return dict(zip(tasks.keys(), results))
+
+
+# Shared managers, keyed by which providers are enabled.
+_managers: Dict[Tuple[bool, bool, bool, bool], LLMManager] = {}
+
+
+def get_llm_manager(
+    use_claude: bool = True,
+    use_openai: bool = True,
+    use_grok: bool = True,
+    use_gemini: bool = True,
+) -> LLMManager:
+    """Get or create the shared LLM manager for a provider selection.
+
+    Providers and their SDK clients are built once per process and reused
+    by every caller, so callers must not modify the returned manager's
+    providers. The manager works from any number of event loops; run each
+    loop with openbet.llm.http.run() (or call aclose() before it ends) so
+    the loop's pooled connections are closed.
+
+    Args:
+        use_claude: Enable Claude provider
+        use_openai: Enable OpenAI provider
+        use_grok: Enable Grok provider
+        use_gemini: Enable Gemini provider
+
+    Returns:
+        Shared LLMManager instance
+    """
+    key = (use_claude, use_openai, use_grok, use_gemini)
+    manager = _managers.get(key)
+    if manager is None:
+        manager = _managers[key] = LLMManager(
+            use_claude=use_claude,
+            use_openai=use_openai,
+            use_grok=use_grok,
+            use_gemini=use_gemini,
+        )
+    return manager
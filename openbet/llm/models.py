@@ -1,5 +1,7 @@
 """Models for LLM provider requests and responses."""
 
+import copy
+from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, Field
@@ -14,8 +16,51 @@ class LLMAnalysisResponse(BaseModel):
     provider: Optional[str] = Field(None, description="Provider name")
 
 
-class MarketContext(BaseModel):
-    """Context information for market analysis."""
+class LLMAnalysisOutput(BaseModel):
+    """Fields a provider must return; used as its structured-output schema."""
+
+    yes_confidence: float = Field(..., description="Confidence in YES (0-1)")
+    no_confidence: float = Field(..., description="Confidence in NO (0-1)")
+    reasoning: str = Field(..., description="Explanation for the confidence scores")
+
+
+# Prompt text of a market context. Optional sections render to "" when
+# their data is missing; each one that is present starts on a new line
+# (sections after the header are set off by a blank line).
+_CONTEXT_TEMPLATE = (
+    "Market: {title}\n"
+    "Market ID: {market_id}"
+    "{status}{close_time}{prices}{position}{metrics}{history}"
+)
+_PRICES_TEMPLATE = "\n\nCurrent Prices:\n  YES: ${yes:.2f}\n  NO: ${no:.2f}"
+_POSITION_TEMPLATE = (
+    "\n\nYour Current Position:\n"
+    "  Side: {side}\n"
+    "  Quantity: {quantity}\n"
+    "  Avg Price: ${avg_price:.2f}"
+)
+_HISTORY_ENTRY_TEMPLATE = (
+    "\n  Analysis #{index}:\n"
+    "    Timestamp: {timestamp}\n"
+    "    Consensus YES: {yes:.1%}\n"
+    "    Consensus NO: {no:.1%}"
+)
+
+# MarketContext fields shown as floats in the prompt text.
+_FLOAT_FIELDS = (
+    "yes_price", "no_price", "position_avg_price", "position_pnl",
+    "volume_24h", "liquidity_depth",
+)
+
+
+@dataclass(slots=True)
+class MarketContext:
+    """Context information for market analysis.
+
+    Built internally (by ContextBuilder) from already validated data, so
+    it is a plain dataclass rather than a pydantic model; price and metric
+    fields are still normalized to float, as the prompt text shows them.
+    """
 
     market_id: str
     title: str
@@ -39,58 +84,98 @@ class MarketContext(BaseModel):
     open_interest: Optional[int] = None
 
     # Historical analysis
-    historical_analyses: list[Dict[str, Any]] = Field(default_factory=list)
+    historical_analyses: list[Dict[str, Any]] = field(default_factory=list)
 
     # Additional metadata
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    # Rendered prompt text; every provider (and round) prompts with the
+    # same context, so it is built once. Contexts are not modified after
+    # they are handed to the providers.
+    _prompt_text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for name in _FLOAT_FIELDS:
+            value = getattr(self, name)
+            if value is not None and type(value) is not float:
+                setattr(self, name, float(value))
+
+    def with_metadata(self, **entries: Any) -> "MarketContext":
+        """Return a shallow copy whose metadata has entries added.
+
+        The copy shares every other field, including the rendered prompt
+        text, which does not depend on metadata.
+
+        Args:
+            **entries: Metadata keys and values to add
+
+        Returns:
+            New context; this one is left unchanged
+        """
+        context = copy.copy(self)
+        context.metadata = {**self.metadata, **entries}
+        return context
 
     def to_prompt_text(self) -> str:
         """Convert context to text suitable for LLM prompt."""
-        parts = [
-            f"Market: {self.title}",
-            f"Market ID: {self.market_id}",
-        ]
-
-        if self.status:
-            parts.append(f"Status: {self.status}")
-
-        if self.close_time:
-            parts.append(f"Closes: {self.close_time}")
-
-        if self.yes_price is not None and self.no_price is not None:
-            parts.append(f"\nCurrent Prices:")
-            parts.append(f"  YES: ${self.yes_price:.2f}")
-            parts.append(f"  NO: ${self.no_price:.2f}")
-
-        if self.has_position:
-            parts.append(f"\nYour Current Position:")
-            parts.append(f"  Side: {self.position_side}")
-            parts.append(f"  Quantity: {self.position_quantity}")
-            parts.append(f"  Avg Price: ${self.position_avg_price:.2f}")
-            if self.position_pnl:
-                parts.append(f"  Unrealized P&L: ${self.position_pnl:.2f}")
-
-        if self.volume_24h or self.liquidity_depth or self.open_interest:
-            parts.append(f"\nMarket Metrics:")
-            if self.volume_24h:
-                parts.append(f"  24h Volume: {self.volume_24h}")
-            if self.liquidity_depth:
-                parts.append(f"  Liquidity Depth: {self.liquidity_depth}")
-            if self.open_interest:
-                parts.append(f"  Open Interest: {self.open_interest}")
-
-        if self.historical_analyses:
-            parts.append(f"\nHistorical Analysis:")
-            for i, analysis in enumerate(self.historical_analyses[:3], 1):
-                parts.append(f"  Analysis #{i}:")
-                parts.append(
-                    f"    Timestamp: {analysis.get('analysis_timestamp', 'N/A')}"
-                )
-                parts.append(
-                    f"    Consensus YES: {analysis.get('consensus_yes_confidence', 0):.1%}"
-                )
-                parts.append(
-                    f"    Consensus NO: {analysis.get('consensus_no_confidence', 0):.1%}"
-                )
-
-        return "\n".join(parts)
+        if self._prompt_text is None:
+            self._prompt_text = self._render_prompt_text()
+        return self._prompt_text
+
+    def _render_prompt_text(self) -> str:
+        """Render the context as prompt text."""
+        return _CONTEXT_TEMPLATE.format(
+            title=self.title,
+            market_id=self.market_id,
+            status=f"\nStatus: {self.status}" if self.status else "",
+            close_time=f"\nCloses: {self.close_time}" if self.close_time else "",
+            prices=(
+                _PRICES_TEMPLATE.format(yes=self.yes_price, no=self.no_price)
+                if self.yes_price is not None and self.no_price is not None
+                else ""
+            ),
+            position=self._position_block(),
+            metrics=self._metrics_block(),
+            history=self._history_block(),
+        )
+
+    def _position_block(self) -> str:
+        """Render the current position, or "" without one."""
+        if not self.has_position:
+            return ""
+
+        block = _POSITION_TEMPLATE.format(
+            side=self.position_side,
+            quantity=self.position_quantity,
+            avg_price=self.position_avg_price,
+        )
+        if self.position_pnl:
+            block += f"\n  Unrealized P&L: ${self.position_pnl:.2f}"
+        return block
+
+    def _metrics_block(self) -> str:
+        """Render the market metrics that are set, or "" if none are."""
+        if not (self.volume_24h or self.liquidity_depth or self.open_interest):
+            return ""
+
+        return (
+            "\n\nMarket Metrics:"
+            + (f"\n  24h Volume: {self.volume_24h}" if self.volume_24h else "")
+            + (f"\n  Liquidity Depth: {self.liquidity_depth}" if self.liquidity_depth else "")
+            + (f"\n  Open Interest: {self.open_interest}" if self.open_interest else "")
+        )
+
+    def _history_block(self) -> str:
+        """Render the three most recent analyses, or "" without history."""
+        if not self.historical_analyses:
+            return ""
+
+        return "\n\nHistorical Analysis:" + "".join(
+            _HISTORY_ENTRY_TEMPLATE.format(
+                index=i,
+                timestamp=analysis.get("analysis_timestamp", "N/A"),
+                yes=analysis.get("consensus_yes_confidence", 0),
+                no=analysis.get("consensus_no_confidence", 0),
+            )
+            for i, analysis in enumerate(self.historical_analyses[:3], 1)
+        )
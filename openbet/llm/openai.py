@@ -1,13 +1,84 @@
 """OpenAI LLM provider implementation."""
 
 import json
-from typing import Optional
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 
+import httpx
 from openai import AsyncOpenAI
+from pydantic import ValidationError
 
 from openbet.config import get_settings
 from openbet.llm.base import BaseLLMProvider
+from openbet.llm.http import get_http_client
 from openbet.llm.models import LLMAnalysisResponse, MarketContext
+from openbet.llm.parsing import parse_analysis
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is an optional speedup
+    from json import loads as json_loads
+
+logger = logging.getLogger(__name__)
+
+# Batch jobs run chat completions; a job is over in any of these states.
+_BATCH_ENDPOINT = "/v1/chat/completions"
+_BATCH_FINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Several markets packed into one request share a single copy of the
+# instructions; each market's output gets its own token allowance.
+_MULTI_MARKET_PROMPT_HEADER = """You are an expert betting analyst. Analyze each of the following prediction markets and provide confidence scores for YES and NO outcomes.
+
+For every market, provide:
+1. Your confidence score for YES (0.0 to 1.0)
+2. Your confidence score for NO (0.0 to 1.0)
+3. Your reasoning for these confidence scores
+
+Consider:
+- Current market prices and sentiment
+- Any historical analysis trends
+- Market metrics like volume and liquidity
+- Time remaining until market close
+- Current position (if any) and its implications
+
+Respond in JSON format, with one entry per market:
+{
+    "results": [
+        {
+            "market_id": "<the market's Market ID>",
+            "yes_confidence": <float between 0 and 1>,
+            "no_confidence": <float between 0 and 1>,
+            "reasoning": "<your detailed reasoning>"
+        }
+    ]
+}
+"""
+_MULTI_MARKET_TOKENS_PER_MARKET = 1024
+
+
+def get_openai_client(api_key: str, base_url: Optional[str] = None) -> AsyncOpenAI:
+    """Get the shared OpenAI-compatible client for an API key and endpoint.
+
+    Providers built again (e.g. by a second LLMManager) reuse the existing
+    SDK client instead of constructing a new one around the shared pool.
+
+    Args:
+        api_key: API key
+        base_url: API base URL. If None, uses OpenAI's.
+
+    Returns:
+        AsyncOpenAI client using the shared HTTP client
+    """
+    return _openai_client(api_key, base_url, get_http_client())
+
+
+@lru_cache(maxsize=8)
+def _openai_client(
+    api_key: str, base_url: Optional[str], http_client: httpx.AsyncClient
+) -> AsyncOpenAI:
+    """Build a client; keyed on the HTTP client so a new pool gets a new one."""
+    return AsyncOpenAI(api_key=api_key, base_url=base_url, http_client=http_client)
 
 
 class OpenAIProvider(BaseLLMProvider):
@@ -25,7 +96,42 @@ class OpenAIProvider(BaseLLMProvider):
         model = model or settings.default_llm_model_openai
 
         super().__init__(api_key, model)
-        self.client = AsyncOpenAI(api_key=self.api_key)
+        self.client = get_openai_client(self.api_key)
+
+    def _analysis_body(self, context: MarketContext) -> Dict[str, Any]:
+        """Build the chat completion request body of a market analysis.
+
+        Args:
+            context: Market context information
+
+        Returns:
+            Request body
+        """
+        return {
+            "model": self.model,
+            "messages": [{"role": "user", "content": self._build_analysis_prompt(context)}],
+            "response_format": {"type": "json_object"},
+            "max_completion_tokens": 1024,
+        }
+
+    @staticmethod
+    def _parse_analysis(response_text: Optional[str]) -> LLMAnalysisResponse:
+        """Build an analysis response from the JSON content of a completion.
+
+        Args:
+            response_text: Message content returned by the model
+
+        Returns:
+            Analysis response with confidence scores
+
+        Raises:
+            Exception: If the content is empty
+            ValidationError: If the content is not a valid analysis
+        """
+        if not response_text:
+            raise Exception("OpenAI returned empty response")
+
+        return parse_analysis(response_text, "openai")
 
     async def analyze_market(self, context: MarketContext) -> LLMAnalysisResponse:
         """Analyze market using OpenAI.
@@ -39,14 +145,9 @@ class OpenAIProvider(BaseLLMProvider):
         Raises:
             Exception: If API call fails or response parsing fails
         """
-        prompt = self._build_analysis_prompt(context)
-
         try:
             response = await self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                response_format={"type": "json_object"},
-                max_completion_tokens=1024,
+                **self._analysis_body(context)
             )
 
             # Extract response text
@@ -56,28 +157,152 @@ class OpenAIProvider(BaseLLMProvider):
             if hasattr(message, 'refusal') and message.refusal:
                 raise Exception(f"OpenAI refused to respond: {message.refusal}")
 
-            response_text = message.content
+            return self._parse_analysis(message.content)
 
-            if not response_text:
-                raise Exception(f"OpenAI returned empty response. Full response: {response}")
+        except ValidationError as e:
+            raise Exception(f"Invalid analysis in OpenAI response: {str(e)}")
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}")
+
+    async def analyze_markets(
+        self, contexts: List[MarketContext]
+    ) -> List[Optional[LLMAnalysisResponse]]:
+        """Analyze several markets with a single chat completion.
 
-            # Parse JSON response
-            data = json.loads(response_text)
+        The markets are listed in one prompt and the model answers with a
+        JSON array keyed by market ID, so N markets cost one round trip and
+        one copy of the instructions instead of N.
+
+        Args:
+            contexts: Market context information for each market
+
+        Returns:
+            Analysis responses in the order of contexts (None where the
+            model returned no valid entry for the market)
 
-            return LLMAnalysisResponse(
-                yes_confidence=float(data["yes_confidence"]),
-                no_confidence=float(data["no_confidence"]),
-                reasoning=data["reasoning"],
-                provider="openai",
+        Raises:
+            Exception: If API call fails or the response is not valid JSON
+        """
+        if not contexts:
+            return []
+
+        blocks = "\n\n".join(
+            f"### Market {i}\n{context.to_prompt_text()}"
+            for i, context in enumerate(contexts, 1)
+        )
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "user", "content": _MULTI_MARKET_PROMPT_HEADER + "\n" + blocks}
+                ],
+                response_format={"type": "json_object"},
+                max_completion_tokens=_MULTI_MARKET_TOKENS_PER_MARKET * len(contexts),
             )
 
+            message = response.choices[0].message
+            refusal = getattr(message, "refusal", None)
+            if refusal:
+                raise Exception(f"OpenAI refused to respond: {refusal}")
+            if not message.content:
+                raise Exception("OpenAI returned empty response")
+
+            data = json_loads(message.content)
+
         except json.JSONDecodeError as e:
             raise Exception(f"Failed to parse OpenAI response as JSON: {str(e)}")
-        except KeyError as e:
-            raise Exception(f"Missing required field in OpenAI response: {str(e)}")
         except Exception as e:
             raise Exception(f"OpenAI API error: {str(e)}")
 
+        positions: Dict[str, List[int]] = {}
+        for i, context in enumerate(contexts):
+            positions.setdefault(context.market_id, []).append(i)
+
+        responses: List[Optional[LLMAnalysisResponse]] = [None] * len(contexts)
+        results = data.get("results") if isinstance(data, dict) else None
+        for entry in results or []:
+            market_id = entry.get("market_id") if isinstance(entry, dict) else None
+            if market_id not in positions:
+                continue
+            try:
+                analysis = parse_analysis(entry, "openai")
+            except ValidationError as e:
+                logger.warning("Invalid OpenAI analysis for %s: %s", market_id, e)
+                continue
+            for i in positions[market_id]:
+                responses[i] = analysis
+        return responses
+
+    async def analyze_batch(
+        self, contexts: List[MarketContext]
+    ) -> List[Optional[LLMAnalysisResponse]]:
+        """Analyze several markets through the Batch API.
+
+        The requests are uploaded as one JSONL file and run as a single
+        batch job (billed at the batch discount, outside the per-minute
+        rate limits), which is polled until it reaches a final status.
+        Batches can take minutes to hours, so this is meant for bulk jobs.
+
+        Args:
+            contexts: Market context information for each market
+
+        Returns:
+            Analysis responses in the order of contexts (None where the
+            request failed or could not be parsed)
+        """
+        if not contexts:
+            return []
+
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": str(i),
+                    "method": "POST",
+                    "url": _BATCH_ENDPOINT,
+                    "body": self._analysis_body(context),
+                }
+            )
+            for i, context in enumerate(contexts)
+        ]
+        input_file = await self.client.files.create(
+            file=("analyses.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=_BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        batch = await self._wait_for_batch(
+            lambda: self.client.batches.retrieve(batch.id),
+            lambda current: current.status in _BATCH_FINAL_STATUSES,
+        )
+
+        responses: List[Optional[LLMAnalysisResponse]] = [None] * len(contexts)
+        if not batch.output_file_id:
+            logger.warning("OpenAI batch %s %s without output", batch.id, batch.status)
+            return responses
+
+        output = await self.client.files.content(batch.output_file_id)
+        for line in output.content.splitlines():
+            if not line:
+                continue
+            entry = json_loads(line)
+            custom_id = entry["custom_id"]
+            try:
+                response = entry.get("response") or {}
+                if response.get("status_code") != 200:
+                    raise Exception(entry.get("error") or response)
+
+                message = response["body"]["choices"][0]["message"]
+                if message.get("refusal"):
+                    raise Exception(f"OpenAI refused to respond: {message['refusal']}")
+
+                responses[int(custom_id)] = self._parse_analysis(message.get("content"))
+            except Exception as e:
+                logger.warning("OpenAI batch request %s failed: %s", custom_id, e)
+        return responses
+
     async def analyze_custom_prompt(self, prompt: str) -> str:
         """Analyze with custom prompt, return raw text response.
 
@@ -0,0 +1,97 @@
+"""Helpers for extracting JSON and analyses from LLM response text."""
+
+import json
+import re
+from typing import Any, Dict, Mapping, Union
+
+from pydantic import ValidationError
+
+from openbet.llm.models import LLMAnalysisOutput, LLMAnalysisResponse
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is an optional speedup
+    from json import loads as json_loads
+
+# Markdown code fences around a JSON payload; a ```json fence is preferred
+# over a bare one. A missing closing fence runs to the end of the text.
+_JSON_FENCE_RE = re.compile(r"```json(.*?)(?:```|\Z)", re.DOTALL)
+_FENCE_RE = re.compile(r"```(.*?)(?:```|\Z)", re.DOTALL)
+
+
+def strip_code_fence(text: str) -> str:
+    """Return the contents of the first markdown code block in text.
+
+    Args:
+        text: Raw response text
+
+    Returns:
+        Stripped contents of the ```json (or bare ```) block, or text
+        unchanged when it has no code block
+    """
+    if "```" not in text:
+        return text
+
+    match = _JSON_FENCE_RE.search(text) or _FENCE_RE.search(text)
+    return match.group(1).strip()
+
+
+def extract_json(text: str) -> Dict[str, Any]:
+    """Parse a JSON object from response text.
+
+    Most responses are bare JSON and are parsed directly; only when that
+    fails is the text searched for a markdown code block.
+
+    Args:
+        text: Raw response text
+
+    Returns:
+        Decoded JSON object
+
+    Raises:
+        json.JSONDecodeError: If no valid JSON is found
+    """
+    try:
+        return json_loads(text)
+    except json.JSONDecodeError:
+        if "```" not in text:
+            raise
+    return json_loads(strip_code_fence(text))
+
+
+def parse_analysis(
+    payload: Union[str, bytes, Mapping[str, Any]], provider: str
+) -> LLMAnalysisResponse:
+    """Validate a provider's analysis output into an analysis response.
+
+    JSON text is validated directly by pydantic-core without building an
+    intermediate dict; text wrapped in a markdown code block is retried on
+    the block's contents.
+
+    Args:
+        payload: JSON text, or an already decoded object (e.g. tool input)
+        provider: Provider name recorded on the response
+
+    Returns:
+        Analysis response with confidence scores
+
+    Raises:
+        ValidationError: If the payload is not valid JSON, a required field
+            is missing, or a confidence is out of range
+    """
+    if isinstance(payload, (str, bytes)):
+        try:
+            output = LLMAnalysisOutput.model_validate_json(payload)
+        except ValidationError:
+            if not isinstance(payload, str) or "```" not in payload:
+                raise
+            output = LLMAnalysisOutput.model_validate_json(strip_code_fence(payload))
+    else:
+        output = LLMAnalysisOutput.model_validate(payload)
+
+    return LLMAnalysisResponse(
+        yes_confidence=output.yes_confidence,
+        no_confidence=output.no_confidence,
+        reasoning=output.reasoning,
+        provider=provider,
+    )
@@ -2,10 +2,11 @@
 Pydantic models for trading operations.
 """
 
+import json
 from datetime import datetime
-from typing import List, Literal, Optional
+from typing import Any, FrozenSet, List, Literal, Mapping, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 
 class TradingSignal(BaseModel):
@@ -45,8 +46,30 @@ class TradingSignal(BaseModel):
     risk_warnings: List[str] = Field(default_factory=list)
     passed_filters: bool = True
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    @classmethod
+    def from_db_row(cls, row: Mapping[str, Any]) -> "TradingSignal":
+        """Rebuild a stored signal from a trading_signals row.
+
+        Stored signals were validated when they were generated, so the
+        model is built with model_construct and no re-validation; only the
+        storage encodings are undone (id column, timestamp text, and the
+        risk fields kept in metadata).
+        """
+        fields = {name: row[name] for name in cls.model_fields if name in row}
+        fields["signal_id"] = row.get("id")
+
+        timestamp = row.get("signal_timestamp")
+        if isinstance(timestamp, str):
+            fields["signal_timestamp"] = datetime.fromisoformat(timestamp)
+
+        metadata = row.get("metadata")
+        if isinstance(metadata, (str, bytes)):
+            metadata = json.loads(metadata)
+        if metadata:
+            fields["risk_warnings"] = metadata.get("risk_warnings", [])
+            fields["passed_filters"] = metadata.get("passed_filters", True)
+
+        return cls.model_construct(**fields)
 
 
 class TradeDecision(BaseModel):
@@ -70,9 +93,6 @@ class TradeDecision(BaseModel):
     position_id: Optional[int] = None
     realized_pnl: Optional[float] = None
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
-
 
 class RiskConfig(BaseModel):
     """Risk management configuration."""
@@ -82,3 +102,17 @@ class RiskConfig(BaseModel):
     max_position_size: int = 100
     max_spread: float = 0.10  # 10% max bid-ask spread
     allowed_statuses: List[str] = Field(default_factory=lambda: ["open", "active"])
+
+    # allowed_statuses as a set, built once for the per-signal status check
+    _allowed_status_set: FrozenSet[str] = PrivateAttr(default=frozenset())
+
+    @model_validator(mode="after")
+    def _build_allowed_status_set(self) -> "RiskConfig":
+        """Precompute the allowed status set after validation."""
+        self._allowed_status_set = frozenset(self.allowed_statuses)
+        return self
+
+    @property
+    def allowed_status_set(self) -> FrozenSet[str]:
+        """Allowed market statuses, for O(1) membership checks."""
+        return self._allowed_status_set
@@ -2,7 +2,8 @@
 Risk management filters for trading signals.
 """
 
-from typing import Dict, List, Tuple, Any
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from openbet.trading.models import RiskConfig, TradingSignal
 
@@ -30,65 +31,134 @@ def apply_risk_filters(
         4. Market status check (must be in allowed statuses)
         5. Spread check (if applicable)
     """
-    warnings = []
-    passed = True
-
-    # Extract market data
-    liquidity = signal.liquidity_depth or 0
-    volume = signal.volume_24h or 0
-    position_size = signal.recommended_quantity
-    status = market.get("status", "unknown")
-
-    # 1. Minimum liquidity check
-    if liquidity < risk_config.min_liquidity:
-        warnings.append(
-            f"Low liquidity: {liquidity:.2f} < {risk_config.min_liquidity:.2f}"
-        )
-        passed = False
+    return _risk_filter(risk_config)(signal, market)
 
-    # 2. Minimum volume check
-    if volume < risk_config.min_volume_24h:
-        warnings.append(
-            f"Low 24h volume: {volume:.2f} < {risk_config.min_volume_24h:.2f}"
-        )
-        passed = False
 
-    # 3. Maximum position size enforcement
-    if position_size > risk_config.max_position_size:
-        warnings.append(
-            f"Position too large: {position_size} > {risk_config.max_position_size} (will be capped)"
-        )
-        # Don't fail, just warn - will be capped during sizing
+def apply_risk_filters_batch(
+    signals: Sequence[TradingSignal],
+    markets: Sequence[Dict[str, Any]],
+    risk_config: RiskConfig,
+) -> List[Tuple[bool, List[str]]]:
+    """
+    Apply risk management filters to many trading signals.
 
-    # 4. Market status check
-    if status not in risk_config.allowed_statuses:
-        warnings.append(
-            f"Market status '{status}' not in allowed list: {risk_config.allowed_statuses}"
-        )
-        passed = False
-
-    # 5. Spread check (if we have price data)
-    # Calculate spread from recommended price assumptions
-    if signal.market_yes_prob > 0 and signal.market_no_prob > 0:
-        # Estimate spread based on YES/NO price consistency
-        # For a fair market: yes_price + no_price ≈ 1.0
-        # Large deviation suggests wide spread
-        price_sum = signal.market_yes_prob + signal.market_no_prob
-        spread_indicator = abs(price_sum - 1.0)
-
-        if spread_indicator > risk_config.max_spread:
+    Equivalent to calling apply_risk_filters for each signal, but the risk
+    configuration is read once for the whole batch.
+
+    Args:
+        signals: Trading signals to evaluate
+        markets: Market data dictionary of each signal, in the same order
+        risk_config: Risk configuration parameters
+
+    Returns:
+        List of (passed: bool, warnings: List[str]), one per signal
+    """
+    check = _risk_filter(risk_config)
+    return [check(signal, market) for signal, market in zip(signals, markets)]
+
+
+def _risk_filter(
+    risk_config: RiskConfig,
+) -> Callable[[TradingSignal, Dict[str, Any]], Tuple[bool, List[str]]]:
+    """Build the filter function of apply_risk_filters for a configuration.
+
+    The thresholds are bound as locals once, so evaluating a batch of
+    signals does not repeat the attribute lookups for every signal.
+    """
+    min_liquidity = risk_config.min_liquidity
+    min_volume_24h = risk_config.min_volume_24h
+    max_position_size = risk_config.max_position_size
+    max_spread = risk_config.max_spread
+    allowed_status_set = risk_config.allowed_status_set
+
+    def check(signal: TradingSignal, market: Dict[str, Any]) -> Tuple[bool, List[str]]:
+        warnings = []
+        passed = True
+
+        # Extract market data
+        liquidity = signal.liquidity_depth or 0
+        volume = signal.volume_24h or 0
+        position_size = signal.recommended_quantity
+        status = market.get("status", "unknown")
+
+        # 1. Minimum liquidity check
+        if liquidity < min_liquidity:
+            warnings.append(
+                f"Low liquidity: {liquidity:.2f} < {min_liquidity:.2f}"
+            )
+            passed = False
+
+        # 2. Minimum volume check
+        if volume < min_volume_24h:
+            warnings.append(
+                f"Low 24h volume: {volume:.2f} < {min_volume_24h:.2f}"
+            )
+            passed = False
+
+        # 3. Maximum position size enforcement
+        if position_size > max_position_size:
             warnings.append(
-                f"Wide spread detected: {spread_indicator:.1%} deviation from fair pricing"
+                f"Position too large: {position_size} > {max_position_size} (will be capped)"
+            )
+            # Don't fail, just warn - will be capped during sizing
+
+        # 4. Market status check
+        if status not in allowed_status_set:
+            warnings.append(
+                f"Market status '{status}' not in allowed list: {risk_config.allowed_statuses}"
             )
             passed = False
 
-    return passed, warnings
+        # 5. Spread check (if we have price data)
+        # Calculate spread from recommended price assumptions
+        yes_prob = signal.market_yes_prob
+        no_prob = signal.market_no_prob
+        if yes_prob > 0 and no_prob > 0:
+            # Estimate spread based on YES/NO price consistency
+            # For a fair market: yes_price + no_price ≈ 1.0
+            # Large deviation suggests wide spread
+            spread_indicator = abs(yes_prob + no_prob - 1.0)
+
+            if spread_indicator > max_spread:
+                warnings.append(
+                    f"Wide spread detected: {spread_indicator:.1%} deviation from fair pricing"
+                )
+                passed = False
+
+        return passed, warnings
+
+    return check
+
+
+class PositionExposureIndex:
+    """Contract exposure per market and in total, aggregated once.
+
+    Build it from the open positions at the start of a scan and pass it to
+    check_position_limits for every candidate trade; record accepted
+    trades with add() so later checks see them.
+    """
+
+    def __init__(self, positions: Iterable[Dict[str, Any]] = ()):
+        """Aggregate positions in one pass.
+
+        Args:
+            positions: Position dictionaries with market_id and quantity
+        """
+        self.market_totals: Dict[str, int] = {}
+        self.total = 0
+        for pos in positions:
+            self.add(pos.get("market_id"), pos.get("quantity", 0))
+
+    def add(self, market_id: str, quantity: int) -> None:
+        """Record quantity more contracts of exposure in a market."""
+        self.market_totals[market_id] = self.market_totals.get(market_id, 0) + quantity
+        self.total += quantity
 
 
 def check_position_limits(
     market_id: str,
     new_quantity: int,
-    existing_positions: List[Dict[str, Any]],
+    existing_positions: Union[PositionExposureIndex, List[Dict[str, Any]]],
     max_per_market: int = 200,
     max_total_exposure: int = 1000,
 ) -> Tuple[bool, str]:
@@ -98,22 +168,20 @@ def check_position_limits(
     Args:
         market_id: Market identifier
         new_quantity: Proposed new position quantity
-        existing_positions: List of existing positions across all markets
+        existing_positions: Exposure index of the existing positions (or the
+            list of positions across all markets, aggregated on each call)
         max_per_market: Maximum contracts per market (default: 200)
         max_total_exposure: Maximum total contracts across all markets (default: 1000)
 
     Returns:
         Tuple of (allowed: bool, message: str)
     """
-    # Calculate current exposure in this market
-    current_market_exposure = sum(
-        pos.get("quantity", 0)
-        for pos in existing_positions
-        if pos.get("market_id") == market_id
-    )
+    if not isinstance(existing_positions, PositionExposureIndex):
+        existing_positions = PositionExposureIndex(existing_positions)
 
-    # Calculate total exposure across all markets
-    total_exposure = sum(pos.get("quantity", 0) for pos in existing_positions)
+    # Current exposure in this market and across all markets
+    current_market_exposure = existing_positions.market_totals.get(market_id, 0)
+    total_exposure = existing_positions.total
 
     # Check market-specific limit
     new_market_exposure = current_market_exposure + new_quantity
@@ -160,6 +228,7 @@ def check_daily_trade_limit(
 def validate_market_health(
     market: Dict[str, Any],
     min_open_interest: int = 100,
+    now: Optional[datetime] = None,
 ) -> Tuple[bool, List[str]]:
     """
     Validate overall market health for trading.
@@ -167,6 +236,8 @@ def validate_market_health(
     Args:
         market: Market data dictionary
         min_open_interest: Minimum open interest required (default: 100)
+        now: Current time to measure expiry against. Pass one value when
+            validating many markets; if None, uses datetime.now().
 
     Returns:
         Tuple of (healthy: bool, issues: List[str])
@@ -185,14 +256,13 @@ def validate_market_health(
     # Check if market is close to expiry (within 1 day)
     close_time = market.get("close_time")
     if close_time:
-        from datetime import datetime, timedelta
         try:
             if isinstance(close_time, str):
                 close_dt = datetime.fromisoformat(close_time.replace('+00:00', ''))
             else:
                 close_dt = close_time
 
-            time_to_close = close_dt - datetime.now()
+            time_to_close = close_dt - (now or datetime.now())
             if time_to_close < timedelta(days=1):
                 issues.append(
                     f"Market closes soon: {time_to_close.total_seconds() / 3600:.1f} hours"
@@ -2,8 +2,10 @@
 Signal generation logic for trading strategy.
 """
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 from openbet.analysis.analyzer import Analyzer
 from openbet.kalshi.client import KalshiClient
@@ -11,6 +13,18 @@ from openbet.trading.models import TradingSignal, RiskConfig
 from openbet.trading.sizing import calculate_position_size, calculate_expected_profit
 from openbet.trading.risk import apply_risk_filters
 from openbet.database.repositories import TradingSignalRepository
+from openbet.utils.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# Kalshi market fetches run in parallel while scanning several markets;
+# the client's rate limiter and retrying adapter are shared by the threads.
+MARKET_FETCH_WORKERS = 10
+
+# Market snapshots (market + top of book) are shared by the entry and exit
+# checks of one trading tick; the TTL bounds how stale their prices get.
+SNAPSHOT_CACHE_SIZE = 512
+SNAPSHOT_CACHE_TTL = 2.0
 
 
 class SignalGenerator:
@@ -26,6 +40,9 @@ class SignalGenerator:
         self.analyzer = analyzer or Analyzer()
         self.kalshi_client = kalshi_client or KalshiClient()
         self.signal_repo = signal_repo or TradingSignalRepository()
+        self._snapshot_cache = TTLCache(
+            maxsize=SNAPSHOT_CACHE_SIZE, ttl=SNAPSHOT_CACHE_TTL
+        )
 
     def generate_entry_signal(
         self,
@@ -38,13 +55,16 @@ class SignalGenerator:
         risk_config: Optional[RiskConfig] = None,
         force_analysis: bool = False,
         cache_hours: int = 24,
+        analysis_result: Optional[Dict[str, Any]] = None,
+        market_snapshot: Optional[Tuple[Any, Optional[float], Optional[float]]] = None,
+        store: bool = True,
     ) -> Optional[TradingSignal]:
         """
         Generate entry signal by comparing consensus vs market probabilities.
 
         Algorithm:
         1. Get or generate fresh AI consensus (use cached if fresh)
-        2. Fetch current market orderbook
+        2. Fetch current market prices (top of book)
         3. Calculate divergences for YES and NO
         4. If max(divergence_yes, divergence_no) >= threshold:
            - Select side with larger divergence
@@ -63,6 +83,12 @@ class SignalGenerator:
             risk_config: Risk management configuration
             force_analysis: Force fresh analysis (skip cache)
             cache_hours: Cache validity period (default: 24)
+            analysis_result: Already computed analysis of the market; if
+                None, the analyzer is asked for one
+            market_snapshot: Already fetched (market, yes_price, no_price);
+                if None, they are fetched from Kalshi
+            store: Store the signal in the database; if False, the caller
+                stores it (signal_id stays None)
 
         Returns:
             TradingSignal if opportunity found, None otherwise
@@ -70,12 +96,13 @@ class SignalGenerator:
         risk_config = risk_config or RiskConfig()
 
         # Step 1: Get AI consensus
-        analysis_result = self.analyzer.analyze_market(
-            market_id=market_id,
-            option=option,
-            force=force_analysis,
-            cache_hours=cache_hours,
-        )
+        if analysis_result is None:
+            analysis_result = self.analyzer.analyze_market(
+                market_id=market_id,
+                option=option,
+                force=force_analysis,
+                cache_hours=cache_hours,
+            )
 
         if not analysis_result or "error" in analysis_result:
             return None
@@ -85,15 +112,16 @@ class SignalGenerator:
         analysis_id = analysis_result.get("analysis_id")
 
         # Step 2: Fetch current market prices
-        try:
-            market = self.kalshi_client.get_market(market_id)
-            orderbook = self.kalshi_client.get_orderbook(market_id)
-        except Exception as e:
-            print(f"Error fetching market data: {e}")
-            return None
+        if market_snapshot is None:
+            try:
+                market_snapshot = self._fetch_market_snapshot(market_id)
+            except Exception:
+                logger.exception("Error fetching market data for %s", market_id)
+                return None
+        market, yes_price, no_price = market_snapshot
 
-        market_yes_prob = orderbook.yes_mid_price or 0.0
-        market_no_prob = orderbook.no_mid_price or 0.0
+        market_yes_prob = yes_price or 0.0
+        market_no_prob = no_price or 0.0
 
         # Step 3: Calculate divergences
         divergence_yes = abs(consensus_yes - market_yes_prob)
@@ -184,38 +212,228 @@ class SignalGenerator:
         signal.risk_warnings = warnings
 
         # Store signal in database
-        signal_id = self.signal_repo.create(
-            market_id=signal.market_id,
-            option=signal.option,
-            signal_type=signal.signal_type,
-            consensus_yes_prob=signal.consensus_yes_prob,
-            consensus_no_prob=signal.consensus_no_prob,
-            market_yes_prob=signal.market_yes_prob,
-            market_no_prob=signal.market_no_prob,
-            divergence_yes=signal.divergence_yes,
-            divergence_no=signal.divergence_no,
-            selected_side=signal.selected_side,
-            divergence_magnitude=signal.divergence_magnitude,
-            recommended_action=signal.recommended_action,
-            recommended_quantity=signal.recommended_quantity,
-            recommended_price=signal.recommended_price,
-            expected_profit=signal.expected_profit,
-            volume_24h=signal.volume_24h,
-            liquidity_depth=signal.liquidity_depth,
-            open_interest=signal.open_interest,
-            analysis_id=signal.analysis_id,
-            metadata={"risk_warnings": warnings, "passed_filters": passed},
+        if store:
+            signal.signal_id = self.signal_repo.insert(
+                _signal_row(signal, _risk_metadata(signal))
+            )
+
+        return signal
+
+    def generate_entry_signals(
+        self,
+        market_ids: List[str],
+        option: str = "yes",
+        min_divergence_threshold: float = 0.05,
+        base_position: int = 10,
+        max_position: int = 100,
+        scaling_factor: float = 1.5,
+        risk_config: Optional[RiskConfig] = None,
+        force_analysis: bool = False,
+        cache_hours: int = 24,
+    ) -> Dict[str, Optional[TradingSignal]]:
+        """
+        Generate entry signals for several markets.
+
+        The AI consensus of every market is obtained up front in a single
+        concurrent pass (see Analyzer.analyze_markets). Current market data
+        is then fetched for all analyzed markets in parallel, after the
+        analyses so that prices are as fresh as in generate_entry_signal,
+        and each market's signal is generated from both.
+
+        Args:
+            market_ids: Market ticker IDs
+            option: Option to analyze (default: "yes")
+            min_divergence_threshold: Minimum divergence to trigger signal (default: 0.05 = 5%)
+            base_position: Base position size for minimum divergence (default: 10)
+            max_position: Maximum position cap (default: 100)
+            scaling_factor: Position sizing aggressiveness (default: 1.5)
+            risk_config: Risk management configuration
+            force_analysis: Force fresh analysis (skip cache)
+            cache_hours: Cache validity period (default: 24)
+
+        Returns:
+            Dictionary mapping market ID to its TradingSignal, or None if
+            no opportunity was found or signal generation failed
+        """
+        analyses = self.analyzer.analyze_markets(
+            market_ids,
+            option=option,
+            force=force_analysis,
+            cache_hours=cache_hours,
         )
 
-        signal.signal_id = signal_id
+        analyzed = [
+            market_id for market_id, analysis_result in analyses.items()
+            if analysis_result and "error" not in analysis_result
+        ]
+        snapshots = self._fetch_market_snapshots(analyzed)
+
+        signals: Dict[str, Optional[TradingSignal]] = {}
+        for market_id, analysis_result in analyses.items():
+            snapshot = snapshots.get(market_id)
+            if isinstance(snapshot, Exception):
+                logger.error(
+                    "Error fetching market data for %s", market_id, exc_info=snapshot
+                )
+                signals[market_id] = None
+                continue
+
+            try:
+                signals[market_id] = self.generate_entry_signal(
+                    market_id=market_id,
+                    option=option,
+                    min_divergence_threshold=min_divergence_threshold,
+                    base_position=base_position,
+                    max_position=max_position,
+                    scaling_factor=scaling_factor,
+                    risk_config=risk_config,
+                    analysis_result=analysis_result,
+                    market_snapshot=snapshot,
+                    store=False,
+                )
+            except Exception:
+                logger.exception("Error generating signal for market %s", market_id)
+                signals[market_id] = None
+
+        # Store all new signals with one bulk insert
+        generated = [signal for signal in signals.values() if signal is not None]
+        signal_ids = self.signal_repo.bulk_create(
+            [_signal_row(signal, _risk_metadata(signal)) for signal in generated]
+        )
+        for signal, signal_id in zip(generated, signal_ids):
+            signal.signal_id = signal_id
 
-        return signal
+        return signals
+
+    def generate_exit_signals(
+        self,
+        positions: List[Dict[str, Any]],
+        convergence_threshold: float = 0.01,
+        force_analysis: bool = False,
+    ) -> List[TradingSignal]:
+        """
+        Generate exit signals for several open positions.
+
+        As in generate_entry_signals, the consensus of every position's
+        market is obtained in one concurrent pass per option and market
+        data is fetched in parallel; each position is then checked as in
+        generate_exit_signal.
+
+        Args:
+            positions: Position dictionaries from database
+            convergence_threshold: Maximum divergence for exit (default: 0.01 = 1%)
+            force_analysis: Force fresh analysis
+
+        Returns:
+            Exit signals of the positions whose price converged
+        """
+        open_positions = [
+            position for position in positions
+            if position.get("market_id") and position.get("quantity", 0) != 0
+        ]
+
+        # Markets to analyze, grouped by the option held
+        market_ids_by_option: Dict[str, List[str]] = {}
+        for position in open_positions:
+            market_ids_by_option.setdefault(position.get("option", "yes"), []).append(
+                position["market_id"]
+            )
+
+        analyses: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        for option, market_ids in market_ids_by_option.items():
+            results = self.analyzer.analyze_markets(
+                market_ids, option=option, force=force_analysis
+            )
+            for market_id, analysis_result in results.items():
+                analyses[(market_id, option)] = analysis_result
+
+        snapshots = self._fetch_market_snapshots(
+            list(dict.fromkeys(
+                market_id for (market_id, _), analysis_result in analyses.items()
+                if analysis_result and "error" not in analysis_result
+            ))
+        )
+
+        exit_signals = []
+        for position in open_positions:
+            market_id = position["market_id"]
+            snapshot = snapshots.get(market_id)
+            if isinstance(snapshot, Exception):
+                logger.error(
+                    "Error fetching market data for %s", market_id, exc_info=snapshot
+                )
+                continue
+
+            try:
+                signal = self.generate_exit_signal(
+                    position=position,
+                    convergence_threshold=convergence_threshold,
+                    analysis_result=analyses.get(
+                        (market_id, position.get("option", "yes"))
+                    ),
+                    market_snapshot=snapshot,
+                )
+            except Exception:
+                logger.exception("Error checking exit for position %s", position.get("id"))
+                continue
+
+            if signal:
+                exit_signals.append(signal)
+
+        return exit_signals
+
+    def _fetch_market_snapshot(
+        self, market_id: str
+    ) -> Tuple[Any, Optional[float], Optional[float]]:
+        """Fetch a market and its top-of-book YES/NO prices (briefly cached)."""
+        snapshot = self._snapshot_cache.get(market_id)
+        if snapshot is None:
+            market = self.kalshi_client.get_market(market_id)
+            yes_price, no_price = self.kalshi_client.get_top_of_book(market_id)
+            snapshot = (market, yes_price, no_price)
+            self._snapshot_cache.set(market_id, snapshot)
+        return snapshot
+
+    def clear_market_cache(self) -> None:
+        """Forget cached market snapshots, e.g. at the start of a scan."""
+        self._snapshot_cache.clear()
+
+    def _fetch_market_snapshots(self, market_ids: List[str]) -> Dict[str, Any]:
+        """Fetch market snapshots for several markets in parallel.
+
+        Args:
+            market_ids: Market ticker IDs
+
+        Returns:
+            Dictionary mapping market ID to its (market, yes_price, no_price)
+            snapshot, or to the exception raised while fetching it
+        """
+        if not market_ids:
+            return {}
+
+        snapshots: Dict[str, Any] = {}
+        with ThreadPoolExecutor(
+            max_workers=min(MARKET_FETCH_WORKERS, len(market_ids)),
+            thread_name_prefix="openbet-markets",
+        ) as pool:
+            futures = {
+                market_id: pool.submit(self._fetch_market_snapshot, market_id)
+                for market_id in market_ids
+            }
+            for market_id, future in futures.items():
+                try:
+                    snapshots[market_id] = future.result()
+                except Exception as e:
+                    snapshots[market_id] = e
+        return snapshots
 
     def generate_exit_signal(
         self,
         position: Dict[str, Any],
         convergence_threshold: float = 0.01,
         force_analysis: bool = False,
+        analysis_result: Optional[Dict[str, Any]] = None,
+        market_snapshot: Optional[Tuple[Any, Optional[float], Optional[float]]] = None,
     ) -> Optional[TradingSignal]:
         """
         Generate exit signal for open position when price converges to consensus.
@@ -233,6 +451,10 @@ class SignalGenerator:
             position: Position dictionary from database
             convergence_threshold: Maximum divergence for exit (default: 0.01 = 1%)
             force_analysis: Force fresh analysis
+            analysis_result: Already computed analysis of the position's
+                market; if None, the analyzer is asked for one
+            market_snapshot: Already fetched (market, yes_price, no_price);
+                if None, they are fetched from Kalshi
 
         Returns:
             TradingSignal for exit if converged, None otherwise
@@ -247,11 +469,12 @@ class SignalGenerator:
             return None
 
         # Get current consensus
-        analysis_result = self.analyzer.analyze_market(
-            market_id=market_id,
-            option=option,
-            force=force_analysis,
-        )
+        if analysis_result is None:
+            analysis_result = self.analyzer.analyze_market(
+                market_id=market_id,
+                option=option,
+                force=force_analysis,
+            )
 
         if not analysis_result or "error" in analysis_result:
             return None
@@ -261,15 +484,16 @@ class SignalGenerator:
         analysis_id = analysis_result.get("analysis_id")
 
         # Get current market price
-        try:
-            orderbook = self.kalshi_client.get_orderbook(market_id)
-            market = self.kalshi_client.get_market(market_id)
-        except Exception as e:
-            print(f"Error fetching market data: {e}")
-            return None
+        if market_snapshot is None:
+            try:
+                market_snapshot = self._fetch_market_snapshot(market_id)
+            except Exception:
+                logger.exception("Error fetching market data for %s", market_id)
+                return None
+        market, yes_price, no_price = market_snapshot
 
-        market_yes_prob = orderbook.yes_mid_price or 0.0
-        market_no_prob = orderbook.no_mid_price or 0.0
+        market_yes_prob = yes_price or 0.0
+        market_no_prob = no_price or 0.0
 
         # Determine current price and consensus for the held side
         if side.lower() == "yes":
@@ -319,26 +543,52 @@ class SignalGenerator:
         )
 
         # Store signal in database
-        signal_id = self.signal_repo.create(
-            market_id=signal.market_id,
-            option=signal.option,
-            signal_type=signal.signal_type,
-            consensus_yes_prob=signal.consensus_yes_prob,
-            consensus_no_prob=signal.consensus_no_prob,
-            market_yes_prob=signal.market_yes_prob,
-            market_no_prob=signal.market_no_prob,
-            divergence_yes=signal.divergence_yes,
-            divergence_no=signal.divergence_no,
-            selected_side=signal.selected_side,
-            divergence_magnitude=signal.divergence_magnitude,
-            recommended_action=signal.recommended_action,
-            recommended_quantity=signal.recommended_quantity,
-            recommended_price=signal.recommended_price,
-            expected_profit=signal.expected_profit,
-            analysis_id=signal.analysis_id,
-            metadata={"entry_price": entry_price, "position_id": position.get("id")},
+        signal.signal_id = self.signal_repo.insert(
+            _signal_row(
+                signal, {"entry_price": entry_price, "position_id": position.get("id")}
+            )
         )
 
-        signal.signal_id = signal_id
-
         return signal
+
+
+def _signal_row(signal: TradingSignal, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the repository row of a signal.
+
+    Args:
+        signal: Evaluated trading signal
+        metadata: Signal-type specific details stored with it
+
+    Returns:
+        Dict keyed like TradingSignalRepository.create arguments
+    """
+    return {
+        "market_id": signal.market_id,
+        "option": signal.option,
+        "signal_type": signal.signal_type,
+        "consensus_yes_prob": signal.consensus_yes_prob,
+        "consensus_no_prob": signal.consensus_no_prob,
+        "market_yes_prob": signal.market_yes_prob,
+        "market_no_prob": signal.market_no_prob,
+        "divergence_yes": signal.divergence_yes,
+        "divergence_no": signal.divergence_no,
+        "selected_side": signal.selected_side,
+        "divergence_magnitude": signal.divergence_magnitude,
+        "recommended_action": signal.recommended_action,
+        "recommended_quantity": signal.recommended_quantity,
+        "recommended_price": signal.recommended_price,
+        "expected_profit": signal.expected_profit,
+        "volume_24h": signal.volume_24h,
+        "liquidity_depth": signal.liquidity_depth,
+        "open_interest": signal.open_interest,
+        "analysis_id": signal.analysis_id,
+        "metadata": metadata,
+    }
+
+
+def _risk_metadata(signal: TradingSignal) -> Dict[str, Any]:
+    """Metadata stored with an entry signal: its risk filter outcome."""
+    return {
+        "risk_warnings": signal.risk_warnings,
+        "passed_filters": signal.passed_filters,
+    }
@@ -2,6 +2,9 @@
 Position sizing calculations for trading strategy.
 """
 
+# Divergence that maps to base_amount contracts
+REFERENCE_DIVERGENCE = 0.05
+
 
 def calculate_position_size(
     divergence: float,
@@ -40,8 +43,12 @@ def calculate_position_size(
 
     # Calculate raw position based on divergence
     # Reference divergence is 5% (0.05) which maps to base_amount
-    ratio = divergence / 0.05
-    raw_position = base_amount * (ratio ** scaling_factor)
+    ratio = divergence / REFERENCE_DIVERGENCE
+    if scaling_factor == 1.0:
+        # Linear sizing needs no pow
+        raw_position = base_amount * ratio
+    else:
+        raw_position = base_amount * (ratio ** scaling_factor)
 
     # Round to nearest integer and cap at maximum
     position = min(int(round(raw_position)), max_position)
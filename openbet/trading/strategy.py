@@ -2,7 +2,9 @@
 Main trading strategy orchestrator.
 """
 
+import logging
 from datetime import datetime
+from operator import attrgetter
 from typing import List, Optional, Dict, Any
 
 from openbet.analysis.analyzer import Analyzer
@@ -16,6 +18,8 @@ from openbet.database.repositories import (
 from openbet.trading.models import TradingSignal, TradeDecision, RiskConfig
 from openbet.trading.signals import SignalGenerator
 
+logger = logging.getLogger(__name__)
+
 
 class TradingStrategy:
     """Main orchestrator for trading strategy execution."""
@@ -86,40 +90,34 @@ class TradingStrategy:
         """
         opportunities = []
 
-        # Get markets to scan
+        # Start the tick with fresh prices; exit checks that follow reuse them
+        self.signal_generator.clear_market_cache()
+
+        # Get markets to scan; only their tickers are needed
         if market_ids:
-            markets = [self.market_repo.get(mid) for mid in market_ids]
-            markets = [m for m in markets if m is not None]
+            existing = self.market_repo.existing_ids(market_ids)
+            market_ids = [mid for mid in market_ids if mid in existing]
         else:
-            markets = self.market_repo.get_all()
-
-        # Generate signals for each market
-        for market in markets:
-            market_id = market.get("id")
-            if not market_id:
-                continue
-
-            try:
-                signal = self.signal_generator.generate_entry_signal(
-                    market_id=market_id,
-                    option="yes",  # Can be parameterized
-                    min_divergence_threshold=self.entry_threshold,
-                    base_position=self.base_position_size,
-                    max_position=self.max_position_size,
-                    scaling_factor=self.scaling_factor,
-                    risk_config=self.risk_config,
-                    force_analysis=force_analysis,
-                )
-
-                if signal and signal.passed_filters:
-                    opportunities.append(signal)
+            market_ids = self.market_repo.get_all_ids()
+
+        # Generate signals for all markets, analyzing them concurrently
+        signals = self.signal_generator.generate_entry_signals(
+            market_ids=[mid for mid in market_ids if mid],
+            option="yes",  # Can be parameterized
+            min_divergence_threshold=self.entry_threshold,
+            base_position=self.base_position_size,
+            max_position=self.max_position_size,
+            scaling_factor=self.scaling_factor,
+            risk_config=self.risk_config,
+            force_analysis=force_analysis,
+        )
 
-            except Exception as e:
-                print(f"Error scanning market {market_id}: {e}")
-                continue
+        for signal in signals.values():
+            if signal and signal.passed_filters:
+                opportunities.append(signal)
 
         # Sort by divergence magnitude (highest first)
-        opportunities.sort(key=lambda s: s.divergence_magnitude, reverse=True)
+        opportunities.sort(key=attrgetter("divergence_magnitude"), reverse=True)
 
         return opportunities
 
@@ -141,35 +139,15 @@ class TradingStrategy:
         Returns:
             List of TradingSignal objects for positions ready to exit
         """
-        exit_signals = []
-
-        # Get all markets with positions
-        markets = self.market_repo.get_all()
-
-        for market in markets:
-            market_id = market.get("id")
-            if not market_id:
-                continue
-
-            # Get positions for this market
-            positions = self.position_repo.get_by_market(market_id)
-
-            for position in positions:
-                try:
-                    signal = self.signal_generator.generate_exit_signal(
-                        position=position,
-                        convergence_threshold=self.exit_threshold,
-                        force_analysis=force_analysis,
-                    )
-
-                    if signal:
-                        exit_signals.append(signal)
-
-                except Exception as e:
-                    print(f"Error checking exit for position {position.get('id')}: {e}")
-                    continue
-
-        return exit_signals
+        # Get all open positions in one query
+        positions = self.position_repo.get_open_positions()
+
+        # Check all positions, analyzing their markets concurrently
+        return self.signal_generator.generate_exit_signals(
+            positions,
+            convergence_threshold=self.exit_threshold,
+            force_analysis=force_analysis,
+        )
 
     def execute_signal(
         self,
@@ -202,7 +180,22 @@ class TradingStrategy:
         Returns:
             TradeDecision with execution results
         """
-        decision = "approved" if user_approved else "rejected"
+        if not user_approved:
+            # User rejected - just record decision
+            decision_id = self.decision_repo.create(
+                signal_id=signal.signal_id,
+                decision="rejected",
+                user_notes=user_notes,
+                executed=False,
+            )
+            return TradeDecision(
+                decision_id=decision_id,
+                signal_id=signal.signal_id,
+                decision="rejected",
+                user_notes=user_notes,
+            )
+
+        decision = "approved"
         quantity = custom_quantity or signal.recommended_quantity
         price = custom_price or signal.recommended_price
 
@@ -212,19 +205,10 @@ class TradingStrategy:
             user_notes=user_notes,
         )
 
-        if not user_approved:
-            # User rejected - just record decision
-            decision_id = self.decision_repo.create(
-                signal_id=signal.signal_id,
-                decision=decision,
-                user_notes=user_notes,
-                executed=False,
-            )
-            trade_decision.decision_id = decision_id
-            return trade_decision
-
         # User approved - execute the trade
         try:
+            position_update = None
+
             if signal.signal_type == "entry":
                 # Place entry order
                 action = "buy"
@@ -239,22 +223,23 @@ class TradingStrategy:
                     yes_price=price if side == "yes" else None,
                     no_price=price if side == "no" else None,
                 )
+                order_id = getattr(order, "order_id", None)
 
-                # Update position in database
-                self.position_repo.create_or_update(
+                # Position to store in database
+                position_update = dict(
                     market_id=signal.market_id,
                     option=signal.option,
                     side=side,
                     quantity=quantity,
                     avg_price=price,
-                    metadata={"order_id": order.order_id if hasattr(order, 'order_id') else None},
+                    metadata={"order_id": order_id},
                 )
 
                 # Record successful execution
                 execution_cost = quantity * price
                 trade_decision.executed = True
                 trade_decision.execution_timestamp = datetime.now()
-                trade_decision.order_id = order.order_id if hasattr(order, 'order_id') else None
+                trade_decision.order_id = order_id
                 trade_decision.actual_quantity = quantity
                 trade_decision.actual_price = price
                 trade_decision.execution_cost = execution_cost
@@ -273,45 +258,54 @@ class TradingStrategy:
                     yes_price=price if side == "yes" else None,
                     no_price=price if side == "no" else None,
                 )
+                order_id = getattr(order, "order_id", None)
 
                 # Update position (reduce or close)
                 # For now, we'll close the position entirely
                 # In production, you'd handle partial exits
-                self.position_repo.create_or_update(
+                position_update = dict(
                     market_id=signal.market_id,
                     option=signal.option,
                     side=side,
                     quantity=0,  # Close position
                     avg_price=0.0,
-                    metadata={"exit_order_id": order.order_id if hasattr(order, 'order_id') else None},
+                    metadata={"exit_order_id": order_id},
                 )
 
                 # Record successful execution with P&L
                 trade_decision.executed = True
                 trade_decision.execution_timestamp = datetime.now()
-                trade_decision.order_id = order.order_id if hasattr(order, 'order_id') else None
+                trade_decision.order_id = order_id
                 trade_decision.actual_quantity = quantity
                 trade_decision.actual_price = price
                 trade_decision.realized_pnl = signal.expected_profit
 
-            # Save decision to database
-            decision_id = self.decision_repo.create(
-                signal_id=signal.signal_id,
-                decision=decision,
-                user_notes=user_notes,
-                executed=trade_decision.executed,
-                execution_timestamp=trade_decision.execution_timestamp.isoformat() if trade_decision.execution_timestamp else None,
-                order_id=trade_decision.order_id,
-                actual_quantity=trade_decision.actual_quantity,
-                actual_price=trade_decision.actual_price,
-                execution_cost=trade_decision.execution_cost,
-                realized_pnl=trade_decision.realized_pnl,
-            )
+            # Save position and decision to database in one transaction,
+            # after the order so the writer isn't held during the API call
+            with self.decision_repo.db.transaction():
+                if position_update is not None:
+                    position = self.position_repo.create_or_update(**position_update)
+                    if signal.signal_type == "entry":
+                        trade_decision.position_id = position["id"]
+
+                decision_id = self.decision_repo.create(
+                    signal_id=signal.signal_id,
+                    decision=decision,
+                    user_notes=user_notes,
+                    executed=trade_decision.executed,
+                    execution_timestamp=trade_decision.execution_timestamp.isoformat() if trade_decision.execution_timestamp else None,
+                    order_id=trade_decision.order_id,
+                    actual_quantity=trade_decision.actual_quantity,
+                    actual_price=trade_decision.actual_price,
+                    execution_cost=trade_decision.execution_cost,
+                    position_id=trade_decision.position_id,
+                    realized_pnl=trade_decision.realized_pnl,
+                )
 
             trade_decision.decision_id = decision_id
 
         except Exception as e:
-            print(f"Error executing trade: {e}")
+            logger.exception("Error executing trade for signal %s", signal.signal_id)
             # Record failed execution
             trade_decision.executed = False
             trade_decision.user_notes = f"Execution failed: {str(e)}"
@@ -370,22 +364,17 @@ class TradingStrategy:
         Returns:
             Dictionary with performance metrics
         """
-        # Get all decisions
-        all_decisions = self.decision_repo.get_execution_history(limit=1000)
-
-        total_signals = len(self.signal_repo.get_recent(limit=1000))
-        total_decisions = len(all_decisions)
-        approved = len([d for d in all_decisions if d.get("decision") == "approved"])
-        executed = len([d for d in all_decisions if d.get("executed")])
-
-        # Calculate P&L for executed exits
-        exits = [
-            d for d in all_decisions
-            if d.get("executed") and d.get("realized_pnl") is not None
-        ]
-        total_pnl = sum(d.get("realized_pnl", 0.0) for d in exits)
-        wins = len([d for d in exits if d.get("realized_pnl", 0.0) > 0])
-        losses = len([d for d in exits if d.get("realized_pnl", 0.0) < 0])
+        # Count decisions and P&L of executed exits in the database
+        aggregates = self.decision_repo.get_performance_aggregates(limit=1000)
+
+        total_signals = len(self.signal_repo.get_recent_rows(limit=1000))
+        total_decisions = aggregates["total_decisions"]
+        approved = aggregates["approved"]
+        executed = aggregates["executed"]
+        total_trades = aggregates["total_trades"]
+        wins = aggregates["wins"]
+        losses = aggregates["losses"]
+        total_pnl = aggregates["total_pnl"]
 
         return {
             "total_signals": total_signals,
@@ -395,10 +384,10 @@ class TradingStrategy:
             "approval_rate": approved / total_decisions if total_decisions > 0 else 0,
             "executed": executed,
             "execution_rate": executed / approved if approved > 0 else 0,
-            "total_trades": len(exits),
+            "total_trades": total_trades,
             "wins": wins,
             "losses": losses,
-            "win_rate": wins / len(exits) if exits else 0,
+            "win_rate": wins / total_trades if total_trades else 0,
             "total_pnl": total_pnl,
-            "avg_pnl_per_trade": total_pnl / len(exits) if exits else 0,
+            "avg_pnl_per_trade": total_pnl / total_trades if total_trades else 0,
         }
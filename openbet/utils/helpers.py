@@ -1,15 +1,24 @@
 """Helper utilities for Openbet."""
 
+import logging
+import random
 import time
 from functools import wraps
 from typing import Any, Callable, Optional
 
+logger = logging.getLogger(__name__)
+
+SIDES = frozenset(("yes", "no"))
+ACTIONS = frozenset(("buy", "sell"))
+
 
 def retry_on_exception(
     max_retries: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: tuple = (Exception,),
+    jitter: float = 0.2,
+    abort_on: Optional[Callable[[Exception], bool]] = None,
 ):
     """Decorator to retry function on exception.
 
@@ -18,6 +27,10 @@ def retry_on_exception(
         delay: Initial delay between retries in seconds
         backoff: Backoff multiplier for delay
         exceptions: Tuple of exceptions to catch
+        jitter: Relative random spread of each delay (0.2 = +/-20%), so
+            concurrent callers don't retry in lockstep
+        abort_on: Optional predicate; a caught exception for which it
+            returns True is re-raised at once instead of retried
 
     Returns:
         Decorated function
@@ -26,26 +39,25 @@ def retry_on_exception(
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            current_delay = delay
-            last_exception = None
-
             for attempt in range(max_retries + 1):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-
-                    if attempt < max_retries:
-                        print(
-                            f"Attempt {attempt + 1}/{max_retries + 1} failed: {e}. "
-                            f"Retrying in {current_delay}s..."
-                        )
-                        time.sleep(current_delay)
-                        current_delay *= backoff
-                    else:
-                        print(f"All {max_retries + 1} attempts failed.")
-
-            raise last_exception
+                    if abort_on is not None and abort_on(e):
+                        raise
+
+                    if attempt == max_retries:
+                        logger.warning("All %d attempts failed.", max_retries + 1)
+                        raise
+
+                    sleep_s = delay * backoff ** attempt
+                    if jitter:
+                        sleep_s *= random.uniform(1 - jitter, 1 + jitter)
+                    logger.warning(
+                        "Attempt %d/%d failed: %s. Retrying in %.2fs...",
+                        attempt + 1, max_retries + 1, e, sleep_s,
+                    )
+                    time.sleep(sleep_s)
 
         return wrapper
 
@@ -92,8 +104,12 @@ def validate_side(side: str) -> str:
     Raises:
         ValueError: If side is invalid
     """
+    # Already-normalized input needs no lowercased copy
+    if side in SIDES:
+        return side
+
     side_lower = side.lower()
-    if side_lower not in ["yes", "no"]:
+    if side_lower not in SIDES:
         raise ValueError(f"Invalid side: {side}. Must be 'yes' or 'no'.")
     return side_lower
 
@@ -110,7 +126,10 @@ def validate_action(action: str) -> str:
     Raises:
         ValueError: If action is invalid
     """
+    if action in ACTIONS:
+        return action
+
     action_lower = action.lower()
-    if action_lower not in ["buy", "sell"]:
+    if action_lower not in ACTIONS:
         raise ValueError(f"Invalid action: {action}. Must be 'buy' or 'sell'.")
     return action_lower
@@ -1,13 +1,25 @@
 """Logging configuration for Openbet."""
 
+import atexit
 import logging
+import queue
 import sys
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
 from openbet.config import get_settings
 
+# Log file rotation: size of one file and number of old files kept.
+LOG_FILE_MAX_BYTES = 10_000_000
+LOG_FILE_BACKUP_COUNT = 5
 
+# Background listener writing each configured logger's records.
+_listeners: Dict[str, QueueListener] = {}
+
+
+@lru_cache(maxsize=8)
 def setup_logger(
     name: str = "openbet",
     log_file: Optional[str] = None,
@@ -15,6 +27,13 @@ def setup_logger(
 ) -> logging.Logger:
     """Setup and configure logger.
 
+    Results are cached per argument set, so calling it again returns the
+    configured logger instead of reopening its log file.
+
+    The logger only puts records on a queue; a background listener
+    thread formats them and writes them to the console and the rotating
+    log file, so logging calls don't wait on I/O.
+
     Args:
         name: Logger name
         log_file: Log file path. If None, uses config value.
@@ -34,6 +53,9 @@ def setup_logger(
 
     # Remove existing handlers to avoid duplicates
     logger.handlers.clear()
+    previous = _listeners.pop(name, None)
+    if previous is not None:
+        previous.stop()
 
     # Create formatter
     formatter = logging.Formatter(
@@ -45,20 +67,45 @@ def setup_logger(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        file_handler = logging.FileHandler(log_file)
+        file_handler = RotatingFileHandler(
+            log_file,
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT,
+        )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Hand records to the listener thread through an unbounded queue
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    logger.addHandler(QueueHandler(log_queue))
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
 
     return logger
 
 
-# Default logger instance
-logger = setup_logger()
+@atexit.register
+def _stop_listeners() -> None:
+    """Flush queued records and stop the listener threads at exit."""
+    while _listeners:
+        _listeners.popitem()[1].stop()
+
+
+def __getattr__(name: str) -> logging.Logger:
+    """Create the default ``logger`` instance on first access.
+
+    Importing this module therefore reads no settings and opens no log file.
+    """
+    if name == "logger":
+        return setup_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,49 @@
+"""Client-side rate limiting helpers."""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    ``acquire`` takes one token and only sleeps when the bucket is empty,
+    so calls spaced out by other work (or short bursts of up to
+    ``capacity`` calls) go through without waiting.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        """Initialize the bucket, starting full.
+
+        Args:
+            rate: Tokens added per second (sustained calls per second)
+            capacity: Maximum tokens stored (largest burst allowed)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+
+            # Take the token now, possibly going negative; the debt is what
+            # this caller sleeps off, so concurrent callers queue up in order.
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
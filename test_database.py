@@ -0,0 +1,122 @@
+"""Tests for the database layer: repository writes and the query cache.
+
+Run with: pytest test_database.py
+"""
+
+import json
+import sqlite3
+import threading
+
+import pytest
+
+pytest.importorskip("pydantic_settings")
+
+from openbet.database.db import Database  # noqa: E402
+from openbet.database.repositories import (  # noqa: E402
+    AnalysisRepository,
+    MarketRepository,
+    TradingSignalRepository,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    """A fresh database file with the schema applied."""
+    database = Database(str(tmp_path / "openbet.db"))
+    database.initialize_schema()
+    yield database
+    database.close()
+
+
+def _market(market_id):
+    return {"market_id": market_id, "title": f"Market {market_id}"}
+
+
+def test_create_many_skips_stored_markets(db):
+    """Existing or repeated tickers are skipped, not fatal to the batch."""
+    markets = MarketRepository(db)
+    markets.create(**_market("B"))
+
+    assert markets.create_many([_market("A"), _market("B"), _market("C"), _market("A")]) == 2
+    assert markets.existing_ids(["A", "B", "C"]) == {"A", "B", "C"}
+
+
+def test_create_rejects_stored_market(db):
+    """A single create still fails on a duplicate ticker."""
+    markets = MarketRepository(db)
+    markets.create(**_market("A"))
+    with pytest.raises(sqlite3.IntegrityError):
+        markets.create(**_market("A"))
+
+
+def test_compressed_responses_never_leak_as_bytes(db):
+    """Large responses stored compressed read back as JSON in every view."""
+    response = {"reasoning": "x" * 2048, "yes_confidence": 0.6}
+    analyses = AnalysisRepository(db)
+    analyses.create(market_id="M1", option="yes", claude_response=response)
+
+    row = analyses.get_latest_by_market("M1")
+    stored = json.loads(json.dumps(row))["claude_response"]
+    assert isinstance(stored, str) and json.loads(stored) == response
+    assert row["claude_response"] == response
+
+    # The sqlite3.Row variants stay raw
+    raw = analyses.get_history_by_market_rows("M1", columns=("claude_response",))
+    assert isinstance(raw[0]["claude_response"], bytes)
+
+
+def test_rolled_back_rows_are_not_served_from_cache(db):
+    """Rows read inside a rolled-back transaction are not cached."""
+    markets = MarketRepository(db)
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            markets.create(market_id="M1", title="Market 1")
+            assert markets.get("M1")["id"] == "M1"
+            raise RuntimeError("rollback")
+
+    assert not markets.exists("M1")
+    assert markets.get("M1") is None
+
+
+def test_commit_drops_rows_cached_by_other_threads(db):
+    """Lookups cached by another thread before the commit are dropped."""
+    markets = MarketRepository(db)
+    with db.transaction():
+        markets.create(market_id="M1", title="Market 1")
+        # Another thread still sees (and caches) the committed state
+        reader = threading.Thread(target=markets.get, args=("M1",))
+        reader.start()
+        reader.join()
+        assert db.query_cache.get(("market", "M1"), "missing") is None
+
+    assert markets.get("M1")["title"] == "Market 1"
+
+
+def test_rolled_back_signals_leave_recent_listing_unchanged(db):
+    """Listings cached before a rolled-back write are still served."""
+    signals = TradingSignalRepository(db)
+    assert signals.get_recent() == []
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            signals.insert(
+                {
+                    "market_id": "M1",
+                    "option": "yes",
+                    "signal_type": "entry",
+                    "consensus_yes_prob": 0.7,
+                    "consensus_no_prob": 0.3,
+                    "market_yes_prob": 0.5,
+                    "market_no_prob": 0.5,
+                    "divergence_yes": 0.2,
+                    "divergence_no": -0.2,
+                    "divergence_magnitude": 0.2,
+                    "recommended_action": "buy",
+                    "recommended_quantity": 10,
+                    "recommended_price": 0.5,
+                    "expected_profit": 2.0,
+                }
+            )
+            assert len(signals.get_recent()) == 1
+            raise RuntimeError("rollback")
+
+    assert signals.get_recent() == []
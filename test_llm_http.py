@@ -0,0 +1,68 @@
+"""Tests for the shared LLM HTTP client across event loops.
+
+Run with: pytest test_llm_http.py
+"""
+
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from openbet.llm import http  # noqa: E402
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Answers every GET with a small HTTP/1.1 keep-alive response."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    """Serve _KeepAliveHandler on a free local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+async def _get_status(url):
+    return (await http.get_http_client().get(url)).status_code
+
+
+def test_client_survives_consecutive_asyncio_runs(server_url):
+    """Pooled connections of an ended loop are not reused by the next one."""
+    assert [asyncio.run(_get_status(server_url)) for _ in range(3)] == [200, 200, 200]
+
+
+def test_run_closes_the_loop_pool(server_url):
+    """run() closes the pool it opened, and the client stays usable."""
+    assert [http.run(_get_status(server_url)) for _ in range(3)] == [200, 200, 200]
+    assert not http.get_http_client().is_closed
+    assert len(http._transport._pools) == 0
+
+
+def test_resize_keeps_client_and_applies_to_new_pools(server_url):
+    """A new pool size keeps the client, which providers have captured."""
+    client = http.get_http_client()
+    try:
+        assert http.get_http_client(max_connections=8) is client
+        assert http._transport.limits.max_connections == 8
+        assert asyncio.run(_get_status(server_url)) == 200
+    finally:
+        http.get_http_client(max_connections=http.LLM_MAX_CONNECTIONS)